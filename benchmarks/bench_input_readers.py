@@ -0,0 +1,60 @@
+"""Compare les lecteurs d'entrée text et mmap sur un gros document.
+
+Usage : python -m benchmarks.bench_input_readers [--size-mb 50] [--repeat 3]
+"""
+import argparse
+import json
+import logging
+import resource
+import tempfile
+import time
+from pathlib import Path
+from src.html_converter import HTMLConverter
+
+PARAGRAPH = "Texte brut recopié tel quel, sans balise de bloc, avec des accents éèà. " * 20 + "\n"
+SECTION = "<h2>Section</h2>\n<p>Un paragraphe avec <code>du code</code>.</p>\n" + PARAGRAPH * 10
+
+def generate_document(path: Path, size_mb: int) -> None:
+    target = size_mb * 1024 * 1024
+    with open(path, 'w', encoding='utf-8') as f:
+        written = 0
+        while written < target:
+            written += f.write(SECTION)
+
+def run(backend: str, input_path: Path, output_path: Path, repeat: int) -> dict:
+    converter = HTMLConverter(config_path='configs/config.yml')
+    converter.config['input'] = {'backend': backend}
+    converter.config['streaming']['threshold_bytes'] = 1
+    converter.input_reader = converter._setup_input_reader()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        converter.convert_stream(str(input_path), str(output_path))
+        timings.append(time.perf_counter() - start)
+    return {'backend': backend, 'best_seconds': min(timings), 'timings': timings}
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size-mb', type=int, default=50)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        input_path = Path(tmp) / 'input.html'
+        generate_document(input_path, args.size_mb)
+        results = [
+            run(backend, input_path, Path(tmp) / f'{backend}.html', args.repeat)
+            for backend in ('text', 'mmap')
+        ]
+        identical = (Path(tmp) / 'text.html').read_bytes() == (Path(tmp) / 'mmap.html').read_bytes()
+
+    print(json.dumps({
+        'size_mb': args.size_mb,
+        'identical_output': identical,
+        'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // 1024,
+        'results': results
+    }, indent=2))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""Générateur de documents synthétiques dans le dialecte du projet.
+
+Titres ``<hN>``, paragraphes, listes ``{a, b}``, tableaux ``[[a|b]]`` et
+blocs ``<code>``, dans des proportions proches de input/input.html.
+Le contenu est déterministe pour une graine donnée.
+"""
+import random
+from pathlib import Path
+from typing import Iterator
+
+WORDS = (
+    "texte conversion assets navigation modèle gabarit titre section paragraphe "
+    "liste tableau code rendu serveur fichier sortie entrée configuration été "
+    "déjà élément à où chaîne caractères balise"
+).split()
+
+SIZES = {'KB': 1024, 'MB': 1024 * 1024}
+
+def parse_size(value: str) -> int:
+    """Convertit '1KB', '10MB' ou un nombre d'octets en octets."""
+    value = value.strip().upper()
+    for suffix, factor in SIZES.items():
+        if value.endswith(suffix):
+            return int(float(value[:-len(suffix)]) * factor)
+    return int(value)
+
+def format_size(size: int) -> str:
+    for suffix, factor in sorted(SIZES.items(), key=lambda item: -item[1]):
+        if size >= factor and size % factor == 0:
+            return f"{size // factor}{suffix}"
+    return f"{size}B"
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return ' '.join(rng.choice(WORDS) for _ in range(words)).capitalize()
+
+def _section(rng: random.Random) -> str:
+    level = rng.randint(1, 3)
+    parts = [f"<h{level}>{_sentence(rng, rng.randint(2, 5))}</h{level}>"]
+    for _ in range(rng.randint(1, 3)):
+        parts.append(f"<p>{_sentence(rng, rng.randint(10, 40))} <code>{rng.choice(WORDS)} < 2</code>.</p>")
+    if rng.random() < 0.6:
+        tag = rng.choice(('ul', 'ol'))
+        items = ', '.join(_sentence(rng, rng.randint(1, 4)) for _ in range(rng.randint(2, 6)))
+        parts.append(f"<{tag}>{{{items}}}</{tag}>")
+    if rng.random() < 0.3:
+        columns = rng.randint(2, 4)
+        header = '|'.join(_sentence(rng, 1) for _ in range(columns))
+        rows = '\n'.join(
+            '[[' + '|'.join(_sentence(rng, rng.randint(1, 3)) for _ in range(columns)) + ']]'
+            for _ in range(rng.randint(2, 8))
+        )
+        parts.append(f"<table>\n<thead>[[{header}]]</thead>\n<tbody>\n{rows}\n</tbody>\n</table>")
+    if rng.random() < 0.2:
+        parts.append(f"<pre><code>if a < b and b > c:\n    {rng.choice(WORDS)}()\n</code></pre>")
+    return '\n'.join(parts) + '\n'
+
+def iter_document(size: int, seed: int = 0) -> Iterator[str]:
+    """Produit des sections jusqu'à atteindre environ ``size`` octets (UTF-8)."""
+    rng = random.Random(seed)
+    written = 0
+    while written < size:
+        section = _section(rng)
+        written += len(section.encode('utf-8'))
+        yield section
+
+def generate_document(size: int, seed: int = 0) -> str:
+    return ''.join(iter_document(size, seed))
+
+def write_document(path: Path, size: int, seed: int = 0) -> None:
+    """Écrit le document par sections, sans le garder en mémoire."""
+    with open(path, 'w', encoding='utf-8') as f:
+        for section in iter_document(size, seed):
+            f.write(section)
@@ -0,0 +1,187 @@
+"""Suite de benchmarks du convertisseur sur des documents synthétiques.
+
+Usage : python -m benchmarks.run [--sizes 1KB,100KB,1MB,10MB] [--repeat 3]
+                                 [--output results.json] [--compare baseline.json]
+                                 [--startup-budget 0.35]
+
+Chaque étape est mesurée ``repeat`` fois sur le même document ; le
+meilleur temps sert à la comparaison avec une exécution précédente. Le
+démarrage de la CLI (``import main``) est mesuré à part et comparé à un
+budget absolu.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+from src.html_converter import HTMLConverter
+from src.tokenizer import BlockNode
+from .generator import format_size, parse_size, write_document
+
+DEFAULT_SIZES = '1KB,100KB,1MB,10MB'
+ROOT = Path(__file__).resolve().parents[1]
+# Durée cumulée de ``import main`` (s) ; environ 200 ms en local, plus de
+# 500 ms quand les modes --live, --serve et --build étaient importés d'office
+STARTUP_BUDGET_SECONDS = 0.35
+
+def measure(function: Callable[[], object], repeat: int) -> Dict[str, float]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return {'best_seconds': min(timings), 'mean_seconds': statistics.mean(timings)}
+
+def bench_size(config_path: str, size: int, repeat: int, workdir: Path) -> List[Dict]:
+    converter = HTMLConverter(config_path=config_path)
+    input_path = workdir / f'input-{size}.html'
+    output_path = workdir / 'out' / f'output-{size}.html'
+    output_path.parent.mkdir(exist_ok=True)
+    write_document(input_path, size)
+    content = input_path.read_text(encoding='utf-8')
+    input_bytes = input_path.stat().st_size
+
+    results = []
+    def record(stage: str, function: Callable[[], object], throughput: bool = True) -> None:
+        result = {'size': format_size(size), 'bytes': input_bytes, 'stage': stage, **measure(function, repeat)}
+        if throughput:
+            result['mb_per_second'] = input_bytes / (1024 * 1024) / result['best_seconds']
+        results.append(result)
+
+    record('process_titles', lambda: converter.process_titles(content))
+
+    # Retraitement incrémental : un caractère ajouté puis retiré au milieu du document
+    middle = len(content) // 2
+    versions = itertools.cycle((content[:middle] + 'x' + content[middle:], content))
+    converter.process_titles(content, str(input_path))
+    record('process_titles.incremental', lambda: converter.process_titles(next(versions), str(input_path)))
+
+    # Chaque processeur reçoit tous les blocs, comme dans _process_content
+    blocks = [node.raw for node in converter.tokenizer.tokenize(content)
+              if isinstance(node, BlockNode) and node.allowed]
+    for processor in converter.processors:
+        record(f'processor.{type(processor).__name__}',
+               lambda processor=processor: [processor.process(block) for block in blocks])
+
+    processed, titles = converter.process_titles(content)
+    template_data = converter._build_template_data(processed, titles, output_path)
+    template = converter.jinja_env.get_template('base.html')
+    record('render_template', lambda: template.render(**template_data))
+
+    # Dossier neuf à chaque mesure pour la copie initiale, puis resynchronisation sans changement
+    fresh_dirs = (workdir / f'assets-{size}-{run}' for run in itertools.count())
+    record('prepare_assets.cold', lambda: converter.prepare_assets(next(fresh_dirs)), throughput=False)
+    assets_dir = workdir / f'assets-{size}'
+    converter.prepare_assets(assets_dir)
+    record('prepare_assets.warm', lambda: converter.prepare_assets(assets_dir), throughput=False)
+
+    # Conversions complètes : sans le découpage gardé par les mesures précédentes
+    def cold(function: Callable[[], object]) -> Callable[[], object]:
+        return lambda: (converter.document_indexes.clear(), function())
+    record('convert', cold(lambda: converter.convert(str(input_path), str(output_path))))
+    record('convert_async', cold(lambda: asyncio.run(converter.convert_async(str(input_path), str(output_path)))))
+
+    input_path.unlink()
+    return results
+
+def import_seconds(module: str) -> float:
+    """Durée cumulée de l'import de ``module`` dans un interpréteur neuf (``-X importtime``)."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    for line in result.stderr.splitlines():
+        if line.startswith('import time:') and '|' in line:
+            _, cumulative, name = line[len('import time:'):].split('|')
+            if name.strip() == module:
+                return int(cumulative) / 1_000_000
+    raise RuntimeError(f"Import de {module} absent de la sortie de -X importtime")
+
+def bench_startup(repeat: int, budget: float) -> Dict:
+    timings = [import_seconds('main') for _ in range(repeat)]
+    return {
+        'size': None,
+        'stage': 'startup.import_main',
+        'best_seconds': min(timings),
+        'mean_seconds': statistics.mean(timings),
+        'budget_seconds': budget
+    }
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare(results: List[Dict], baseline_path: Path, threshold: float) -> List[Dict]:
+    """Étapes plus lentes que dans ``baseline_path`` au-delà de ``threshold`` (0.2 = +20 %)."""
+    baseline = json.loads(baseline_path.read_text(encoding='utf-8'))
+    previous = {(result['size'], result['stage']): result['best_seconds'] for result in baseline['results']}
+    regressions = []
+    for result in results:
+        before = previous.get((result['size'], result['stage']))
+        if before and result['best_seconds'] > before * (1 + threshold):
+            regressions.append({
+                'size': result['size'],
+                'stage': result['stage'],
+                'before_seconds': before,
+                'after_seconds': result['best_seconds'],
+                'ratio': result['best_seconds'] / before
+            })
+    return regressions
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', default=DEFAULT_SIZES, help='Tailles des documents, de 1KB à 100MB')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--config', default='configs/config.yml')
+    parser.add_argument('--output', type=Path, help='Fichier JSON des résultats (sinon sortie standard)')
+    parser.add_argument('--compare', type=Path, help='Résultats précédents à comparer')
+    parser.add_argument('--threshold', type=float, default=0.2, help='Ralentissement toléré (0.2 = +20 %%)')
+    parser.add_argument('--startup-budget', type=float, default=STARTUP_BUDGET_SECONDS,
+                        help='Durée maximale de import main (s)')
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    results = [bench_startup(args.repeat, args.startup_budget)]
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in (parse_size(value) for value in args.sizes.split(',')):
+            results.extend(bench_size(args.config, size, args.repeat, Path(tmp)))
+
+    report = {
+        'meta': {
+            'date': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'revision': git_revision(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'repeat': args.repeat
+        },
+        'results': results
+    }
+    if args.compare:
+        report['regressions'] = compare(results, args.compare, args.threshold)
+    report['over_budget'] = [
+        result for result in results if result['best_seconds'] > result.get('budget_seconds', float('inf'))
+    ]
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output + '\n', encoding='utf-8')
+    else:
+        print(output)
+    if report.get('regressions') or report['over_budget']:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
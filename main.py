@@ -3,9 +3,15 @@ import argparse
 import sys
 from pathlib import Path
 from src.html_converter import HTMLConverter
-from src.live_editor import LiveEditor
 from src.utils.logging_utils import setup_logging, get_logger
 
+# Les modules propres à chaque mode (aiohttp et watchdog pour --live et
+# --serve, le profileur, le build) sont importés dans la branche qui les
+# utilise : une conversion simple ne charge que le convertisseur.
+# tests/test_startup.py vérifie ce graphe d'imports.
+PROFILERS = ("cprofile", "sample")
+SERVICE_MODES = ("thread", "process")
+
 def parse_arguments():
     """Parse les arguments de la ligne de commande."""
     parser = argparse.ArgumentParser(
@@ -13,11 +19,13 @@ def parse_arguments():
     )
     parser.add_argument(
         "input_file",
-        help="Chemin vers le fichier texte d'entrée"
+        nargs="?",
+        help="Chemin vers le fichier texte d'entrée (ou un dossier avec --live / --build)"
     )
     parser.add_argument(
         "output_file",
-        help="Chemin vers le fichier HTML de sortie"
+        nargs="?",
+        help="Chemin vers le fichier HTML de sortie (facultatif pour --live sur un dossier)"
     )
     parser.add_argument(
         "--config",
@@ -43,10 +51,91 @@ def parse_arguments():
         "--port",
         type=int,
         default=5000,
-        help="Port pour le serveur live editing"
+        help="Port pour le serveur live editing ou le service de conversion"
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Démarre le service de conversion HTTP (POST /convert)"
+    )
+    parser.add_argument(
+        "--mode",
+        choices=SERVICE_MODES,
+        default=None,
+        help="Workers du service : threads ou processus (défaut: service.mode)"
+    )
+    parser.add_argument(
+        "--build",
+        action="store_true",
+        help="Active le mode build : input_file et output_file sont des dossiers"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="Nombre maximal de pages converties simultanément en mode build (défaut: build.concurrency)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Nombre de workers de conversion en mode build ou --serve, 0 = un par CPU "
+             "(défaut: build.workers ou service.workers)"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Ignore le manifeste de build et régénère toutes les pages"
+    )
+    parser.add_argument(
+        "--profile",
+        choices=PROFILERS,
+        default=None,
+        help="Profile la conversion ou le build : cprofile (pstats) ou sample (piles repliées pour flamegraph)"
+    )
+    parser.add_argument(
+        "--profile-output",
+        default=None,
+        help="Fichier du profil (défaut: profile.prof ou profile.folded)"
     )
     
-    return parser.parse_args()
+    args = parser.parse_args()
+    if args.serve:
+        if args.live or args.build or args.profile:
+            parser.error("--serve ne se combine pas avec --live, --build ou --profile")
+        return args
+    if args.input_file is None:
+        parser.error("input_file est requis, sauf avec --serve")
+    if args.output_file is None and not (args.live and Path(args.input_file).is_dir()):
+        parser.error("output_file est requis, sauf en mode --live sur un dossier")
+    if args.profile and args.live and not args.build:
+        parser.error("--profile n'est pas disponible en mode --live")
+    return args
+
+async def run_conversion(converter: HTMLConverter, args, logger) -> None:
+    """Conversion d'un fichier, ou d'un dossier avec --build."""
+    if args.build:
+        from src.site_builder import SiteBuilder
+
+        workers = args.workers
+        if args.profile and workers != 1:
+            # Les processus du pool échapperaient au profileur
+            logger.info("Profiling: build converti dans le processus principal (workers=1)")
+            workers = 1
+        logger.info(f"Building {args.input_file} into {args.output_file}")
+        builder = SiteBuilder(
+            converter, args.input_file, args.output_file, args.concurrency, workers, args.force
+        )
+        result = await builder.build()
+        if result.failed:
+            sys.exit(1)
+        return
+
+    output_path = Path(args.output_file)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    logger.info(f"Converting {args.input_file} to {args.output_file}")
+    await converter.convert_async(args.input_file, str(output_path))
+    logger.info("Conversion completed successfully")
 
 async def main_async():
     """Async entry point"""
@@ -61,17 +150,29 @@ async def main_async():
     
     try:
         converter = HTMLConverter(config_path=args.config)
-        output_path = Path(args.output_file)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        if args.live:
+        if args.serve:
+            from src.service import ConversionService
+            service = ConversionService(converter, args.port, args.workers, args.mode)
+            await service.start()
+        elif args.build or not args.live:
+            if args.profile:
+                from src.utils.profiling import profile_session
+                with profile_session(args.profile, args.profile_output):
+                    await run_conversion(converter, args, logger)
+            else:
+                await run_conversion(converter, args, logger)
+        elif Path(args.input_file).is_dir():
+            from src.live_server import LiveServer
+            logger.info(f"Starting live server for {args.input_file}")
+            server = LiveServer(converter, args.input_file, args.port)
+            await server.start()
+        else:
+            Path(args.output_file).parent.mkdir(parents=True, exist_ok=True)
+            from src.live_editor import LiveEditor
             logger.info("Starting live editing mode")
             editor = LiveEditor(converter, args.input_file, args.output_file, args.port)
             await editor.start()
-        else:
-            logger.info(f"Converting {args.input_file} to {args.output_file}")
-            await converter.convert_async(args.input_file, str(output_path))
-            logger.info("Conversion completed successfully")
 
     except Exception as e:
         logger.error(f"Error: {str(e)}", exc_info=True)
@@ -0,0 +1,141 @@
+import os
+import shutil
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+import logging
+from .build_manifest import file_fingerprint
+from .utils.logging_utils import get_logger
+
+# ioctl Linux permettant de cloner un fichier (reflink) sur btrfs, xfs...
+FICLONE = 0x40049409
+
+LINK_MODES = ('copy', 'hardlink', 'reflink')
+
+@dataclass
+class SyncResult:
+    copied: int = 0
+    unchanged: int = 0
+    removed: int = 0
+
+class AssetSynchronizer:
+    """Synchronise un dossier d'assets en ne recopiant que les fichiers modifiés.
+
+    Chaque fichier est écrit dans un fichier temporaire puis renommé, et les
+    fichiers obsolètes sont supprimés un par un : le dossier de destination
+    n'est jamais vidé, même pendant la synchronisation.
+    """
+
+    def __init__(self, link_mode: str = 'copy', logger: Optional[logging.Logger] = None):
+        if link_mode not in LINK_MODES:
+            raise ValueError(f"Mode de synchronisation inconnu : {link_mode} (attendu : {', '.join(LINK_MODES)})")
+        self.link_mode = link_mode
+        self.logger = logger or get_logger('asset_sync')
+
+    def sync(self, source_dir: Path, dest_dir: Path) -> SyncResult:
+        """Rend ``dest_dir`` identique à ``source_dir``."""
+        result = SyncResult()
+        dest_dir.mkdir(parents=True, exist_ok=True)
+        expected = set()
+
+        for source in source_dir.rglob('*'):
+            relative_path = source.relative_to(source_dir)
+            expected.add(relative_path)
+            destination = dest_dir / relative_path
+            is_dir = source.is_dir()
+            self._remove_if_kind_changed(destination, is_dir)
+            if is_dir:
+                destination.mkdir(parents=True, exist_ok=True)
+                continue
+            if self._is_unchanged(source, destination):
+                result.unchanged += 1
+                continue
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            self._install(source, destination)
+            result.copied += 1
+
+        result.removed = self._remove_stale(dest_dir, expected)
+        self.logger.debug(
+            f"Assets synchronisés : {result.copied} copiés, {result.unchanged} inchangés, "
+            f"{result.removed} supprimés"
+        )
+        return result
+
+    def _remove_if_kind_changed(self, destination: Path, is_dir: bool) -> None:
+        """Supprime ``destination`` si la source est passée de dossier à fichier, ou l'inverse."""
+        if destination.is_symlink() or not destination.exists() or destination.is_dir() == is_dir:
+            return
+        if destination.is_dir():
+            shutil.rmtree(destination)
+        else:
+            destination.unlink()
+        self.logger.debug(f"Type modifié, ancienne version supprimée : {destination}")
+
+    def _is_unchanged(self, source: Path, destination: Path) -> bool:
+        """Compare taille et date de modification, puis le contenu si seule la date diffère."""
+        try:
+            dest_stat = destination.stat()
+        except FileNotFoundError:
+            return False
+        source_stat = source.stat()
+        if dest_stat.st_size != source_stat.st_size:
+            return False
+        if dest_stat.st_mtime_ns == source_stat.st_mtime_ns:
+            return True
+        if file_fingerprint(source) != file_fingerprint(destination):
+            return False
+        # Contenu identique : on aligne la date pour éviter de re-hacher la prochaine fois
+        os.utime(destination, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
+        return True
+
+    def _install(self, source: Path, destination: Path) -> None:
+        """Écrit ``destination`` de façon atomique (fichier temporaire puis renommage)."""
+        tmp_path = destination.with_name(f".{destination.name}.tmp")
+        try:
+            if tmp_path.exists():
+                tmp_path.unlink()
+            if not (self.link_mode == 'hardlink' and self._hardlink(source, tmp_path)) and \
+               not (self.link_mode == 'reflink' and self._reflink(source, tmp_path)):
+                shutil.copy2(source, tmp_path)
+            os.replace(tmp_path, destination)
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def _hardlink(self, source: Path, target: Path) -> bool:
+        try:
+            os.link(source, target)
+            return True
+        except OSError as e:
+            self.logger.debug(f"Lien physique impossible pour {source}, copie : {e}")
+            return False
+
+    def _reflink(self, source: Path, target: Path) -> bool:
+        if not sys.platform.startswith('linux'):
+            return False
+        import fcntl
+        try:
+            with open(source, 'rb') as src, open(target, 'wb') as dst:
+                fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+            shutil.copystat(source, target)
+            return True
+        except OSError as e:
+            self.logger.debug(f"Reflink impossible pour {source}, copie : {e}")
+            target.unlink(missing_ok=True)
+            return False
+
+    def _remove_stale(self, dest_dir: Path, expected: set) -> int:
+        """Supprime les fichiers et dossiers absents de la source."""
+        removed = 0
+        # Tri inverse : les fichiers d'un dossier sont traités avant le dossier lui-même
+        for item in sorted(dest_dir.rglob('*'), reverse=True):
+            if item.relative_to(dest_dir) in expected:
+                continue
+            if item.is_dir():
+                if not any(item.iterdir()):
+                    item.rmdir()
+            else:
+                item.unlink()
+                removed += 1
+        return removed
@@ -0,0 +1,93 @@
+import json
+import os
+from hashlib import md5
+from pathlib import Path
+from typing import Dict, Optional
+from .utils.logging_utils import get_logger
+
+def file_fingerprint(file_path: Path, chunk_size: int = 1024 * 1024) -> str:
+    """Calcule l'empreinte md5 du contenu d'un fichier, lu par blocs."""
+    digest = md5()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class BuildManifest:
+    """Manifeste persistant d'un build : empreinte de chaque entrée et des dépendances communes."""
+
+    VERSION = 1
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.config_hash: Optional[str] = None
+        self.template_hash: Optional[str] = None
+        # chemin relatif de l'entrée -> {'input_hash': ..., 'output': ...}
+        self.pages: Dict[str, Dict[str, str]] = {}
+        self.logger = get_logger('build_manifest')
+
+    @classmethod
+    def load(cls, path: Path) -> 'BuildManifest':
+        """Charge le manifeste, ou retourne un manifeste vide s'il est absent ou illisible."""
+        manifest = cls(path)
+        if not manifest.path.exists():
+            return manifest
+        try:
+            data = json.loads(manifest.path.read_text(encoding='utf-8'))
+            if data.get('version') != cls.VERSION:
+                manifest.logger.info(f"Manifest version changed, ignoring {manifest.path}")
+                return manifest
+            manifest.config_hash = data.get('config_hash')
+            manifest.template_hash = data.get('template_hash')
+            manifest.pages = data.get('pages', {})
+        except (OSError, ValueError) as e:
+            manifest.logger.warning(f"Manifeste illisible, build complet : {e}")
+        return manifest
+
+    def save(self) -> None:
+        """Écrit le manifeste de façon atomique."""
+        data = {
+            'version': self.VERSION,
+            'config_hash': self.config_hash,
+            'template_hash': self.template_hash,
+            'pages': self.pages
+        }
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        tmp_path.write_text(json.dumps(data, indent=2, sort_keys=True), encoding='utf-8')
+        os.replace(tmp_path, self.path)
+
+    def update_dependencies(self, config_hash: str, template_hash: str) -> bool:
+        """Enregistre les empreintes communes ; retourne True si elles ont changé.
+
+        Un changement de configuration ou de template invalide toutes les pages.
+        """
+        changed = (config_hash, template_hash) != (self.config_hash, self.template_hash)
+        if changed:
+            self.invalidate()
+        self.config_hash = config_hash
+        self.template_hash = template_hash
+        return changed
+
+    def invalidate(self) -> None:
+        """Marque toutes les pages à reconvertir.
+
+        Seule l'empreinte des entrées est oubliée : le chemin de sortie reste
+        connu, pour supprimer la sortie d'une entrée disparue entre-temps.
+        """
+        for entry in self.pages.values():
+            entry.pop('input_hash', None)
+
+    def is_up_to_date(self, key: str, input_hash: str, output_path: Path) -> bool:
+        entry = self.pages.get(key)
+        return (
+            entry is not None
+            and entry.get('input_hash') == input_hash
+            and entry.get('output') == str(output_path)
+            and output_path.exists()
+        )
+
+    def record(self, key: str, input_hash: str, output_path: Path) -> None:
+        self.pages[key] = {'input_hash': input_hash, 'output': str(output_path)}
+
+    def forget(self, key: str) -> Optional[Dict[str, str]]:
+        return self.pages.pop(key, None)
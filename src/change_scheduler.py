@@ -0,0 +1,97 @@
+import asyncio
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Optional
+from .utils.logging_utils import get_logger
+
+class ChangeScheduler:
+    """Regroupe les modifications de fichiers et planifie les conversions du mode live.
+
+    - ``notify`` peut être appelé depuis n'importe quel thread (watcher) ;
+    - les modifications reçues pendant le délai d'attente sont fusionnées,
+      la dernière modification d'un fichier l'emporte ;
+    - une conversion en cours est annulée dès qu'une nouvelle modification
+      arrive, ses changements étant repris dans la conversion suivante ;
+    - le délai d'attente suit la durée moyenne (EMA) des conversions, borné
+      par ``min_delay`` et ``max_delay``.
+    """
+
+    def __init__(self,
+                 handler: Callable[[Dict[Path, str]], Awaitable[None]],
+                 min_delay: float = 0.05,
+                 max_delay: float = 1.0,
+                 smoothing: float = 0.3):
+        self.handler = handler
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.smoothing = smoothing
+        self.conversion_time: Optional[float] = None
+        self.pending: Dict[Path, str] = {}
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.logger = get_logger('change_scheduler')
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def delay(self) -> float:
+        if self.conversion_time is None:
+            return self.min_delay
+        return min(max(self.conversion_time, self.min_delay), self.max_delay)
+
+    def start(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        self.loop = loop or asyncio.get_running_loop()
+
+    def notify(self, kind: str, path: Path) -> None:
+        """Signale une modification ; sûr depuis un autre thread que celui de la boucle."""
+        if self.loop is None or self.loop.is_closed():
+            return
+        self.loop.call_soon_threadsafe(self._submit, kind, path)
+
+    def _submit(self, kind: str, path: Path) -> None:
+        self.pending[path] = kind
+        if self._task is not None and not self._task.done():
+            # La conversion en cours produirait une page déjà périmée
+            self._task.cancel()
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = self.loop.call_later(self.delay, self._flush)
+
+    def _flush(self) -> None:
+        self._timer = None
+        previous = self._task
+        self._task = self.loop.create_task(self._run(previous))
+
+    async def _run(self, previous: Optional[asyncio.Task]) -> None:
+        if previous is not None and not previous.done():
+            await asyncio.wait([previous])
+        batch, self.pending = self.pending, {}
+        if not batch:
+            return
+
+        start = self.loop.time()
+        try:
+            await self.handler(batch)
+        except asyncio.CancelledError:
+            # Les changements annulés sont repris, sans écraser les plus récents
+            self.pending = {**batch, **self.pending}
+            self.logger.debug(f"Conversion annulée, {len(batch)} changement(s) reporté(s)")
+            raise
+        except Exception as e:
+            self.logger.error(f"Error processing change: {str(e)}")
+            return
+
+        elapsed = self.loop.time() - start
+        if self.conversion_time is None:
+            self.conversion_time = elapsed
+        else:
+            self.conversion_time += self.smoothing * (elapsed - self.conversion_time)
+
+    async def close(self) -> None:
+        """Abandonne les modifications en attente et annule la conversion en cours."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self.pending.clear()
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        self.loop = None
@@ -0,0 +1,49 @@
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Iterable, Set
+
+_NON_SLUG = re.compile(r'[^a-z0-9]+')
+
+@lru_cache(maxsize=4096)
+def slugify(text: str) -> str:
+    """``"Évolution du modèle"`` -> ``"evolution-du-modele"``."""
+    ascii_text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
+    return _NON_SLUG.sub('-', ascii_text.lower()).strip('-')
+
+class HeadingIds:
+    """Attribue les IDs des titres d'un document.
+
+    - ``slug`` : dérivé du texte du titre, suivi de ``-2``, ``-3``... en cas
+      de doublon ; l'ID ne dépend pas du contenu qui précède le titre. Les IDs
+      ``reserved`` (éléments des templates) ne sont jamais attribués : un
+      titre qui y correspond reçoit ``-1``, ``-2``... ;
+    - ``index`` : ``<prefix><rang du bloc>``, l'ancien comportement.
+    """
+
+    STRATEGIES = ('slug', 'index')
+
+    def __init__(self, strategy: str = 'slug', prefix: str = 'section', reserved: Iterable[str] = ()):
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Stratégie d'ID inconnue : {strategy}")
+        self.strategy = strategy
+        self.prefix = prefix
+        self.reserved = frozenset(reserved)
+        self._used: Set[str] = set(self.reserved)
+
+    def assign(self, text: str, index: int) -> str:
+        if self.strategy == 'index':
+            return f"{self.prefix}{index + 1}"
+
+        base = slugify(text)
+        if not base:
+            base = self.prefix
+        elif base[0].isdigit():
+            base = f"{self.prefix}-{base}"  # un ID commençant par un chiffre gêne les sélecteurs CSS
+        candidate = base
+        counter = 0 if base in self.reserved else 1  # l'élément du template occupe l'ID sans suffixe
+        while candidate in self._used:
+            counter += 1
+            candidate = f"{base}-{counter}"
+        self._used.add(candidate)
+        return candidate
@@ -1,28 +1,57 @@
 from dataclasses import dataclass
-from typing import List, Tuple, Dict, Optional
+from typing import TYPE_CHECKING, List, Tuple, Dict, Optional, Iterable, Iterator
 from pathlib import Path
 import logging
 import yaml
-from jinja2 import Environment, FileSystemLoader, select_autoescape
 import json
 import shutil
 import re
-from bs4 import BeautifulSoup
+import tempfile
+import uuid
 from .interfaces import IContentProcessor, ITemplateEngine
 from .processors import CodeProcessor, ListProcessor, TableProcessor
-from .validators import ValidatorFactory
+from .validators import ValidatorFactory, ValidationCache
+from .asset_sync import AssetSynchronizer
+from .tokenizer import BlockTokenizer, BlockNode, TextNode, contains_block_opener
+from .text_extraction import extract_text
+from .headings import HeadingIds
+from .patterns import DEFAULT_PATTERNS, PatternRegistry
+from .incremental import DocumentIndex, iter_changed_nodes
+from .readers import TextInputReader, MmapInputReader
+from .caches import LRUCache
 import os
 import time
-import aiofiles
 import asyncio
 from functools import lru_cache
 from hashlib import md5
 from .utils.logging_utils import get_logger, log_execution_time, log_async_execution_time
+from .utils.metrics import create_metrics, measure_stage
+
+if TYPE_CHECKING:
+    # jinja2 et aiofiles sont importés au premier usage : une conversion en
+    # build incrémental sans page à régénérer n'en a pas besoin
+    from jinja2 import Environment, FileSystemBytecodeCache
+
+# Taille par défaut au-delà de laquelle un bloc non fermé du flux devient du texte
+DEFAULT_MAX_BLOCK_SIZE = 4 * 1024 * 1024
 
 class ConfigurationError(Exception):
     """Exception raised for configuration-related errors."""
     pass
 
+async def _complete_before_cancel(awaitable):
+    """Attend ``awaitable`` ; en cas d'annulation, le laisse se terminer avant de la propager.
+
+    Utilisé pour les écritures faites dans un thread : une conversion annulée
+    ne doit plus rien écrire une fois sa tâche terminée.
+    """
+    future = asyncio.ensure_future(awaitable)
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        await asyncio.wait([future])
+        raise
+
 @dataclass
 class Title:
     level: int
@@ -39,20 +68,106 @@ class HTMLConverter:
                  logger: Optional[logging.Logger] = None):
         self.logger = logger or get_logger('html_converter')
         self.logger.info("Initializing HTMLConverter")
+        self.config_path = config_path
         self.config = self._load_config(config_path)
-        self.jinja_env = template_engine or self._setup_jinja()
-        self.regex_pattern = self.config['patterns']['title']
+        self._jinja_env = template_engine
+        self._apply_config()
         
         self.processors = processors or [
-            CodeProcessor(),
-            ListProcessor(),
-            TableProcessor()
+            CodeProcessor(self.patterns),
+            ListProcessor(self.patterns),
+            TableProcessor(page_size=self.table_page_size, patterns=self.patterns)
         ]
         self.logger.debug(f"Initialized with {len(self.processors)} processors")
         
         self._validate_paths()
         self._validate_templates()
 
+    def _apply_config(self) -> None:
+        """Initialise les réglages qui dépendent de la configuration chargée."""
+        try:
+            self.patterns = PatternRegistry(self.config.get('patterns'))
+        except ValueError as e:
+            raise ConfigurationError(str(e))
+        self.parser_engine = self.config.get('parser', {}).get('engine', 'tokenizer')
+        if self.parser_engine not in ('tokenizer', 'regex'):
+            raise ConfigurationError(f"Moteur d'analyse inconnu : {self.parser_engine}")
+        if self.parser_engine == 'tokenizer' and self.patterns.sources['title'] != DEFAULT_PATTERNS['title']:
+            self.logger.warning("patterns.title ignoré : seul parser.engine: regex l'utilise")
+        self.id_strategy = self.config['ids'].get('strategy', 'slug')
+        if self.id_strategy not in HeadingIds.STRATEGIES:
+            raise ConfigurationError(f"Stratégie d'ID inconnue : {self.id_strategy}")
+        self.tokenizer = BlockTokenizer(self.config['html']['allowed_tags'])
+        self.input_reader = self._setup_input_reader()
+        self.navigation_cache = LRUCache(
+            self.config.get('cache', {}).get('navigation_size', 32)
+        )
+        # Découpage et rendu du dernier contenu de chaque document, pour le retraitement incrémental
+        self.document_indexes = LRUCache(
+            self.config.get('cache', {}).get('documents_size', 8)
+        )
+        self._nav_button: Optional[Tuple[int, str]] = None
+        validation_cache = self.config['favicons'].get('validation_cache')
+        self.validation_cache = ValidationCache(Path(validation_cache) if validation_cache else None)
+
+        sync_config = self.config.get('assets_sync', {})
+        try:
+            self.asset_synchronizer = AssetSynchronizer(
+                link_mode=sync_config.get('link_mode', 'copy'),
+                logger=self.logger
+            )
+        except ValueError as e:
+            raise ConfigurationError(str(e))
+
+        self.table_page_size = self.config.get('tables', {}).get('page_size', 0)
+        for processor in getattr(self, 'processors', []):
+            if isinstance(processor, TableProcessor):
+                processor.page_size = self.table_page_size
+            if hasattr(processor, 'use_patterns'):
+                processor.use_patterns(self.patterns)
+
+        # Les mesures accumulées sont conservées si l'activation ne change pas
+        metrics_enabled = self.config.get('metrics', {}).get('enabled', False)
+        if getattr(self, 'metrics', None) is None or self.metrics.enabled != metrics_enabled:
+            self.metrics = create_metrics(metrics_enabled)
+
+    def reload_config(self) -> None:
+        """Recharge le fichier de configuration sans recréer le converter.
+
+        Seuls les réglages dérivés de la configuration et les chemins sont
+        revalidés ; en cas d'erreur, la configuration précédente est conservée.
+        """
+        previous_config = self.config
+        self.config = self._load_config(self.config_path)
+        try:
+            self._apply_config()
+            self._validate_paths()
+        except Exception:
+            self.config = previous_config
+            self._apply_config()
+            raise
+        self.logger.info(f"Configuration reloaded from {self.config_path}")
+
+    @property
+    def jinja_env(self) -> 'Environment':
+        """Environnement Jinja2, créé au premier rendu."""
+        if self._jinja_env is None:
+            self._jinja_env = self._setup_jinja()
+        return self._jinja_env
+
+    @jinja_env.setter
+    def jinja_env(self, value) -> None:
+        self._jinja_env = value
+
+    def invalidate_template(self, template_name: str) -> None:
+        """Retire un template du cache de Jinja pour qu'il soit recompilé au prochain rendu."""
+        cache = getattr(self._jinja_env, 'cache', None)
+        if cache is None:
+            return
+        for key in [key for key in cache.keys() if key[1] == template_name]:
+            del cache[key]
+        self.logger.debug(f"Template invalidated: {template_name}")
+
     def _load_config(self, config_path: str) -> dict:
         """Charge la configuration depuis le fichier YAML."""
         try:
@@ -61,6 +176,25 @@ class HTMLConverter:
         except FileNotFoundError:
             raise FileNotFoundError(f"Fichier de configuration '{config_path}' non trouvé.")
 
+    def _setup_input_reader(self):
+        """Crée le lecteur d'entrée choisi par input.backend (text ou mmap)."""
+        backend = self.config.get('input', {}).get('backend', 'text')
+        encoding = self.config['general']['encoding']
+        streaming_config = self.config.get('streaming', {})
+        if backend == 'mmap':
+            try:
+                return MmapInputReader(self.tokenizer, encoding)
+            except ValueError as e:
+                raise ConfigurationError(str(e))
+        if backend != 'text':
+            raise ConfigurationError(f"Lecteur d'entrée inconnu : {backend}")
+        return TextInputReader(
+            self.tokenizer,
+            encoding,
+            chunk_size=streaming_config.get('chunk_size', 1024 * 1024),
+            max_block_size=self._max_block_size()
+        )
+
     def _setup_logger(self) -> logging.Logger:
         """Configure et retourne le logger."""
         logger = logging.getLogger(__name__)
@@ -77,16 +211,37 @@ class HTMLConverter:
             
         return logger
 
-    def _setup_jinja(self) -> Environment:
+    def _setup_jinja(self) -> 'Environment':
         """Configure et retourne l'environnement Jinja2."""
+        from jinja2 import Environment, FileSystemLoader, select_autoescape
+
         template_dir = str(Path('templates').absolute())
         return Environment(
             loader=FileSystemLoader(template_dir),
             autoescape=select_autoescape(['html', 'xml']),
             trim_blocks=True,
-            lstrip_blocks=True
+            lstrip_blocks=True,
+            bytecode_cache=self._setup_bytecode_cache()
         )
 
+    def _setup_bytecode_cache(self) -> Optional['FileSystemBytecodeCache']:
+        """Cache disque des templates compilés, partagé entre les processus.
+
+        Jinja associe à chaque entrée la somme de contrôle du source du template :
+        une entrée devient invalide dès que le template est modifié.
+        """
+        cache_config = self.config['templates'].get('bytecode_cache', {})
+        if not cache_config.get('enabled', False):
+            return None
+        cache_dir = Path(cache_config.get('directory', '.cache/jinja'))
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            self.logger.warning(f"Cache des templates désactivé ({cache_dir}) : {e}")
+            return None
+        from jinja2 import FileSystemBytecodeCache
+        return FileSystemBytecodeCache(str(cache_dir.absolute()))
+
     def read_file(self, file_path: str) -> str:
         """Lit le contenu d'un fichier."""
         path = Path(file_path)
@@ -99,11 +254,109 @@ class HTMLConverter:
                 )
             )
 
-    def process_titles(self, content: str) -> Tuple[str, List[Title]]:
-        """Traite les titres dans le contenu et retourne le contenu modifié et la liste des titres."""
+    def process_titles(self, content: str, document: Optional[str] = None) -> Tuple[str, List[Title]]:
+        """Traite les titres dans le contenu et retourne le contenu modifié et la liste des titres.
+
+        Avec ``document`` (le chemin d'entrée), seuls les blocs modifiés depuis
+        la conversion précédente du même document sont retraités.
+        """
+        with self.metrics.stage('titles'):
+            if self.parser_engine == 'regex':
+                return self._process_titles_regex(content)
+
+            titles = []
+            if document is not None and self.document_indexes.maxsize > 0:
+                return self._process_titles_incremental(content, document, titles), titles
+            processed_content = self._render_nodes(self.tokenizer.iter_nodes(content), titles)
+            return "".join(processed_content), titles
+
+    def _process_titles_incremental(self, content: str, document: str, titles: List[Title]) -> str:
+        """Reprend le HTML des blocs inchangés depuis la conversion précédente de ``document``."""
+        previous = self.document_indexes.get(document)
+        if previous is None:
+            nodes_with_cache = ((node, None) for node in self.tokenizer.iter_nodes(content))
+        else:
+            nodes_with_cache = iter_changed_nodes(self.tokenizer, previous, content)
+
+        ids = self._heading_ids()
+        nodes, fragments = [], []
+        headings: Dict[str, Tuple[int, str]] = {}
+        open_text = -1
+        rendered = 0
+        for node, cached in nodes_with_cache:
+            if not (isinstance(node, BlockNode) and node.allowed):
+                fragment = node.raw
+                if open_text < 0 and isinstance(node, TextNode) and contains_block_opener(fragment):
+                    open_text = len(nodes)
+            elif cached is not None and not node.tag.startswith('h'):
+                fragment = cached
+            elif cached is not None and node.raw in previous.headings:
+                # L'ID d'un titre dépend des titres précédents : le HTML n'est repris que s'il est inchangé
+                level, text = previous.headings[node.raw]
+                title = Title(level=level, text=text, id=ids.assign(text, node.index))
+                titles.append(title)
+                headings[node.raw] = (level, text)
+                if cached.startswith(f'<h{level} id="{title.id}">'):
+                    fragment = cached
+                else:
+                    fragment = self._process_content(self._add_id_to_title(node.raw, title))
+                    rendered += 1
+            else:
+                count = len(titles)
+                fragment = self._render_block(node, titles, ids)
+                if len(titles) > count:
+                    headings[node.raw] = (titles[-1].level, titles[-1].text)
+                rendered += 1
+            nodes.append(node)
+            fragments.append(fragment)
+
+        self.document_indexes.put(
+            document, DocumentIndex(content, nodes, fragments, headings, open_text if open_text >= 0 else len(nodes))
+        )
+        self.logger.debug(f"Incremental processing of {document}: {rendered} block(s) rendered, {len(nodes)} node(s)")
+        return "".join(fragments)
+
+    def iter_processed_content(self, chunks: Iterable[str], titles: List[Title]) -> Iterator[str]:
+        """Traite un flux de morceaux d'entrée et émet le HTML bloc par bloc.
+
+        Les titres rencontrés sont ajoutés à ``titles`` au fil de l'eau.
+        """
+        return self._render_nodes(self.tokenizer.iter_stream(chunks, self._max_block_size()), titles)
+
+    def _max_block_size(self) -> Optional[int]:
+        """Taille maximale d'un bloc en flux, None si illimitée (``streaming.max_block_size: 0``)."""
+        return self.config.get('streaming', {}).get('max_block_size', DEFAULT_MAX_BLOCK_SIZE) or None
+
+    def _heading_ids(self) -> HeadingIds:
+        """Attribution des IDs de titres, propre à un document."""
+        ids_config = self.config['ids']
+        reserved = [ids_config.get('nav_panel_id'), *ids_config.get('reserved', [])]
+        return HeadingIds(self.id_strategy, ids_config['title_prefix'], filter(None, reserved))
+
+    def _render_nodes(self, nodes: Iterable, titles: List[Title]) -> Iterator[str]:
+        ids = self._heading_ids()
+        for node in nodes:
+            if isinstance(node, BlockNode) and node.allowed:
+                yield self._render_block(node, titles, ids)
+            else:
+                yield node.raw
+
+    def _render_block(self, block: BlockNode, titles: List[Title], ids: HeadingIds) -> str:
+        """Produit le HTML d'un bloc autorisé et enregistre son titre éventuel."""
+        tag_content = block.raw
+        if block.tag.startswith('h'):
+            title = self._process_single_title(tag_content, block.index, ids)
+            if title:
+                titles.append(title)
+                tag_content = self._add_id_to_title(tag_content, title)
+        return self._process_content(tag_content)
+
+    def _process_titles_regex(self, content: str) -> Tuple[str, List[Title]]:
+        """Ancien moteur basé sur ``patterns.title`` (parser.engine: regex)."""
         titles = []
+        ids = self._heading_ids()
         allowed_tags = self.config['html']['allowed_tags']
-        matches = re.finditer(self.regex_pattern, content, re.MULTILINE | re.DOTALL)
+        matches = self.patterns['title'].finditer(content)
         
         processed_content = []
         last_index = 0
@@ -114,7 +367,7 @@ class HTMLConverter:
             
             if tag_match and tag_match.group(1) in allowed_tags:
                 if tag_match.group(1).startswith('h'):
-                    title = self._process_single_title(tag_content, index)
+                    title = self._process_single_title(tag_content, index, ids)
                     if title:
                         titles.append(title)
                         tag_content = self._add_id_to_title(tag_content, title)
@@ -126,88 +379,125 @@ class HTMLConverter:
         processed_content.append(content[last_index:])
         return "".join(processed_content), titles
 
-    def _process_single_title(self, tag_content: str, index: int) -> Optional[Title]:
+    def _process_single_title(self, tag_content: str, index: int, ids: HeadingIds) -> Optional[Title]:
         """Traite un titre individuel."""
         title_match = re.match(r'<h([1-6])', tag_content)
         if title_match:
             level = int(title_match.group(1))
-            soup = BeautifulSoup(tag_content, 'html.parser')
-            text = soup.get_text(" ", strip=True)
-            return Title(
-                level=level,
-                text=text,
-                id=f"{self.config['ids']['title_prefix']}{index + 1}"
-            )
+            text = extract_text(tag_content)
+            return Title(level=level, text=text, id=ids.assign(text, index))
         return None
 
     def _add_id_to_title(self, tag_content: str, title: Title) -> str:
-        """Ajoute un ID à une balise de titre."""
-        return tag_content.replace(
-            f"<h{title.level}>",
-            f"<h{title.level} id=\"{title.id}\">"
-        )
+        """Ajoute un ID à la balise ouvrante d'un titre."""
+        opening = f"<h{title.level}>"
+        if not tag_content.startswith(opening):
+            return tag_content  # balise avec attributs : laissée telle quelle
+        return f"<h{title.level} id=\"{title.id}\">{tag_content[len(opening):]}"
 
     def _process_content(self, content: str) -> str:
         """Traite le contenu avec tous les processeurs."""
+        if self.metrics.enabled:
+            for processor in self.processors:
+                with self.metrics.stage(f"processor.{type(processor).__name__}"):
+                    content = processor.process(content)
+            return content
         for processor in self.processors:
             content = processor.process(content)
         return content
 
     def generate_navigation_panel(self, titles: List[Title]) -> str:
-        """Génère le panneau de navigation."""
-        template = self.jinja_env.get_template('components/navigation.html')
-        return template.render(
-            titles=titles,
-            config=self.config,
-            nav_button=self.read_file(self.config['templates']['paths']['nav_button'])
+        """Génère le panneau de navigation.
+
+        Le rendu est mis en cache par liste de titres (niveau, texte, id) et
+        version des templates : une modification qui ne touche pas aux titres
+        ne refait pas le rendu.
+        """
+        navigation_path = self.template_path / 'components' / 'navigation.html'
+        nav_button_path = Path(self.config['templates']['paths']['nav_button'])
+        key = (
+            tuple((title.level, title.text, title.id) for title in titles),
+            navigation_path.stat().st_mtime_ns,
+            nav_button_path.stat().st_mtime_ns
         )
+        navigation = self.navigation_cache.get(key)
+        if navigation is None:
+            template = self.jinja_env.get_template('components/navigation.html')
+            navigation = template.render(
+                titles=titles,
+                config=self.config,
+                nav_button=self._read_nav_button(nav_button_path, key[2])
+            )
+            self.navigation_cache.put(key, navigation)
+        return navigation
+
+    def _read_nav_button(self, nav_button_path: Path, mtime_ns: int) -> str:
+        """Lit le bouton de navigation, relu seulement s'il a été modifié."""
+        if self._nav_button is None or self._nav_button[0] != mtime_ns:
+            self._nav_button = (mtime_ns, self.read_file(str(nav_button_path)))
+        return self._nav_button[1]
 
     def verify_favicon_resources(self) -> Dict[str, List[str]]:
-        """Vérifie la présence et la validité des ressources favicon."""
+        """Vérifie la présence et la validité des ressources favicon.
+
+        Les résultats sont mis en cache par (chemin, taille, mtime) : un fichier
+        inchangé n'est pas relu.
+        """
         results = {'missing': [], 'invalid': []}
         images_path = Path(self.config['templates']['paths']['assets']['images'])
         
         for favicon_file in self.config['favicons']['required_files']:
             file_path = images_path / favicon_file
-            if not file_path.exists():
+            try:
+                stat = file_path.stat()
+            except FileNotFoundError:
                 results['missing'].append(favicon_file)
                 continue
                 
             validator = ValidatorFactory.get_validator(file_path.suffix)
-            if validator and not validator.validate(file_path):
+            if validator and not self._cached_validation(file_path, stat, validator.validate):
                 results['invalid'].append(favicon_file)
 
         # Vérification du webmanifest
-        self._validate_webmanifest(images_path / 'site.webmanifest', results)
-        
+        manifest_path = images_path / 'site.webmanifest'
+        try:
+            stat = manifest_path.stat()
+        except FileNotFoundError:
+            results['missing'].append('site.webmanifest')
+        else:
+            if not self._cached_validation(manifest_path, stat, self._is_valid_webmanifest):
+                results['invalid'].append('site.webmanifest')
+
+        self.validation_cache.save()
         return results
 
-    def _validate_webmanifest(self, manifest_path: Path, results: Dict[str, List[str]]) -> None:
-        """Valide le fichier webmanifest."""
-        if not manifest_path.exists():
-            results['missing'].append('site.webmanifest')
-            return
+    def _cached_validation(self, file_path: Path, stat: os.stat_result, validate) -> bool:
+        valid = self.validation_cache.lookup(file_path, stat)
+        if valid is None:
+            valid = validate(file_path)
+            self.validation_cache.store(file_path, stat, valid)
+        return valid
 
+    def _is_valid_webmanifest(self, manifest_path: Path) -> bool:
+        """Indique si le webmanifest est un JSON avec un nom et des icônes complètes."""
         try:
             with open(manifest_path, 'r', encoding='utf-8') as f:
                 manifest = json.load(f)
                 
             required_fields = ['name', 'icons']
             if not all(field in manifest for field in required_fields):
-                results['invalid'].append('site.webmanifest')
-                return
+                return False
                 
             if not manifest['icons'] or not isinstance(manifest['icons'], list):
-                results['invalid'].append('site.webmanifest')
-                return
+                return False
                 
             for icon in manifest['icons']:
                 if not all(field in icon for field in ['src', 'sizes', 'type']):
-                    results['invalid'].append('site.webmanifest')
-                    return
+                    return False
                     
         except Exception:
-            results['invalid'].append('site.webmanifest')
+            return False
+        return True
 
     def _validate_paths(self):
         """Validate all paths in configuration."""
@@ -273,6 +563,19 @@ class HTMLConverter:
                     f"Template '{template_name}' introuvable : {template_path}"
                 )
             
+    def config_fingerprint(self) -> str:
+        """Retourne l'empreinte de la configuration chargée."""
+        serialized = json.dumps(self.config, sort_keys=True, default=str)
+        return md5(serialized.encode('utf-8')).hexdigest()
+
+    def templates_fingerprint(self) -> str:
+        """Retourne l'empreinte de tous les templates HTML (les assets ne sont pas inclus)."""
+        digest = md5()
+        for template_file in sorted(self.template_path.rglob('*.html')):
+            digest.update(template_file.relative_to(self.template_path).as_posix().encode('utf-8'))
+            digest.update(template_file.read_bytes())
+        return digest.hexdigest()
+
     def _verify_assets_integrity(self, assets_dir: Path) -> None:
         """
         Vérifie l'intégrité des assets après la copie.
@@ -301,7 +604,11 @@ class HTMLConverter:
                     self.logger.warning(f"Aucun fichier valide trouvé dans {type_dir}")
 
     def prepare_assets(self, output_dir: Path) -> None:
-        """Prépare les assets pour le site généré en copiant récursivement tout le dossier templates/assets dans output_dir/assets."""
+        """Synchronise le dossier templates/assets vers output_dir/assets.
+
+        Seuls les fichiers modifiés sont recopiés et les fichiers obsolètes sont
+        supprimés un à un : le dossier de sortie n'est jamais vidé.
+        """
         base_dir = Path(__file__).resolve().parent.parent
         source_assets = base_dir / 'templates' / 'assets'
         dest_assets = output_dir / 'assets'
@@ -310,17 +617,18 @@ class HTMLConverter:
             self.logger.warning(f"Le dossier source des assets n'existe pas : {source_assets}")
             return
 
-        self.logger.info(f"Préparation des assets : source={source_assets} -> dest={dest_assets}")
+        self.logger.debug(f"Synchronisation des assets : source={source_assets} -> dest={dest_assets}")
         try:
-            if dest_assets.exists():
-                self.logger.info(f"Suppression du dossier d'assets existant : {dest_assets}")
-                shutil.rmtree(dest_assets)
-            shutil.copytree(source_assets, dest_assets)
-            self.logger.info(f"Assets copiés avec succès dans {dest_assets}")
+            with self.metrics.stage('assets'):
+                result = self.asset_synchronizer.sync(source_assets, dest_assets)
+            if result.copied or result.removed:
+                self.logger.info(
+                    f"Assets synchronisés dans {dest_assets} : {result.copied} copiés, "
+                    f"{result.removed} supprimés"
+                )
         except Exception as e:
             self.logger.error(f"Erreur lors de la copie des assets : {e}", exc_info=True)
 
-
     def _copy_directory_contents(self, source_dir: Path, dest_dir: Path) -> None:
         """
         Copie récursivement le contenu d'un dossier avec gestion des erreurs.
@@ -378,27 +686,27 @@ class HTMLConverter:
 
 
     @log_execution_time()
-    def convert(self, input_file: str, output_file: str) -> None:
+    @measure_stage('convert')
+    def convert(self,
+                input_file: str,
+                output_file: str,
+                favicon_status: Optional[Dict[str, List[str]]] = None,
+                assets_root: Optional[Path] = None) -> None:
         """Synchronous conversion method"""
         self.logger.info(f"Starting conversion: {input_file} -> {output_file}")
         try:
             input_path = Path(input_file).resolve()
             output_path = Path(output_file).resolve()
-            
-            self.logger.debug(f"Reading input file: {input_path}")
-            content = self.read_file(str(input_path))
-            
-            self.logger.debug("Processing content")
-            processed_content, titles = self.process_titles(content)
-            
-            self.logger.debug("Preparing template data")
-            template_data = self._prepare_template_data(processed_content, titles, output_path)
-            
-            self.logger.debug("Generating HTML")
-            output_html = self.jinja_env.get_template('base.html').render(**template_data)
-            
+
+            if self._should_stream(input_path):
+                self.convert_stream(str(input_path), str(output_path), favicon_status, assets_root)
+                return
+
+            output_html = self.render_page(str(input_path), str(output_path), favicon_status, assets_root)
+
             self.logger.debug(f"Writing output file: {output_path}")
-            output_path.write_text(output_html, encoding=self.config['general']['encoding'])
+            with self.metrics.stage('write'):
+                output_path.write_text(output_html, encoding=self.config['general']['encoding'])
             
             self.logger.info(f"Successfully converted {input_file} to {output_file}")
             
@@ -406,40 +714,187 @@ class HTMLConverter:
             self.logger.error(f"Conversion failed: {str(e)}", exc_info=True)
             raise
 
+    def render_page(self,
+                    input_file: str,
+                    output_file: str,
+                    favicon_status: Optional[Dict[str, List[str]]] = None,
+                    assets_root: Optional[Path] = None) -> str:
+        """Convertit ``input_file`` et retourne la page HTML, sans l'écrire.
+
+        ``output_file`` ne sert qu'au calcul des chemins relatifs des assets.
+        """
+        self.logger.debug(f"Reading input file: {input_file}")
+        with self.metrics.stage('read'):
+            content = self.read_file(input_file)
+        return self.render_content(
+            content, output_file, favicon_status, assets_root, document=str(Path(input_file).resolve())
+        )
+
+    def render_content(self,
+                       content: str,
+                       output_file: str,
+                       favicon_status: Optional[Dict[str, List[str]]] = None,
+                       assets_root: Optional[Path] = None,
+                       document: Optional[str] = None) -> str:
+        """Convertit un contenu déjà lu et retourne la page HTML.
+
+        ``document`` identifie le contenu pour le retraitement incrémental.
+        """
+        self.logger.debug("Processing content")
+        processed_content, titles = self.process_titles(content, document)
+
+        self.logger.debug("Preparing template data")
+        template_data = self._build_template_data(
+            processed_content, titles, Path(output_file).resolve(), favicon_status, assets_root
+        )
+
+        self.logger.debug("Generating HTML")
+        with self.metrics.stage('render'):
+            return self.jinja_env.get_template('base.html').render(**template_data)
+
     @log_async_execution_time()
-    async def convert_async(self, input_file: str, output_file: str) -> None:
-        """Asynchronous conversion method"""
+    @measure_stage('convert')
+    async def convert_async(self,
+                            input_file: str,
+                            output_file: str,
+                            favicon_status: Optional[Dict[str, List[str]]] = None,
+                            assets_root: Optional[Path] = None) -> Optional[str]:
+        """Asynchronous conversion method.
+
+        En mode build, ``favicon_status`` et ``assets_root`` sont fournis par
+        l'appelant : la vérification des favicons et la copie des assets sont
+        alors faites une seule fois pour toutes les pages.
+
+        Retourne la page écrite, ou None si elle a été convertie en flux.
+        """
         self.logger.info(f"Starting async conversion: {input_file} -> {output_file}")
         try:
             input_path = Path(input_file).resolve()
             output_path = Path(output_file).resolve()
-            
-            self.logger.debug(f"Reading input file: {input_path}")
-            content = await self._read_file_async(str(input_path))
-            
-            self.logger.debug("Processing content")
-            processed_content, titles = self.process_titles(content)
-            
-            self.logger.debug("Preparing template data")
-            template_data = await self._prepare_template_data(processed_content, titles, output_path)
-            
-            self.logger.debug("Generating HTML")
-            output_html = self.jinja_env.get_template('base.html').render(**template_data)
-            
-            self.logger.debug(f"Writing output file: {output_path}")
-            await self._write_file_async(output_path, output_html)
+            output_html = None
+
+            if self._should_stream(input_path):
+                await _complete_before_cancel(asyncio.to_thread(
+                    self.convert_stream, str(input_path), str(output_path), favicon_status, assets_root
+                ))
+            else:
+                self.logger.debug(f"Reading input file: {input_path}")
+                with self.metrics.stage('read'):
+                    content = await self._read_file_async(str(input_path))
+                
+                self.logger.debug("Processing content")
+                processed_content, titles = self.process_titles(content, str(input_path))
+                
+                self.logger.debug("Preparing template data")
+                template_data = await self._prepare_template_data(
+                    processed_content, titles, output_path, favicon_status, assets_root
+                )
+                
+                self.logger.debug("Generating HTML")
+                with self.metrics.stage('render'):
+                    output_html = self.jinja_env.get_template('base.html').render(**template_data)
+                
+                self.logger.debug(f"Writing output file: {output_path}")
+                with self.metrics.stage('write'):
+                    await _complete_before_cancel(self._write_file_async(output_path, output_html))
 
             # Copie automatique des assets dans le dossier de sortie
-            self.prepare_assets(output_path.parent)
+            if assets_root is None:
+                self.prepare_assets(output_path.parent)
 
             self.logger.info(f"Successfully converted {input_file} to {output_file}")
+            return output_html
             
         except Exception as e:
             self.logger.error(f"Async conversion failed: {str(e)}", exc_info=True)
             raise
 
+    def _should_stream(self, input_path: Path) -> bool:
+        """Indique si le fichier doit être converti en flux.
+
+        C'est toujours le cas avec le lecteur mmap, sinon à partir de
+        streaming.threshold_bytes.
+        """
+        if self.parser_engine != 'tokenizer':
+            return False
+        if self.input_reader.name == 'mmap':
+            return True
+        threshold = self.config.get('streaming', {}).get('threshold_bytes')
+        if not threshold:
+            return False
+        try:
+            return input_path.stat().st_size >= threshold
+        except FileNotFoundError:
+            return False
+
+    @log_execution_time()
+    def convert_stream(self,
+                       input_file: str,
+                       output_file: str,
+                       favicon_status: Optional[Dict[str, List[str]]] = None,
+                       assets_root: Optional[Path] = None) -> None:
+        """Conversion en flux pour les très gros fichiers.
+
+        Les nœuds sont fournis par le lecteur d'entrée (input.backend) et le
+        contenu traité est écrit bloc par bloc dans un fichier temporaire
+        (les titres doivent être connus avant de rendre la navigation), puis
+        ``base.html`` est rendu avec ``generate()`` et le contenu est recopié
+        à l'emplacement de ``{{ content }}``. La mémoire reste bornée par la
+        taille des morceaux et du plus gros bloc, quelle que soit l'entrée.
+        """
+        input_path = Path(input_file).resolve()
+        output_path = Path(output_file).resolve()
+        encoding = self.config['general']['encoding']
+        self.logger.info(f"Streaming conversion: {input_path} -> {output_path}")
+
+        if not input_path.exists():
+            raise FileNotFoundError(
+                self.config['messages']['errors']['file_not_found'].format(
+                    file_path=input_file
+                )
+            )
+
+        titles: List[Title] = []
+        with tempfile.TemporaryFile(dir=output_path.parent) as body:
+            # En flux, la lecture est comptée avec le traitement des titres
+            with self.metrics.stage('titles'):
+                for fragment in self._render_nodes(self.input_reader.iter_nodes(input_path), titles):
+                    # Le lecteur mmap fournit le texte hors bloc en octets, recopiés tels quels
+                    body.write(fragment.encode(encoding) if isinstance(fragment, str) else fragment)
+            body.seek(0)
+            self._write_streamed_page(body, titles, output_path, favicon_status, assets_root)
+
+    def _write_streamed_page(self,
+                             body,
+                             titles: List[Title],
+                             output_path: Path,
+                             favicon_status: Optional[Dict[str, List[str]]] = None,
+                             assets_root: Optional[Path] = None) -> None:
+        """Rend ``base.html`` en flux et insère le contenu binaire ``body`` à sa place."""
+        encoding = self.config['general']['encoding']
+        marker = f"<!--content-{uuid.uuid4().hex}-->"
+        template_data = self._build_template_data(marker, titles, output_path, favicon_status, assets_root)
+
+        tmp_path = output_path.with_name(f".{output_path.name}.tmp")
+        try:
+            # Rendu et écriture sont entrelacés : mesurés ensemble sous 'render'
+            with open(tmp_path, 'wb') as out, self.metrics.stage('render'):
+                for part in self.jinja_env.get_template('base.html').generate(**template_data):
+                    if marker in part:
+                        before, after = part.split(marker, 1)
+                        out.write(before.encode(encoding))
+                        shutil.copyfileobj(body, out)
+                        out.write(after.encode(encoding))
+                    else:
+                        out.write(part.encode(encoding))
+            os.replace(tmp_path, output_path)
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
     async def _read_file_async(self, file_path: str) -> str:
         """Async file reading"""
+        import aiofiles
         try:
             async with aiofiles.open(file_path, mode='r', encoding=self.config['general']['encoding']) as f:
                 return await f.read()
@@ -448,23 +903,61 @@ class HTMLConverter:
 
     async def _write_file_async(self, file_path: Path, content: str) -> None:
         """Async file writing"""
+        import aiofiles
         async with aiofiles.open(file_path, mode='w', encoding=self.config['general']['encoding']) as f:
             await f.write(content)
 
-    async def _prepare_template_data(self, content: str, titles: List[Title], output_path: Path) -> Dict:
+    async def _prepare_template_data(self,
+                                     content: str,
+                                     titles: List[Title],
+                                     output_path: Path,
+                                     favicon_status: Optional[Dict[str, List[str]]] = None,
+                                     assets_root: Optional[Path] = None) -> Dict:
         """Prepare template data asynchronously"""
+        if favicon_status is None:
+            with self.metrics.stage('favicons'):
+                favicon_status = await asyncio.to_thread(self.verify_favicon_resources)
+        with self.metrics.stage('navigation'):
+            navigation = await asyncio.to_thread(self.generate_navigation_panel, titles)
         return {
             'content': content,
             'titles': titles,
             'config': self.config,
-            'navigation': await asyncio.to_thread(self.generate_navigation_panel, titles),
-            'assets': await asyncio.to_thread(self._calculate_assets_paths, output_path),
-            'favicon_status': await asyncio.to_thread(self.verify_favicon_resources)
+            'navigation': navigation,
+            'assets': await asyncio.to_thread(self._calculate_assets_paths, output_path, assets_root),
+            'favicon_status': favicon_status
         }
 
-    def _calculate_assets_paths(self, output_path: Path) -> Dict:
-        """Calculate assets paths relatifs à la racine du dossier de sortie (output)."""
+    def _build_template_data(self,
+                             content: str,
+                             titles: List[Title],
+                             output_path: Path,
+                             favicon_status: Optional[Dict[str, List[str]]] = None,
+                             assets_root: Optional[Path] = None) -> Dict:
+        """Prépare les données du template (version synchrone)."""
+        if favicon_status is None:
+            with self.metrics.stage('favicons'):
+                favicon_status = self.verify_favicon_resources()
+        with self.metrics.stage('navigation'):
+            navigation = self.generate_navigation_panel(titles)
+        return {
+            'content': content,
+            'titles': titles,
+            'config': self.config,
+            'navigation': navigation,
+            'assets': self._calculate_assets_paths(output_path, assets_root),
+            'favicon_status': favicon_status
+        }
+
+    def _calculate_assets_paths(self, output_path: Path, assets_root: Optional[Path] = None) -> Dict:
+        """Calculate assets paths relatifs à la racine du dossier de sortie (output).
+
+        Si ``assets_root`` est fourni, les chemins pointent vers ``assets_root/assets``
+        depuis le dossier de ``output_path`` (pages placées dans des sous-dossiers).
+        """
         assets_base = 'assets'
+        if assets_root is not None:
+            assets_base = self._get_relative_path(output_path, assets_root / 'assets').replace(os.sep, '/')
         return {
             'css': [
                 f"{assets_base}/css/style.css",
@@ -476,7 +969,14 @@ class HTMLConverter:
 
     async def prepare_assets_async(self, output_dir: Path) -> None:
         """Async version of prepare_assets"""
-        await asyncio.to_thread(self.prepare_assets, output_dir)
+        await _complete_before_cancel(asyncio.to_thread(self.prepare_assets, output_dir))
+
+    async def reload_config_async(self) -> None:
+        """Async version of reload_config ; annulé, le rechargement se termine d'abord.
+
+        Le rendu suivant ne voit jamais une configuration à moitié rechargée.
+        """
+        await _complete_before_cancel(asyncio.to_thread(self.reload_config))
 
     def _get_relative_path(self, from_path: Path, to_path: Path) -> str:
         """Calcule le chemin relatif entre deux chemins."""
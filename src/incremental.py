@@ -0,0 +1,88 @@
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from .tokenizer import BlockNode, BlockTokenizer, Node, TextNode, contains_block_opener
+from .utils.strings import common_prefix_length, common_suffix_length
+
+@dataclass
+class DocumentIndex:
+    """Découpage et rendu du dernier contenu converti d'un document."""
+    content: str
+    nodes: List[Node]
+    fragments: List[str]  # HTML produit pour chaque nœud
+    headings: Dict[str, Tuple[int, str]]  # bloc de titre -> (niveau, texte)
+    # Premier texte contenant un début de bloc resté sans fermeture : une
+    # fermeture ajoutée plus loin peut en faire un bloc, rien n'est repris au-delà
+    open_text: int = -1
+
+    def __post_init__(self):
+        if self.open_text < 0:
+            self.open_text = next(
+                (position for position, node in enumerate(self.nodes)
+                 if isinstance(node, TextNode) and contains_block_opener(node.raw)),
+                len(self.nodes)
+            )
+
+class _Offsets(Sequence):
+    """Positions ``start`` ou ``end`` d'une liste de nœuds, lues à la demande par bisect.
+
+    Remplace ``bisect(..., key=attrgetter(...))``, absent avant Python 3.10,
+    sans copier les positions de tout le document.
+    """
+
+    def __init__(self, nodes: List[Node], attribute: str):
+        self.nodes = nodes
+        self.attribute = attribute
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __getitem__(self, position: int) -> int:
+        return getattr(self.nodes[position], self.attribute)
+
+def iter_changed_nodes(tokenizer: BlockTokenizer,
+                       previous: DocumentIndex,
+                       content: str) -> Iterator[Tuple[Node, Optional[str]]]:
+    """Nœuds de ``content`` avec le HTML du rendu précédent quand il reste valable.
+
+    Les blocs compris dans la partie commune initiale sont repris tels quels ;
+    le découpage reprend après le dernier d'entre eux et s'arrête dès qu'un
+    bloc retombe, dans la partie commune finale, sur le début d'un bloc du
+    découpage précédent : la suite est alors identique, décalée. Seuls les
+    nœuds de la zone modifiée sont accompagnés de ``None`` et à rendre.
+    """
+    old, old_nodes = previous.content, previous.nodes
+    prefix = common_prefix_length(old, content)
+    suffix = common_suffix_length(old, content, min(len(old), len(content)) - prefix)
+
+    # Un bloc fermé avant la première différence a été découpé sur un texte identique
+    kept = min(bisect_right(_Offsets(old_nodes, 'end'), prefix), previous.open_text)
+    while kept and not isinstance(old_nodes[kept - 1], BlockNode):
+        kept -= 1  # le texte qui suit un bloc s'arrête au bloc suivant, peut-être modifié
+    yield from zip(old_nodes[:kept], previous.fragments[:kept])
+
+    restart, index = (old_nodes[kept - 1].end, old_nodes[kept - 1].index + 1) if kept else (0, 0)
+    shift = len(content) - len(old)
+    suffix_start = len(content) - suffix
+    for node in tokenizer.iter_nodes(content, restart, index):
+        if isinstance(node, BlockNode) and node.start >= suffix_start:
+            match = bisect_left(_Offsets(old_nodes, 'start'), node.start - shift, lo=kept)
+            if match < len(old_nodes) and old_nodes[match].start == node.start - shift \
+                    and isinstance(old_nodes[match], BlockNode):
+                yield from _shifted(old_nodes[match:], previous.fragments[match:],
+                                    shift, node.index - old_nodes[match].index)
+                return
+        yield node, None
+
+def _shifted(nodes: List[Node], fragments: List[str],
+             shift: int, index_shift: int) -> Iterator[Tuple[Node, Optional[str]]]:
+    if not shift and not index_shift:
+        yield from zip(nodes, fragments)
+        return
+    for node, fragment in zip(nodes, fragments):
+        if isinstance(node, BlockNode):
+            node = BlockNode(node.kind, node.tag, node.raw, node.start + shift, node.end + shift,
+                             node.index + index_shift, node.allowed)
+        else:
+            node = TextNode(node.raw, node.start + shift, node.end + shift)
+        yield node, fragment
@@ -3,201 +3,24 @@ from pathlib import Path
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 from .html_converter import HTMLConverter
+from .live_patch import PageDiffer
+from .change_scheduler import ChangeScheduler
 from .utils.logging_utils import get_logger
 from aiohttp import web
 import webbrowser
 import aiofiles
-import time
-from typing import Set
-
-class FileChangeHandler(FileSystemEventHandler):
-    def __init__(self, queue: asyncio.Queue, input_file: Path):
-        self.queue = queue
-        self.input_file = input_file
-        self.last_event_time = 0
-        self.debounce_delay = 0.5
-
-    def on_modified(self, event):
-        current_time = time.time()
-        if event.src_path == str(self.input_file) and \
-           current_time - self.last_event_time >= self.debounce_delay:
-            self.last_event_time = current_time
-            try:
-                self.queue.put_nowait(event.src_path)
-            except asyncio.QueueFull:
-                pass  # Skip if queue is full
-
-class LiveEditor:
-    def __init__(self, converter, input_file: str, output_file: str, port: int = 5000):
-        self.converter = converter
-        self.input_file = Path(input_file).resolve()
-        self.output_file = Path(output_file).resolve()
-        self.port = port
-        self.logger = get_logger('live_editor')
-        self.app = web.Application()
-        self.setup_routes()
-        self.ws_clients: Set[web.WebSocketResponse] = set()
-        self.change_queue = asyncio.Queue(maxsize=100)
-        self.conversion_lock = asyncio.Lock()
-        self.running = True
-        self.tasks = set()
-        self.observer = None
-
-    def setup_routes(self):
-        self.app.router.add_static('/assets/', path=Path('templates/assets'))
-        self.app.router.add_get('/', self.serve_output)
-        self.app.router.add_get('/ws', self.websocket_handler)
-        self.app.on_shutdown.append(self.on_shutdown)
-
-    async def process_changes(self):
-        try:
-            while self.running:
-                try:
-                    _ = await self.change_queue.get()
-                    if not self.running:
-                        break
-
-                    async with self.conversion_lock:
-                        await self.converter.convert_async(
-                            str(self.input_file),
-                            str(self.output_file)
-                        )
-                        self.logger.info(
-                            f"Live update: converted {self.input_file} to {self.output_file}"
-                        )
-                        await self.notify_clients()
-                except asyncio.CancelledError:
-                    break
-                except Exception as e:
-                    self.logger.error(f"Error processing change: {str(e)}")
-                finally:
-                    try:
-                        self.change_queue.task_done()
-                    except ValueError:
-                        pass  # Queue might already be empty
-        except Exception as e:
-            self.logger.error(f"Process changes loop error: {str(e)}")
-
-    async def websocket_handler(self, request):
-        ws = web.WebSocketResponse(heartbeat=30)
-        await ws.prepare(request)
-        self.ws_clients.add(ws)
-
-        try:
-            async for _ in ws:
-                pass  # We don't expect any incoming messages
-        except asyncio.CancelledError:
-            pass
-        finally:
-            self.ws_clients.discard(ws)
-        return ws
-
-    async def notify_clients(self):
-        dead_clients = set()
-        for ws in self.ws_clients:
-            try:
-                await ws.send_str('reload')
-            except Exception as e:
-                self.logger.error(f"Failed to notify client: {str(e)}")
-                dead_clients.add(ws)
-
-        # Clean up dead connections
-        self.ws_clients.difference_update(dead_clients)
-
-    async def serve_output(self, request):
-        try:
-            async with aiofiles.open(self.output_file, mode='r', encoding='utf-8') as f:
-                content = await f.read()
-
-            ws_script = """
-                <script>
-                    // Sauvegarder le thème actuel avant le rechargement
-                    function saveCurrentTheme() {
-                        const currentTheme = document.documentElement.getAttribute('data-theme');
-                        if (currentTheme) {
-                            localStorage.setItem('theme', currentTheme);
-                        }
-                    }
-
-                    // Configurer la WebSocket
-                    let ws = new WebSocket(`ws://${location.host}/ws`);
-                    ws.onmessage = function(event) {
-                        if (event.data === 'reload') {
-                            // Sauvegarder le thème actuel
-                            saveCurrentTheme();
-
-                            // Ajouter une classe pour la transition fluide
-                            document.documentElement.classList.add('theme-transition');
-
-                            // Recharger la page après un court délai pour permettre la sauvegarde
-                            setTimeout(() => {
-                                location.reload();
-                            }, 50);
-                        }
-                    };
-                    ws.onclose = function() {
-                        setTimeout(() => {
-                            ws = new WebSocket(`ws://${location.host}/ws`);
-                        }, 1000);
-                    };
-
-                    // S'assurer que le bouton de mode sombre est créé en mode live
-                    document.addEventListener("DOMContentLoaded", () => {
-                        // Vérifier si le bouton existe déjà
-                        if (!document.querySelector('.theme-toggle')) {
-                            // Créer le bouton de bascule du thème
-                            const themeToggle = document.createElement('button');
-                            themeToggle.className = 'theme-toggle';
-
-                            // Déterminer l'icône en fonction du thème actuel
-                            const currentTheme = document.documentElement.getAttribute('data-theme');
-                            themeToggle.innerHTML = currentTheme === 'dark' ?
-                                '<i class="fas fa-sun"></i>' :
-                                '<i class="fas fa-moon"></i>';
-
-                            themeToggle.setAttribute('aria-label', 'Basculer entre le mode clair et sombre');
-                            document.body.appendChild(themeToggle);
-
-                            // Fonction pour définir le thème avec transition fluide
-                            function setTheme(theme, instant = false) {
-                                // Ajouter une classe de transition si ce n'est pas un changement instantané
-                                if (!instant) {
-                                    document.documentElement.classList.add('theme-transition');
-
-                                    // Retirer la classe après la fin de la transition
-                                    setTimeout(() => {
-                                        document.documentElement.classList.remove('theme-transition');
-                                    }, 300); // Correspond à la durée de transition CSS (0.3s)
-                                }
-
-                                if (theme === 'dark') {
-                                    document.documentElement.setAttribute('data-theme', 'dark');
-                                    themeToggle.innerHTML = '<i class="fas fa-sun"></i>';
-                                    localStorage.setItem('theme', 'dark');
-                                } else {
-                                    document.documentElement.removeAttribute('data-theme');
-                                    themeToggle.innerHTML = '<i class="fas fa-moon"></i>';
-                                    localStorage.setItem('theme', 'light');
-                                }
-                            }
-
-                            // Appliquer le thème initial sans transition (instant=true)
-                            const savedTheme = localStorage.getItem('theme');
-                            if (savedTheme) {
-                                setTheme(savedTheme, true);
-                            }
-
-                            // Basculer le thème au clic sur le bouton
-                            themeToggle.addEventListener('click', () => {
-                                const currentTheme = document.documentElement.getAttribute('data-theme');
-                                setTheme(currentTheme === 'dark' ? 'light' : 'dark');
-                            });
-                        }
-                    });
-                </script>
-            """
-            # Injecter les styles CSS pour le bouton de mode sombre directement dans le HTML
-            dark_mode_styles = """
+import gzip
+import json
+from hashlib import md5
+from typing import Callable, Dict, Optional, Set, Tuple
+
+try:
+    import brotli
+except ImportError:  # compression brotli optionnelle
+    brotli = None
+
+# Styles du bouton de mode sombre, injectés dans la page servie en mode live
+DARK_MODE_STYLES = """
                 <style>
                     /* Variables CSS pour le mode clair et sombre */
                     :root {
@@ -330,15 +153,428 @@ class LiveEditor:
                 </style>
             """
 
-            # Injecter les styles et le script
-            content = content.replace('</head>', f'{dark_mode_styles}</head>')
-            content = content.replace('</body>', f'{ws_script}</body>')
+# Script de rechargement par WebSocket et de bascule du thème
+LIVE_RELOAD_SCRIPT = """
+                <script>
+                    // Sauvegarder le thème actuel avant le rechargement
+                    function saveCurrentTheme() {
+                        const currentTheme = document.documentElement.getAttribute('data-theme');
+                        if (currentTheme) {
+                            localStorage.setItem('theme', currentTheme);
+                        }
+                    }
 
-            return web.Response(text=content, content_type='text/html')
+                    // Configurer la WebSocket (abonnement aux mises à jour de cette page)
+                    const wsUrl = `ws://${location.host}/ws?page=${encodeURIComponent(location.pathname)}`;
+                    let ws = new WebSocket(wsUrl);
+
+                    // Recharger les feuilles de style sans recharger la page
+                    function reloadStylesheets() {
+                        document.querySelectorAll('link[rel="stylesheet"]').forEach(link => {
+                            const url = new URL(link.href);
+                            url.searchParams.set('v', Date.now());
+                            link.href = url.toString();
+                        });
+                    }
+
+                    // Colorer le code des nœuds insérés par un correctif
+                    function highlightNodes(nodes) {
+                        if (typeof hljs === 'undefined') return;
+                        nodes.forEach(node => {
+                            if (node.nodeType !== Node.ELEMENT_NODE) return;
+                            const blocks = node.matches('code') ? [node] : node.querySelectorAll('code');
+                            blocks.forEach(block => hljs.highlightElement(block));
+                        });
+                    }
+
+                    // Appliquer les blocs modifiés ; false si la page n'est plus synchronisée
+                    function applyPatch(message) {
+                        const main = document.querySelector('main.content');
+                        if (!main || main.childNodes.length !== message.base) return false;
+
+                        const inserted = [];
+                        // Les opérations arrivent par indices décroissants
+                        message.ops.forEach(op => {
+                            const reference = main.childNodes[op.index + op.remove] || null;
+                            for (let i = 0; i < op.remove; i++) {
+                                main.removeChild(main.childNodes[op.index]);
+                            }
+                            const template = document.createElement('template');
+                            template.innerHTML = op.html;
+                            inserted.push(...template.content.childNodes);
+                            main.insertBefore(template.content, reference);
+                        });
+                        if (main.childNodes.length !== message.count) return false;
+
+                        if (message.navigation !== null) {
+                            const list = document.querySelector('#panneau-arborescence .navigation-list');
+                            if (!list) return false;
+                            list.innerHTML = message.navigation;
+                        }
+                        highlightNodes(inserted);
+                        if (window.paginateTables) window.paginateTables(inserted);
+                        return true;
+                    }
+
+                    ws.onmessage = function(event) {
+                        const message = JSON.parse(event.data);
+                        if (message.type === 'css') {
+                            reloadStylesheets();
+                        } else if (message.type === 'patch' && applyPatch(message)) {
+                            return;
+                        } else if (message.type === 'reload' || message.type === 'patch') {
+                            // Sauvegarder le thème actuel
+                            saveCurrentTheme();
+
+                            // Ajouter une classe pour la transition fluide
+                            document.documentElement.classList.add('theme-transition');
+
+                            // Recharger la page après un court délai pour permettre la sauvegarde
+                            setTimeout(() => {
+                                location.reload();
+                            }, 50);
+                        }
+                    };
+                    ws.onclose = function() {
+                        setTimeout(() => {
+                            ws = new WebSocket(wsUrl);
+                        }, 1000);
+                    };
+
+                    // S'assurer que le bouton de mode sombre est créé en mode live
+                    document.addEventListener("DOMContentLoaded", () => {
+                        // Vérifier si le bouton existe déjà
+                        if (!document.querySelector('.theme-toggle')) {
+                            // Créer le bouton de bascule du thème
+                            const themeToggle = document.createElement('button');
+                            themeToggle.className = 'theme-toggle';
+
+                            // Déterminer l'icône en fonction du thème actuel
+                            const currentTheme = document.documentElement.getAttribute('data-theme');
+                            themeToggle.innerHTML = currentTheme === 'dark' ?
+                                '<i class="fas fa-sun"></i>' :
+                                '<i class="fas fa-moon"></i>';
+
+                            themeToggle.setAttribute('aria-label', 'Basculer entre le mode clair et sombre');
+                            document.body.appendChild(themeToggle);
+
+                            // Fonction pour définir le thème avec transition fluide
+                            function setTheme(theme, instant = false) {
+                                // Ajouter une classe de transition si ce n'est pas un changement instantané
+                                if (!instant) {
+                                    document.documentElement.classList.add('theme-transition');
+
+                                    // Retirer la classe après la fin de la transition
+                                    setTimeout(() => {
+                                        document.documentElement.classList.remove('theme-transition');
+                                    }, 300); // Correspond à la durée de transition CSS (0.3s)
+                                }
+
+                                if (theme === 'dark') {
+                                    document.documentElement.setAttribute('data-theme', 'dark');
+                                    themeToggle.innerHTML = '<i class="fas fa-sun"></i>';
+                                    localStorage.setItem('theme', 'dark');
+                                } else {
+                                    document.documentElement.removeAttribute('data-theme');
+                                    themeToggle.innerHTML = '<i class="fas fa-moon"></i>';
+                                    localStorage.setItem('theme', 'light');
+                                }
+                            }
+
+                            // Appliquer le thème initial sans transition (instant=true)
+                            const savedTheme = localStorage.getItem('theme');
+                            if (savedTheme) {
+                                setTheme(savedTheme, true);
+                            }
+
+                            // Basculer le thème au clic sur le bouton
+                            themeToggle.addEventListener('click', () => {
+                                const currentTheme = document.documentElement.getAttribute('data-theme');
+                                setTheme(currentTheme === 'dark' ? 'light' : 'dark');
+                            });
+                        }
+                    });
+                </script>
+            """
+
+def inject_live_tools(content: str) -> str:
+    """Injecte les styles et le script du mode live dans une page convertie."""
+    content = content.replace('</head>', f'{DARK_MODE_STYLES}</head>')
+    return content.replace('</body>', f'{LIVE_RELOAD_SCRIPT}</body>')
+
+class RenderedPage:
+    """Page servie en mode live.
+
+    Les variantes compressées sont calculées à la première requête qui les
+    accepte, jamais pendant la conversion : une mise à jour part vers les
+    navigateurs sans attendre la compression.
+    """
+
+    GZIP_LEVEL = 6
+    BROTLI_QUALITY = 5  # la qualité 11 par défaut coûte des centaines de ms sur une grande page
+
+    def __init__(self, body: bytes, etag: str):
+        self.body = body
+        self.etag = etag
+        self._variants: Dict[str, bytes] = {}
+
+    @classmethod
+    def from_html(cls, content: str) -> 'RenderedPage':
+        body = content.encode('utf-8')
+        return cls(body, f'"{md5(body).hexdigest()}"')
+
+    def encodings(self) -> Tuple[str, ...]:
+        return ('br', 'gzip') if brotli is not None else ('gzip',)
+
+    def compressed(self, encoding: str) -> Optional[bytes]:
+        """Variante déjà calculée, ou None."""
+        if encoding not in self.encodings():
+            return self.body
+        return self._variants.get(encoding)
+
+    def body_for(self, encoding: str) -> bytes:
+        body = self.compressed(encoding)
+        if body is None:
+            if encoding == 'br':
+                body = brotli.compress(self.body, quality=self.BROTLI_QUALITY)
+            else:
+                body = gzip.compress(self.body, compresslevel=self.GZIP_LEVEL)
+            self._variants[encoding] = body
+        return body
+
+def parse_etags(header: str) -> Set[str]:
+    """Liste les ETags d'un en-tête If-None-Match (les ETags faibles sont acceptés)."""
+    tags = set()
+    for tag in header.split(','):
+        tag = tag.strip()
+        if tag.startswith('W/'):
+            tag = tag[2:]
+        if tag:
+            tags.add(tag)
+    return tags
+
+def negotiate_encoding(header: str, available: Tuple[str, ...]) -> str:
+    """Choisit le meilleur encodage accepté par le client parmi ``available``."""
+    accepted: Dict[str, float] = {}
+    for item in header.split(','):
+        name, _, params = item.strip().partition(';')
+        quality = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if name:
+            accepted[name.strip().lower()] = quality
+
+    best, best_quality = 'identity', 0.0
+    for encoding in available:
+        quality = accepted.get(encoding, accepted.get('*', 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+async def page_response(request: web.Request, page: RenderedPage) -> web.Response:
+    """Réponse HTTP d'une page rendue : 304 si l'ETag correspond, sinon variante compressée."""
+    headers = {
+        'ETag': page.etag,
+        'Cache-Control': 'no-cache',
+        'Vary': 'Accept-Encoding'
+    }
+    if page.etag in parse_etags(request.headers.get('If-None-Match', '')):
+        return web.Response(status=304, headers=headers)
+
+    encoding = negotiate_encoding(request.headers.get('Accept-Encoding', ''), page.encodings())
+    if encoding != 'identity':
+        headers['Content-Encoding'] = encoding
+    body = page.compressed(encoding)
+    if body is None:
+        body = await asyncio.to_thread(page.body_for, encoding)
+    return web.Response(
+        body=body,
+        headers=headers,
+        content_type='text/html',
+        charset='utf-8'
+    )
+
+def metrics_response(metrics) -> web.Response:
+    """Mesures du converter au format Prometheus, ou 404 si elles sont désactivées."""
+    if not metrics.enabled:
+        raise web.HTTPNotFound(text="Metrics disabled (metrics.enabled: false)")
+    return web.Response(
+        body=metrics.to_prometheus().encode('utf-8'),
+        headers={'Content-Type': 'text/plain; version=0.0.4; charset=utf-8'}
+    )
+
+class FileChangeHandler(FileSystemEventHandler):
+    """Transmet les modifications des fichiers surveillés, classées par type.
+
+    ``classify`` associe un chemin à un type de changement ('input', 'config',
+    'template', 'asset') ou None pour les fichiers à ignorer ; ``notify`` est
+    appelé depuis le thread du watcher.
+    """
+
+    def __init__(self,
+                 notify: Callable[[str, Path], None],
+                 classify: Callable[[Path], Optional[str]]):
+        self.notify = notify
+        self.classify = classify
+
+    def on_modified(self, event):
+        if not event.is_directory:
+            self._handle(event.src_path)
+
+    def on_created(self, event):
+        if not event.is_directory:
+            self._handle(event.src_path)
+
+    def on_deleted(self, event):
+        if not event.is_directory:
+            self._handle(event.src_path)
+
+    def on_moved(self, event):
+        # Beaucoup d'éditeurs enregistrent via un fichier temporaire renommé
+        if not event.is_directory:
+            self._handle(event.dest_path)
+
+    def _handle(self, src_path: str):
+        path = Path(src_path).resolve()
+        kind = self.classify(path)
+        if kind is not None:
+            self.notify(kind, path)
+
+class LiveEditor:
+    def __init__(self, converter, input_file: str, output_file: str, port: int = 5000):
+        self.converter = converter
+        self.input_file = Path(input_file).resolve()
+        self.output_file = Path(output_file).resolve()
+        self.config_file = Path(converter.config_path).resolve()
+        self.templates_dir = Path(converter.template_path).resolve()
+        self.assets_dir = self.templates_dir / 'assets'
+        self.port = port
+        self.logger = get_logger('live_editor')
+        self.app = web.Application()
+        self.setup_routes()
+        self.ws_clients: Set[web.WebSocketResponse] = set()
+        live_config = converter.config.get('live', {})
+        self.scheduler = ChangeScheduler(
+            self.apply_changes,
+            min_delay=live_config.get('debounce_min', 0.05),
+            max_delay=live_config.get('debounce_max', 1.0)
+        )
+        self.running = True
+        self.observer = None
+        self.page: Optional[RenderedPage] = None
+        self.differ = PageDiffer()
+
+    def setup_routes(self):
+        self.app.router.add_static('/assets/', path=Path('templates/assets'))
+        self.app.router.add_get('/', self.serve_output)
+        self.app.router.add_get('/ws', self.websocket_handler)
+        self.app.router.add_get('/metrics', self.serve_metrics)
+        self.app.on_shutdown.append(self.on_shutdown)
+
+    def classify_change(self, path: Path) -> Optional[str]:
+        """Détermine le type d'un fichier modifié, ou None s'il n'est pas surveillé."""
+        if path == self.input_file:
+            return 'input'
+        if path == self.config_file:
+            return 'config'
+        if path.name.startswith('.') or path.name.endswith('~'):
+            return None  # fichiers temporaires d'éditeur
+        if self.assets_dir in path.parents:
+            return 'asset'
+        if self.templates_dir in path.parents and path.suffix == '.html':
+            return 'template'
+        return None
+
+    async def apply_changes(self, changes: Dict[Path, str]) -> None:
+        """Recharge uniquement les parties concernées puis prévient les navigateurs."""
+        kinds = set(changes.values())
+        assets = [path for path, kind in changes.items() if kind == 'asset']
+        if assets:
+            await self.converter.prepare_assets_async(self.output_file.parent)
+            self.logger.info(f"Live update: {len(assets)} asset(s) changed")
+
+        if 'config' in kinds:
+            await self.converter.reload_config_async()
+        for path, kind in changes.items():
+            if kind == 'template':
+                self.converter.invalidate_template(path.relative_to(self.templates_dir).as_posix())
+
+        # Une feuille de style se recharge sans recharger la page
+        asset_update = {'type': 'css' if all(path.suffix == '.css' for path in assets) else 'reload'}
+        if kinds == {'asset'}:
+            await self.notify_clients(**asset_update)
+            return
+
+        html = await self.converter.convert_async(
+            str(self.input_file),
+            str(self.output_file)
+        )
+        update = await self.refresh_page(html)
+        self.logger.info(
+            f"Live update ({', '.join(sorted(kinds))}): converted {self.input_file} to {self.output_file}"
+        )
+        if update is not None:
+            await self.notify_clients(**update)
+        if assets and (update is None or update['type'] != 'reload'):
+            await self.notify_clients(**asset_update)
+
+    async def websocket_handler(self, request):
+        ws = web.WebSocketResponse(heartbeat=30)
+        await ws.prepare(request)
+        self.ws_clients.add(ws)
+
+        try:
+            async for _ in ws:
+                pass  # We don't expect any incoming messages
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self.ws_clients.discard(ws)
+        return ws
+
+    async def notify_clients(self, type: str = 'reload', **payload):
+        message = json.dumps({'type': type, **payload})
+        dead_clients = set()
+        for ws in self.ws_clients:
+            try:
+                await ws.send_str(message)
+            except Exception as e:
+                self.logger.error(f"Failed to notify client: {str(e)}")
+                dead_clients.add(ws)
+
+        # Clean up dead connections
+        self.ws_clients.difference_update(dead_clients)
+
+    async def refresh_page(self, content: Optional[str] = None) -> Optional[Dict]:
+        """Prépare la page servie à partir de la sortie qui vient d'être rendue.
+
+        ``content`` est la page retournée par la conversion ; la sortie n'est
+        relue que si elle a été convertie en flux. Retourne la mise à jour à
+        envoyer aux navigateurs (voir ``PageDiffer``).
+        """
+        if content is None:
+            async with aiofiles.open(self.output_file, mode='r', encoding='utf-8') as f:
+                content = await f.read()
+        update = await asyncio.to_thread(self.differ.update, content)
+        self.page = RenderedPage.from_html(inject_live_tools(content))
+        return update
+
+    async def serve_output(self, request):
+        try:
+            if self.page is None:
+                await self.refresh_page()
+            return await page_response(request, self.page)
         except Exception as e:
             self.logger.error(f"Error serving output: {str(e)}")
             return web.Response(text="Error loading content", status=500)
 
+    async def serve_metrics(self, request):
+        return metrics_response(self.converter.metrics)
+
     async def on_shutdown(self, app):
         self.running = False
 
@@ -352,38 +588,29 @@ class LiveEditor:
             self.observer.stop()
             self.observer.join(timeout=2)
 
-        # Cancel all tasks
-        for task in self.tasks:
-            task.cancel()
-        await asyncio.gather(*self.tasks, return_exceptions=True)
-        self.tasks.clear()
-
-        # Clear the queue
-        while not self.change_queue.empty():
-            try:
-                self.change_queue.get_nowait()
-                self.change_queue.task_done()
-            except (asyncio.QueueEmpty, ValueError):
-                break
+        # Drop pending changes and cancel the running conversion
+        await self.scheduler.close()
 
     async def start(self):
         # Initial conversion
         try:
-            await self.converter.convert_async(str(self.input_file), str(self.output_file))
+            html = await self.converter.convert_async(str(self.input_file), str(self.output_file))
+            await self.refresh_page(html)
             self.logger.info("Initial conversion completed")
         except Exception as e:
             self.logger.error(f"Initial conversion failed: {str(e)}")
             raise
 
-        # Start the change processor
-        processor_task = asyncio.create_task(self.process_changes())
-        self.tasks.add(processor_task)
-        processor_task.add_done_callback(self.tasks.discard)
+        # Start the change scheduler
+        self.scheduler.start()
 
-        # Setup file watcher
-        event_handler = FileChangeHandler(self.change_queue, self.input_file)
+        # Setup file watcher: entrée, configuration, templates et assets
+        event_handler = FileChangeHandler(self.scheduler.notify, self.classify_change)
         self.observer = Observer()
-        self.observer.schedule(event_handler, str(self.input_file.parent), recursive=False)
+        self.observer.schedule(event_handler, str(self.templates_dir), recursive=True)
+        for directory in {self.input_file.parent, self.config_file.parent}:
+            if directory != self.templates_dir and self.templates_dir not in directory.parents:
+                self.observer.schedule(event_handler, str(directory), recursive=False)
         self.observer.start()
 
         # Start web server
@@ -396,7 +623,9 @@ class LiveEditor:
         webbrowser.open(f'http://localhost:{self.port}')
 
         self.logger.info(f"Live editing server started at http://localhost:{self.port}")
-        self.logger.info(f"Watching for changes in {self.input_file}")
+        self.logger.info(
+            f"Watching for changes in {self.input_file}, {self.config_file} and {self.templates_dir}"
+        )
 
         try:
             while self.running:
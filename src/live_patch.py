@@ -0,0 +1,242 @@
+import re
+from bisect import bisect_left, bisect_right
+from difflib import SequenceMatcher
+from typing import Dict, Iterator, List, Optional, Tuple
+from .utils.strings import common_prefix_length, common_suffix_length
+
+# Zones de la page mises à jour sans rechargement
+MAIN_OPEN = '<main class="content">'
+MAIN_CLOSE = '</main>'
+NAVIGATION_OPEN = '<ul class="navigation-list">'
+NAVIGATION_CLOSE = '</ul>'
+
+# Commentaire, ou balise ouvrante ou fermante (attributs entre guillemets compris)
+_MARKUP = re.compile(
+    r'<!--.*?-->'
+    r'|<(/?)([A-Za-z][A-Za-z0-9-]*)((?:"[^"]*"|\'[^\']*\'|[^\'"<>])*)>',
+    re.DOTALL
+)
+_VOID_ELEMENTS = {
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+    'link', 'meta', 'source', 'track', 'wbr'
+}
+_RAW_TEXT_ELEMENTS = {'script', 'style', 'textarea', 'title'}
+
+def _find_strays(markup: str, start: int, end: int, strays: List[int]) -> None:
+    stray = markup.find('<', start, end)
+    while stray >= 0:
+        strays.append(stray)
+        stray = markup.find('<', stray + 1, end)
+
+def _is_text(markup: str, start: int, end: int) -> bool:
+    """Indique si le nœud ``markup[start:end]`` est du texte (une fermante isolée en fait partie)."""
+    match = _MARKUP.match(markup, start, end)
+    return match is None or bool(match.group(1))
+
+def iter_boundaries(markup: str, start: int = 0, strays: Optional[List[int]] = None) -> Iterator[int]:
+    """Positions de fin des nœuds de premier niveau (éléments, commentaires, texte).
+
+    ``start`` doit être une frontière de nœud (ou 0). Chaque nœud correspond
+    à un nœud de ``childNodes`` côté navigateur tant que le balisage est
+    bien formé ; le client vérifie le nombre de nœuds et recharge la page sinon.
+    Les ``<`` restés du texte (``<!--`` sans fin...) sont ajoutés à ``strays``,
+    avant la frontière qui les suit.
+    """
+    depth = 0
+    raw_text: Optional[str] = None
+    scanned = start
+
+    for match in _MARKUP.finditer(markup, start):
+        if strays is not None and match.start() > scanned:
+            _find_strays(markup, scanned, match.start(), strays)
+        scanned = match.end()
+        closing, name, attributes = match.group(1), match.group(2), match.group(3)
+
+        if raw_text is not None:
+            # Contenu de <script>/<style> : seule la balise fermante compte
+            if closing and name.lower() == raw_text:
+                raw_text = None
+                depth -= 1
+                if depth == 0:
+                    yield match.end()
+                    start = match.end()
+            continue
+
+        if name is None or (not closing and (name.lower() in _VOID_ELEMENTS or attributes.endswith('/'))):
+            # Commentaire ou élément sans contenu
+            if depth == 0:
+                if match.start() > start:
+                    yield match.start()
+                yield match.end()
+                start = match.end()
+            continue
+
+        if not closing:
+            if depth == 0:
+                if match.start() > start:
+                    yield match.start()
+                start = match.start()
+            depth += 1
+            if name.lower() in _RAW_TEXT_ELEMENTS:
+                raw_text = name.lower()
+        elif depth > 0:
+            depth -= 1
+            if depth == 0:
+                yield match.end()
+                start = match.end()
+
+    if strays is not None:
+        _find_strays(markup, scanned, len(markup), strays)
+    if start < len(markup):
+        yield len(markup)
+
+def split_fragments(markup: str) -> List[str]:
+    """Découpe un fragment HTML en nœuds de premier niveau (voir ``iter_boundaries``)."""
+    fragments: List[str] = []
+    start = 0
+    for end in iter_boundaries(markup):
+        fragments.append(markup[start:end])
+        start = end
+    return fragments
+
+def extract_regions(page: str) -> Optional[Tuple[str, str, str]]:
+    """Sépare une page en (gabarit, navigation, contenu), ou None si les zones sont absentes."""
+    main_start = page.find(MAIN_OPEN)
+    main_end = page.rfind(MAIN_CLOSE)
+    nav_start = page.find(NAVIGATION_OPEN)
+    if main_start < 0 or main_end < main_start or not 0 <= nav_start < main_start:
+        return None
+    main_start += len(MAIN_OPEN)
+    nav_start += len(NAVIGATION_OPEN)
+    nav_end = page.find(NAVIGATION_CLOSE, nav_start)
+    if not 0 <= nav_end < main_start:
+        return None
+
+    shell = page[:nav_start] + page[nav_end:main_start] + page[main_end:]
+    return shell, page[nav_start:nav_end], page[main_start:main_end]
+
+def diff_fragments(old: List[str], new: List[str], offset: int = 0) -> List[Dict]:
+    """Opérations transformant ``old`` en ``new``, par indices décroissants de ``old``.
+
+    ``offset`` est ajouté aux indices lorsque les listes ne couvrent qu'une
+    partie du contenu.
+    """
+    # Préfixe et suffixe communs écartés avant le diff (cas d'une édition locale)
+    prefix = 0
+    limit = min(len(old), len(new))
+    while prefix < limit and old[prefix] == new[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and old[-1 - suffix] == new[-1 - suffix]:
+        suffix += 1
+
+    old_middle = old[prefix:len(old) - suffix]
+    new_middle = new[prefix:len(new) - suffix]
+    operations = []
+    matcher = SequenceMatcher(None, old_middle, new_middle, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag != 'equal':
+            operations.append({
+                'index': offset + prefix + i1,
+                'remove': i2 - i1,
+                'html': ''.join(new_middle[j1:j2])
+            })
+    operations.reverse()
+    return operations
+
+class PageDiffer:
+    """Calcule le message envoyé aux navigateurs entre deux rendus successifs.
+
+    Seule la zone modifiée du contenu est redécoupée : le découpage reprend à
+    une frontière de nœud avant la première différence et s'arrête dès qu'il
+    retombe sur une frontière du rendu précédent dans la partie commune finale.
+    Il reprend plus tôt quand le nœud précédent est du texte, ou qu'un ``<``
+    resté du texte précède la modification : le découpage obtenu est toujours
+    celui d'un découpage complet.
+    """
+
+    def __init__(self):
+        self.shell: Optional[str] = None
+        self.navigation: Optional[str] = None
+        self.content: Optional[str] = None
+        self.bounds: List[int] = []
+        # Positions des ``<`` restés du texte : une édition plus loin peut
+        # en faire un commentaire ou une balise (``-->`` ou ``>`` ajouté)
+        self.strays: List[int] = []
+
+    @property
+    def fragments(self) -> Optional[List[str]]:
+        if self.content is None:
+            return None
+        starts = [0] + self.bounds[:-1]
+        return [self.content[start:end] for start, end in zip(starts, self.bounds)]
+
+    def update(self, page: str) -> Optional[Dict]:
+        """Retourne un message 'patch' ou 'reload', ou None si la page n'a pas changé."""
+        regions = extract_regions(page)
+        if regions is None:
+            self.shell = self.navigation = self.content = None
+            self.bounds, self.strays = [], []
+            return {'type': 'reload'}
+
+        shell, navigation, content = regions
+        if shell != self.shell or self.content is None:
+            self.shell, self.navigation, self.content = shell, navigation, content
+            self.strays = []
+            self.bounds = list(iter_boundaries(content, 0, self.strays))
+            return {'type': 'reload'}
+
+        navigation_changed = navigation != self.navigation
+        base = len(self.bounds)
+        operations = self._diff_content(content)
+        self.navigation = navigation
+        if not operations and not navigation_changed:
+            return None
+        return {
+            'type': 'patch',
+            'base': base,
+            'count': len(self.bounds),
+            'ops': operations,
+            'navigation': navigation if navigation_changed else None
+        }
+
+    def _diff_content(self, content: str) -> List[Dict]:
+        old, old_bounds = self.content, self.bounds
+        if content == old:
+            return []
+
+        prefix = common_prefix_length(old, content)
+        suffix = common_suffix_length(old, content, min(len(old), len(content)) - prefix)
+        # Reprise au début du nœud contenant la dernière balise avant la différence
+        first = bisect_left(old_bounds, max(old.rfind('<', 0, prefix), 0))
+        if self.strays and self.strays[0] < prefix:
+            # Le découpage peut changer dès le premier ``<`` resté du texte
+            first = min(first, bisect_right(old_bounds, self.strays[0]))
+        if first > 0 and _is_text(old, old_bounds[first - 2] if first > 1 else 0, old_bounds[first - 1]):
+            first -= 1  # un texte s'arrête à la balise suivante, peut-être supprimée
+        restart = old_bounds[first - 1] if first > 0 else 0
+        shift = len(content) - len(old)
+
+        new_bounds: List[int] = []
+        new_strays: List[int] = []
+        last = len(old_bounds) - 1
+        tail_strays: List[int] = []
+        for end in iter_boundaries(content, restart, new_strays):
+            new_bounds.append(end)
+            if end >= len(content) - suffix:
+                # Frontière alignée sur l'ancien rendu : la suite est identique
+                index = bisect_left(old_bounds, end - shift)
+                if index < len(old_bounds) and old_bounds[index] == end - shift:
+                    last = index
+                    tail_strays = [
+                        stray + shift for stray in self.strays[bisect_left(self.strays, end - shift):]
+                    ]
+                    break
+
+        old_fragments = [old[start:end] for start, end in zip([restart] + old_bounds[first:last], old_bounds[first:last + 1])]
+        new_fragments = [content[start:end] for start, end in zip([restart] + new_bounds[:-1], new_bounds)]
+
+        self.content = content
+        self.bounds = old_bounds[:first] + new_bounds + [bound + shift for bound in old_bounds[last + 1:]]
+        self.strays = self.strays[:bisect_left(self.strays, restart)] + new_strays + tail_strays
+        return diff_fragments(old_fragments, new_fragments, first)
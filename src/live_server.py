@@ -0,0 +1,288 @@
+import asyncio
+import json
+import webbrowser
+from dataclasses import dataclass
+from html import escape
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import unquote
+from aiohttp import web
+from watchdog.observers import Observer
+from .caches import LRUCache
+from .change_scheduler import ChangeScheduler
+from .live_editor import FileChangeHandler, RenderedPage, inject_live_tools, metrics_response, page_response
+from .live_patch import PageDiffer
+from .utils.logging_utils import get_logger
+
+@dataclass
+class LivePage:
+    """Page rendue en mémoire et état du diff envoyé à ses abonnés."""
+    input_path: Path
+    rendered: RenderedPage
+    differ: PageDiffer
+
+class LiveServer:
+    """Serveur live pour un dossier complet.
+
+    Chaque fichier d'entrée est rendu à la demande à ``/<page>`` (chemin
+    relatif, extension ``.html``) et gardé en mémoire dans un LRU. Les
+    navigateurs s'abonnent à la page qu'ils affichent : un enregistrement ne
+    prévient que les clients de la page concernée.
+    """
+
+    def __init__(self, converter, input_dir: str, port: int = 5000):
+        self.converter = converter
+        self.input_dir = Path(input_dir).resolve()
+        if not self.input_dir.is_dir():
+            raise NotADirectoryError(f"Dossier d'entrée introuvable : {self.input_dir}")
+        self.config_file = Path(converter.config_path).resolve()
+        self.templates_dir = Path(converter.template_path).resolve()
+        self.assets_dir = self.templates_dir / 'assets'
+        self.port = port
+        self.logger = get_logger('live_server')
+
+        build_config = converter.config.get('build', {})
+        self.extensions = [ext.lower() for ext in build_config.get('extensions', ['.html', '.txt'])]
+        live_config = converter.config.get('live', {})
+        self.pages = LRUCache(live_config.get('page_cache_size', 16))
+        self.subscribers: Dict[str, Set[web.WebSocketResponse]] = {}
+        self.render_lock = asyncio.Lock()
+        self.scheduler = ChangeScheduler(
+            self.apply_changes,
+            min_delay=live_config.get('debounce_min', 0.05),
+            max_delay=live_config.get('debounce_max', 1.0)
+        )
+
+        self.app = web.Application()
+        self.setup_routes()
+        self.running = True
+        self.observer = None
+
+    def setup_routes(self):
+        self.app.router.add_static('/assets/', path=self.assets_dir)
+        self.app.router.add_get('/ws', self.websocket_handler)
+        self.app.router.add_get('/metrics', self.serve_metrics)
+        self.app.router.add_get('/', self.serve_index)
+        self.app.router.add_get('/{page:.+}', self.serve_page)
+        self.app.on_shutdown.append(self.on_shutdown)
+
+    def page_name(self, input_path: Path) -> str:
+        return input_path.relative_to(self.input_dir).with_suffix('.html').as_posix()
+
+    def resolve_page(self, name: str) -> Optional[Path]:
+        """Retourne le fichier d'entrée d'une page, ou None s'il n'existe pas."""
+        if not name.endswith('.html'):
+            return None
+        candidate = (self.input_dir / name).resolve()
+        if self.input_dir not in candidate.parents:
+            return None  # chemin hors du dossier d'entrée
+        for extension in self.extensions:
+            input_path = candidate.with_suffix(extension)
+            if input_path.is_file():
+                return input_path
+        return None
+
+    def list_pages(self) -> List[str]:
+        return sorted({
+            self.page_name(path) for path in self.input_dir.rglob('*')
+            if path.is_file() and path.suffix.lower() in self.extensions and not path.name.startswith('.')
+        })
+
+    def classify_change(self, path: Path) -> Optional[str]:
+        """Détermine le type d'un fichier modifié, ou None s'il n'est pas surveillé."""
+        if path == self.config_file:
+            return 'config'
+        if path.name.startswith('.') or path.name.endswith('~'):
+            return None  # fichiers temporaires d'éditeur
+        if self.assets_dir in path.parents:
+            return 'asset'
+        if self.templates_dir in path.parents:
+            return 'template' if path.suffix == '.html' else None
+        if self.input_dir in path.parents and path.suffix.lower() in self.extensions:
+            return 'input'
+        return None
+
+    def _build_page(self, name: str, input_path: Path) -> Tuple[str, RenderedPage]:
+        html = self.converter.render_page(
+            str(input_path), str(self.input_dir / name), assets_root=self.input_dir
+        )
+        return html, RenderedPage.from_html(inject_live_tools(html))
+
+    async def get_page(self, name: str) -> Optional[LivePage]:
+        """Page en mémoire, rendue à la première demande."""
+        page = self.pages.get(name)
+        if page is not None:
+            return page
+        input_path = self.resolve_page(name)
+        if input_path is None:
+            return None
+
+        async with self.render_lock:
+            page = self.pages.get(name)  # rendue entre-temps par une autre requête
+            if page is None:
+                html, rendered = await asyncio.to_thread(self._build_page, name, input_path)
+                page = LivePage(input_path, rendered, PageDiffer())
+                page.differ.update(html)
+                self.pages.put(name, page)
+                self.logger.info(f"Rendered {input_path} as /{name}")
+        return page
+
+    async def refresh_page(self, name: str) -> Optional[Dict]:
+        """Rend à nouveau une page et retourne la mise à jour à envoyer à ses abonnés."""
+        previous = self.pages.pop(name)
+        input_path = self.resolve_page(name)
+        if input_path is None:
+            return {'type': 'reload'}  # page supprimée : les clients obtiendront une 404
+
+        async with self.render_lock:
+            html, rendered = await asyncio.to_thread(self._build_page, name, input_path)
+        differ = previous.differ if previous is not None else PageDiffer()
+        update = await asyncio.to_thread(differ.update, html)
+        self.pages.put(name, LivePage(input_path, rendered, differ))
+        return update
+
+    async def apply_changes(self, changes: Dict[Path, str]) -> None:
+        """Met à jour les pages touchées par les modifications et prévient leurs abonnés."""
+        kinds = set(changes.values())
+        if 'config' in kinds:
+            # Aucune page rendue pendant le rechargement, même si ce lot est annulé
+            async with self.render_lock:
+                await self.converter.reload_config_async()
+        for path, kind in changes.items():
+            if kind == 'template':
+                self.converter.invalidate_template(path.relative_to(self.templates_dir).as_posix())
+
+        if kinds & {'config', 'template'}:
+            names = set(self.pages.keys()) | set(self.subscribers)
+        else:
+            names = {self.page_name(path) for path, kind in changes.items() if kind == 'input'}
+
+        for name in sorted(names):
+            if not self.subscribers.get(name):
+                # Personne ne l'affiche : elle sera rendue à la prochaine visite
+                self.pages.pop(name)
+                continue
+            update = await self.refresh_page(name)
+            self.logger.info(f"Live update: /{name}")
+            if update is not None:
+                await self.notify_page(name, **update)
+
+        assets = [path for path, kind in changes.items() if kind == 'asset']
+        if assets:
+            # Les assets sont servis directement depuis les templates
+            css_only = all(path.suffix == '.css' for path in assets)
+            for name in list(self.subscribers):
+                await self.notify_page(name, 'css' if css_only else 'reload')
+
+    async def serve_index(self, request):
+        if self.resolve_page('index.html') is not None:
+            raise web.HTTPFound('/index.html')
+        items = ''.join(
+            f'<li><a href="/{escape(name)}">{escape(name)}</a></li>' for name in self.list_pages()
+        )
+        return web.Response(
+            text=f'<!DOCTYPE html><html lang="fr"><head><meta charset="utf-8"><title>Pages</title></head>'
+                 f'<body><h1>Pages</h1><ul>{items}</ul></body></html>',
+            content_type='text/html'
+        )
+
+    async def serve_page(self, request):
+        name = request.match_info['page']
+        try:
+            page = await self.get_page(name)
+        except Exception as e:
+            self.logger.error(f"Error rendering /{name}: {str(e)}")
+            return web.Response(text="Error loading content", status=500)
+        if page is None:
+            raise web.HTTPNotFound()
+        return await page_response(request, page.rendered)
+
+    async def serve_metrics(self, request):
+        return metrics_response(self.converter.metrics)
+
+    async def websocket_handler(self, request):
+        # Le script envoie encodeURIComponent(location.pathname) : le chemin, déjà
+        # encodé par le navigateur, reste encodé une fois après lecture de la requête
+        name = unquote(request.query.get('page', '/')).lstrip('/') or 'index.html'
+        ws = web.WebSocketResponse(heartbeat=30)
+        await ws.prepare(request)
+        self.subscribers.setdefault(name, set()).add(ws)
+
+        try:
+            async for _ in ws:
+                pass  # We don't expect any incoming messages
+        except asyncio.CancelledError:
+            pass
+        finally:
+            clients = self.subscribers.get(name)
+            if clients is not None:
+                clients.discard(ws)
+                if not clients:
+                    del self.subscribers[name]
+        return ws
+
+    async def notify_page(self, name: str, type: str = 'reload', **payload):
+        message = json.dumps({'type': type, **payload})
+        clients = self.subscribers.get(name, set())
+        dead_clients = set()
+        for ws in clients:
+            try:
+                await ws.send_str(message)
+            except Exception as e:
+                self.logger.error(f"Failed to notify client: {str(e)}")
+                dead_clients.add(ws)
+
+        # Clean up dead connections
+        clients.difference_update(dead_clients)
+
+    async def on_shutdown(self, app):
+        self.running = False
+
+        # Close all WebSocket connections
+        for clients in list(self.subscribers.values()):
+            for ws in set(clients):
+                await ws.close(code=1000, message='Server shutdown')
+        self.subscribers.clear()
+
+        # Stop the file watcher
+        if self.observer:
+            self.observer.stop()
+            self.observer.join(timeout=2)
+
+        # Drop pending changes and cancel the running conversion
+        await self.scheduler.close()
+
+    async def start(self):
+        self.scheduler.start()
+
+        # Setup file watcher: dossier d'entrée, configuration, templates et assets
+        event_handler = FileChangeHandler(self.scheduler.notify, self.classify_change)
+        self.observer = Observer()
+        watched: List[Path] = []
+        for directory in (self.input_dir, self.templates_dir):
+            if not any(parent == directory or parent in directory.parents for parent in watched):
+                self.observer.schedule(event_handler, str(directory), recursive=True)
+                watched.append(directory)
+        if not any(parent == self.config_file.parent or parent in self.config_file.parents for parent in watched):
+            self.observer.schedule(event_handler, str(self.config_file.parent), recursive=False)
+        self.observer.start()
+
+        # Start web server
+        runner = web.AppRunner(self.app)
+        await runner.setup()
+        site = web.TCPSite(runner, 'localhost', self.port)
+        await site.start()
+
+        # Open browser
+        webbrowser.open(f'http://localhost:{self.port}')
+
+        self.logger.info(f"Live server started at http://localhost:{self.port}")
+        self.logger.info(f"Serving {len(self.list_pages())} page(s) from {self.input_dir}")
+
+        try:
+            while self.running:
+                await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            self.logger.info("Shutting down live server...")
+        finally:
+            await runner.cleanup()
@@ -0,0 +1,108 @@
+"""Motifs de la section ``patterns`` de la configuration, compilés une fois.
+
+Le registre valide chaque motif au chargement de la configuration (syntaxe,
+groupes utilisés par les processeurs, pas de correspondance vide) et remet
+aux processeurs les objets compilés : aucune recompilation ni recherche dans
+le cache de ``re`` pendant la conversion.
+"""
+import re
+from typing import Dict, Iterator, Mapping, Optional, Pattern, Tuple
+
+DEFAULT_PATTERNS: Dict[str, str] = {
+    'title': r'(<(h[1-6]|p|ul|ol|code|table)[^>]*>.*?</\2>)',
+    'code': r'(<code>)(.*?)(</code>)',
+    'lists': r'\{(.*?)\}',
+    'table': r'<table>(.*?)</table>',
+    'table_row': r'\[\[(.*?)\]\]',
+    'table_cell': r'\|',
+}
+
+PATTERN_FLAGS: Dict[str, int] = {
+    'title': re.MULTILINE | re.DOTALL,
+    'table': re.DOTALL,
+}
+
+# Groupe capturant lu par le processeur : contenu du bloc, de la ligne...
+REQUIRED_GROUPS: Dict[str, int] = {
+    'code': 3,
+    'lists': 1,
+    'table': 1,
+    'table_row': 1,
+}
+
+_SPECIAL = set('.^$*+?{}[]|()')
+_DELIMITED = re.compile(r'(.+)\(\.\*\?\)(.+)')
+
+def literal_text(source: str) -> Optional[str]:
+    r"""Texte d'un motif sans métacaractère (``\|`` -> ``|``), sinon None."""
+    chars = []
+    escaped = False
+    for char in source:
+        if escaped:
+            if char.isalnum():
+                return None  # \d, \b, \1... : classe ou assertion
+            chars.append(char)
+            escaped = False
+        elif char == '\\':
+            escaped = True
+        elif char in _SPECIAL:
+            return None
+        else:
+            chars.append(char)
+    return None if escaped or not chars else ''.join(chars)
+
+def delimiters(source: str) -> Optional[Tuple[str, str]]:
+    r"""Délimiteurs d'un motif ``<ouvrant>(.*?)<fermant>`` littéral (``\[\[(.*?)\]\]``), sinon None."""
+    match = _DELIMITED.fullmatch(source)
+    if match is None:
+        return None
+    opening, closing = literal_text(match.group(1)), literal_text(match.group(2))
+    return (opening, closing) if opening is not None and closing is not None else None
+
+class PatternRegistry:
+    """Motifs compilés et validés, accessibles par nom (``patterns['code']``).
+
+    Les noms absents de la configuration reprennent ``DEFAULT_PATTERNS`` ;
+    un nom inconnu ou un motif invalide lève ``ValueError``.
+    """
+
+    def __init__(self, patterns: Optional[Mapping[str, str]] = None):
+        patterns = dict(patterns or {})
+        unknown = sorted(set(patterns) - set(DEFAULT_PATTERNS))
+        if unknown:
+            raise ValueError(f"Motif inconnu : {', '.join(unknown)}")
+        self.sources: Dict[str, str] = {**DEFAULT_PATTERNS, **patterns}
+        self._compiled: Dict[str, Pattern] = {
+            name: self._compile(name, source) for name, source in self.sources.items()
+        }
+
+    @staticmethod
+    def _compile(name: str, source: str) -> Pattern:
+        if not isinstance(source, str) or not source:
+            raise ValueError(f"Motif '{name}' vide ou invalide")
+        try:
+            pattern = re.compile(source, PATTERN_FLAGS.get(name, 0))
+        except re.error as e:
+            raise ValueError(f"Motif '{name}' invalide ({source}) : {e}")
+        required = REQUIRED_GROUPS.get(name, 0)
+        if pattern.groups < required:
+            raise ValueError(f"Motif '{name}' : {required} groupe(s) capturant(s) attendu(s), {pattern.groups} trouvé(s)")
+        if pattern.search('') is not None:
+            raise ValueError(f"Motif '{name}' : correspond à une chaîne vide")
+        return pattern
+
+    def __getitem__(self, name: str) -> Pattern:
+        return self._compiled[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._compiled)
+
+    def literal(self, name: str) -> Optional[str]:
+        """Texte du motif s'il ne contient aucun métacaractère : ``str.split`` suffit alors."""
+        return literal_text(self.sources[name])
+
+    def delimiters(self, name: str) -> Optional[Tuple[str, str]]:
+        """Délimiteurs littéraux d'un motif ``ouvrant(.*?)fermant`` : ``str.find`` suffit alors."""
+        return delimiters(self.sources[name])
+
+DEFAULT_REGISTRY = PatternRegistry()
@@ -1,70 +1,175 @@
 from .interfaces import IContentProcessor
-from bs4 import BeautifulSoup
-import re
+from .patterns import DEFAULT_REGISTRY, PatternRegistry
+from typing import Iterator, List, Optional
+import io
 import html
 
 class CodeProcessor(IContentProcessor):
+    """Échappe le contenu des blocs ``patterns.code``."""
+
+    def __init__(self, patterns: Optional[PatternRegistry] = None):
+        self.use_patterns(patterns or DEFAULT_REGISTRY)
+
+    def use_patterns(self, patterns: PatternRegistry) -> None:
+        self.pattern = patterns['code']
+
     def process(self, content: str) -> str:
-        if "<code>" not in content:
+        if "<code" not in content:
             return content
-        return re.sub(
-            r'(<code>)(.*?)(</code>)',
-            lambda m: f"<code>{html.escape(m.group(2))}</code>",
+        return self.pattern.sub(
+            lambda m: f"{m.group(1)}{html.escape(m.group(2))}{m.group(3)}",
             content
         )
 
 class ListProcessor(IContentProcessor):
+    """Convertit les éléments ``patterns.lists`` (``{a,b}``) en ``<li>``."""
+
+    def __init__(self, patterns: Optional[PatternRegistry] = None):
+        self.use_patterns(patterns or DEFAULT_REGISTRY)
+
+    def use_patterns(self, patterns: PatternRegistry) -> None:
+        self.pattern = patterns['lists']
+
     def process(self, content: str) -> str:
         if not any(tag in content for tag in ['<ul>', '<ol>']):
             return content
-        content = re.sub(
-            r'\{(.*?)\}',
+        content = self.pattern.sub(
             lambda m: f"<li>{'</li><li>'.join(m.group(1).split(','))}</li>",
             content
         )
         return f"<ul>{content}</ul>" if not ("<ul>" in content or "<ol>" in content) else content
 
+def iter_table_lines(content: str, opening: str = '<table>', closing: str = '</table>') -> Iterator[str]:
+    """Lignes non vides d'un tableau, sans aucune de ses balises ``<table>``, une à la fois."""
+    for line in io.StringIO(content, newline='\n'):
+        if opening in line or closing in line:
+            line = line.replace(opening, '').replace(closing, '')
+        line = line.strip()
+        if line:
+            yield line
+
 class TableProcessor(IContentProcessor):
+    """Convertit les lignes ``[[a|b]]`` d'un tableau en HTML.
+
+    Le tableau, ses lignes et ses cellules suivent ``patterns.table``,
+    ``patterns.table_row`` et ``patterns.table_cell``. Les lignes sont lues
+    une par une et écrites dans un seul tampon. Si ``page_size`` est positif,
+    un tableau plus long est découpé en sections ``<tbody data-page="N">`` de
+    ``page_size`` lignes, paginées par script.js.
+    """
+
+    def __init__(self, page_size: int = 0, patterns: Optional[PatternRegistry] = None):
+        self.page_size = page_size
+        self.use_patterns(patterns or DEFAULT_REGISTRY)
+
+    def use_patterns(self, patterns: PatternRegistry) -> None:
+        self.table_pattern = patterns['table']
+        self.row_pattern = patterns['table_row']
+        self.cell_pattern = patterns['table_cell']
+        # Motifs littéraux (les valeurs par défaut) : str.find et str.split
+        # donnent le même résultat que les regex, sans leur coût par ligne
+        self._table_delimiters = patterns.delimiters('table')
+        self._row_delimiters = patterns.delimiters('table_row')
+        self._cell_separator = patterns.literal('table_cell')
+
     def process(self, content: str) -> str:
-        if "<table>" not in content:
+        if "<table" not in content:
+            return content
+        lines = self._table_lines(content)
+        if lines is None:
             return content
 
-        content = content.replace('<table>', '').replace('</table>', '').strip()
-        lines = [line.strip() for line in content.split('\n') if line.strip()]
-
-        html_parts = ['<table class="content-table">']
+        out: List[str] = ['<div class="table-responsive">\n<table class="content-table">']
         tbody_open = False
+        first_tbody: Optional[int] = None  # position du premier <tbody>, numéroté si le tableau est paginé
+        rows = 0
+        page = 1
 
         for line in lines:
-            if line.startswith('<thead>'):
-                html_parts.append(self._process_header(line))
-                tbody_open = True  # _process_header opens <tbody>
-            elif line.startswith('<tbody>') or line.startswith('</tbody>'):
+            if line[0] == '<' and line.startswith(('<thead>', '<tbody>', '</tbody>')):
+                if line.startswith('<thead>'):
+                    out.append('\n')
+                    if self._write_header(out, line):
+                        first_tbody = len(out)
+                        out.append('<tbody>')
+                    tbody_open = True
                 # Skip explicit tbody tags from the input
                 continue
-            elif '[[' in line and ']]' in line:
+            # Plusieurs lignes de tableau peuvent partager une ligne de texte
+            for row in self._line_rows(line):
                 if not tbody_open:
-                    html_parts.append('<tbody>')
+                    first_tbody = len(out) + 1
+                    out.extend(('\n', '<tbody>'))
                     tbody_open = True
-                html_parts.append(self._process_row(line))
+                elif self.page_size > 0 and rows and rows % self.page_size == 0:
+                    if page == 1 and first_tbody is not None:
+                        out[first_tbody] = '<tbody data-page="1">'
+                    page += 1
+                    out.append(f'\n</tbody>\n<tbody data-page="{page}">')
+                out.append(self._format_row(row))
+                rows += 1
 
         if tbody_open:
-            html_parts.extend(['</tbody>'])
-        html_parts.append('</table>')
-        table_html = '\n'.join(html_parts)
+            out.append('\n</tbody>')
         # Envelopper le tableau dans un div responsive
-        return f'<div class="table-responsive">\n{table_html}\n</div>'
+        out.append('\n</table>\n</div>')
+        return ''.join(out)
+
+    def _write_header(self, out: List[str], line: str) -> bool:
+        header = self._row_cells(line.replace('<thead>', '').replace('</thead>', ''))
+        if header is None:
+            return False
+        cells = [cell.strip() for cell in self._split_cells(header)]
+        out.extend(('<thead><tr><th scope="col">', '</th><th scope="col">'.join(cells), '</th></tr></thead>'))
+        return True
+
+    def _table_lines(self, content: str) -> Optional[Iterator[str]]:
+        """Lignes du tableau, ou None si le bloc n'en contient pas."""
+        if self._table_delimiters is None:
+            table = self.table_pattern.search(content)
+            return iter_table_lines(table.group(1)) if table is not None else None
+        # Motif littéral : tout le bloc, privé de chaque balise ouvrante ou
+        # fermante (tableaux imbriqués ou répétés, ``</table>`` isolé...)
+        opening, closing = self._table_delimiters
+        if opening not in content:
+            return None
+        return iter_table_lines(content, opening, closing)
+
+    def _row_cells(self, line: str) -> Optional[str]:
+        """Contenu de la ligne de tableau (``a|b`` pour ``[[a|b]]``), ou None."""
+        if self._row_delimiters is None:
+            row = self.row_pattern.search(line)
+            return row.group(1) if row is not None else None
+        _, found, rest = line.partition(self._row_delimiters[0])
+        row, found, _ = rest.partition(self._row_delimiters[1]) if found else ('', '', '')
+        return row if found else None
 
-    def _process_header(self, line: str) -> str:
-        header_content = line.replace('<thead>', '').replace('</thead>', '')
-        if '[[' in header_content:
-            cells = [cell.strip() for cell in header_content.strip('[]').split('|')]
-            return '<thead><tr>' + ''.join(f'<th scope="col">{cell}</th>' for cell in cells) + '</tr></thead><tbody>'
-        return ''
+    def _line_rows(self, line: str) -> List[str]:
+        """Contenu de chaque ligne de tableau présente dans ``line``, dans l'ordre."""
+        if self._row_delimiters is None:
+            return [row.group(1) for row in self.row_pattern.finditer(line)]
+        opening, closing = self._row_delimiters
+        _, found, rest = line.partition(opening)
+        row, found, rest = rest.partition(closing) if found else ('', '', '')
+        if not found:
+            return []
+        rows = [row]
+        while opening in rest:  # rare : une seule ligne de tableau dans le cas courant
+            _, _, rest = rest.partition(opening)
+            row, found, rest = rest.partition(closing)
+            if not found:
+                break
+            rows.append(row)
+        return rows
 
-    def _process_row(self, line: str) -> str:
-        cells = [cell.strip() for cell in line.strip('[]').split('|')]
-        first_cell = f'<td class="row-header">{cells[0]}</td>'
-        other_cells = ''.join(f'<td>{cell}</td>' for cell in cells[1:])
-        return f'<tr>{first_cell}{other_cells}</tr>'
+    def _split_cells(self, cells: str) -> List[str]:
+        if self._cell_separator is not None:
+            return cells.split(self._cell_separator)
+        return self.cell_pattern.split(cells)
 
+    def _format_row(self, cells: str) -> str:
+        first, *others = (cells.split(self._cell_separator) if self._cell_separator is not None
+                          else self.cell_pattern.split(cells))
+        if not others:
+            return f'\n<tr><td class="row-header">{first.strip()}</td></tr>'
+        return f'\n<tr><td class="row-header">{first.strip()}</td><td>{"</td><td>".join(map(str.strip, others))}</td></tr>'
@@ -0,0 +1,63 @@
+import codecs
+import mmap
+from pathlib import Path
+from typing import Iterator, Optional
+from .tokenizer import BlockTokenizer, Node
+
+# Encodages où '<' et '>' ne peuvent pas apparaître dans un caractère multi-octets
+_ASCII_COMPATIBLE = {'utf-8', 'ascii', 'latin-1', 'iso8859-1', 'cp1252'}
+
+def is_ascii_compatible(encoding: str) -> bool:
+    name = codecs.lookup(encoding).name
+    return name in _ASCII_COMPATIBLE or name.startswith(('iso8859-', 'cp125'))
+
+class TextInputReader:
+    """Lecteur d'entrée par défaut : le fichier est décodé par morceaux de texte."""
+
+    name = 'text'
+
+    def __init__(self,
+                 tokenizer: BlockTokenizer,
+                 encoding: str = 'utf-8',
+                 chunk_size: int = 1024 * 1024,
+                 max_block_size: Optional[int] = None):
+        self.tokenizer = tokenizer
+        self.encoding = encoding
+        self.chunk_size = chunk_size
+        self.max_block_size = max_block_size
+
+    def iter_chunks(self, file_path: Path) -> Iterator[str]:
+        with open(file_path, 'r', encoding=self.encoding) as f:
+            while True:
+                chunk = f.read(self.chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+
+    def iter_nodes(self, file_path: Path) -> Iterator[Node]:
+        return self.tokenizer.iter_stream(self.iter_chunks(file_path), self.max_block_size)
+
+class MmapInputReader:
+    """Lecteur d'entrée par projection mémoire du fichier.
+
+    Les frontières de blocs sont repérées dans les octets du fichier projeté
+    et seuls les blocs sont décodés ; le texte hors bloc est transmis tel quel
+    (``memoryview``) et recopié sans décodage dans la sortie.
+    """
+
+    name = 'mmap'
+
+    def __init__(self, tokenizer: BlockTokenizer, encoding: str = 'utf-8'):
+        if not is_ascii_compatible(encoding):
+            raise ValueError(f"Encodage incompatible avec la lecture mmap : {encoding}")
+        self.tokenizer = tokenizer
+        self.encoding = encoding
+
+    def iter_nodes(self, file_path: Path) -> Iterator[Node]:
+        with open(file_path, 'rb') as f:
+            if Path(file_path).stat().st_size == 0:
+                return
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        # Pas de close() explicite : les memoryview émises peuvent encore
+        # référencer la projection, libérée avec la dernière d'entre elles.
+        yield from self.tokenizer.iter_buffer_nodes(mapped, self.encoding)
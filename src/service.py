@@ -0,0 +1,298 @@
+"""Service de conversion HTTP (option ``--serve`` de main.py).
+
+Le service garde un pool de workers (threads ou processus), chacun avec son
+propre HTMLConverter créé et préchauffé au démarrage : une conversion ne
+paie ni le démarrage de l'interpréteur ni le chargement de la configuration
+et des templates.
+
+- ``POST /convert`` : corps JSON ``{"content": ...}`` ou ``{"input_file": ...}``,
+  avec ``"output_file"`` facultatif ; tout autre corps est le contenu à
+  convertir (``?output_file=`` possible). Retourne la page HTML, ou un JSON
+  décrivant le fichier écrit. ``input_file`` est relatif à ``service.root`` ;
+  ``output_file``, une page ``.html`` relative à ``service.output_root`` ;
+- ``GET /health`` : état du pool et de la file d'attente.
+
+Les demandes attendent dans une file bornée : quand elle est pleine, le
+service répond 503 avec ``Retry-After`` plutôt que d'accumuler du retard.
+"""
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from aiohttp import web
+from .html_converter import HTMLConverter
+from .site_builder import worker_context
+from .utils.logging_utils import get_logger
+
+MODES = ('thread', 'process')
+
+# HTMLConverter propre à chaque thread ou processus worker, créé par _init_worker
+_local = threading.local()
+
+def _init_worker(config_path: str) -> None:
+    """Crée et préchauffe le HTMLConverter d'un worker."""
+    converter = HTMLConverter(config_path=config_path)
+    converter.jinja_env.get_template('base.html')
+    converter.jinja_env.get_template('components/navigation.html')
+    _local.converter = converter
+
+def _warm_worker(delay: float) -> int:
+    # Occupe le worker un instant pour que le pool en démarre un autre
+    time.sleep(delay)
+    return threading.get_ident()
+
+@dataclass
+class ConversionJob:
+    """Demande de conversion ; les chemins sont absolus et déjà vérifiés."""
+    content: Optional[str] = None
+    input_file: Optional[str] = None
+    output_file: Optional[str] = None
+    favicon_status: Optional[Dict[str, List[str]]] = None
+
+def _run_job(job: ConversionJob) -> Tuple[Optional[str], float]:
+    """Exécute une demande dans un worker et retourne (HTML ou None si écrit, durée)."""
+    converter: HTMLConverter = _local.converter
+    start_time = time.perf_counter()
+    if job.output_file is None:
+        # Sans fichier de sortie, les assets sont référencés par ``assets/...``
+        if job.input_file is not None:
+            html = converter.render_page(job.input_file, job.input_file, job.favicon_status)
+        else:
+            html = converter.render_content(job.content, 'index.html', job.favicon_status)
+        return html, time.perf_counter() - start_time
+
+    Path(job.output_file).parent.mkdir(parents=True, exist_ok=True)
+    if job.input_file is not None:
+        converter.convert(job.input_file, job.output_file, favicon_status=job.favicon_status)
+    else:
+        html = converter.render_content(job.content, job.output_file, job.favicon_status)
+        Path(job.output_file).write_text(html, encoding=converter.config['general']['encoding'])
+    return None, time.perf_counter() - start_time
+
+class ConversionService:
+    """Service HTTP de conversion avec file d'attente bornée et pool de workers."""
+
+    def __init__(self,
+                 converter: HTMLConverter,
+                 port: int = 5000,
+                 workers: Optional[int] = None,
+                 mode: Optional[str] = None):
+        self.converter = converter
+        self.logger = get_logger('service')
+
+        service_config = converter.config.get('service', {})
+        self.host = service_config.get('host', 'localhost')
+        self.port = port
+        self.mode = mode or service_config.get('mode', 'thread')
+        if self.mode not in MODES:
+            raise ValueError(f"Mode de service inconnu : {self.mode}")
+        workers = service_config.get('workers', 4) if workers is None else workers
+        self.workers = workers if workers > 0 else (os.cpu_count() or 1)
+        self.queue_size = service_config.get('queue_size', 64)
+        self.retry_after = service_config.get('retry_after', 1)
+        self.root = Path(service_config.get('root', '.')).resolve()
+        # Dossier séparé pour les écritures : un client ne peut pas écraser le code ni la configuration
+        self.output_root = Path(service_config.get('output_root', 'output')).resolve()
+
+        self.queue: Optional[asyncio.Queue] = None
+        self.executor: Optional[Executor] = None
+        self.tasks: List[asyncio.Task] = []
+        self.active = 0
+        self.favicon_status: Optional[Dict[str, List[str]]] = None
+        self.prepared_assets: Dict[Path, asyncio.Task] = {}
+
+        self.app = web.Application(client_max_size=service_config.get('max_body_size', 10485760))
+        self.setup_routes()
+        self.running = True
+
+    def setup_routes(self):
+        self.app.router.add_post('/convert', self.handle_convert)
+        self.app.router.add_get('/health', self.handle_health)
+        self.app.on_startup.append(self.on_startup)
+        self.app.on_shutdown.append(self.on_shutdown)
+
+    def _create_executor(self) -> Executor:
+        options = {
+            'max_workers': self.workers,
+            'initializer': _init_worker,
+            'initargs': (self.converter.config_path,)
+        }
+        if self.mode == 'process':
+            # Pas de fork : le service a déjà lancé des threads (asyncio.to_thread),
+            # dont les verrous seraient copiés verrouillés dans les workers
+            return ProcessPoolExecutor(mp_context=worker_context(), **options)
+        return ThreadPoolExecutor(**options)
+
+    async def on_startup(self, app):
+        loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize=self.queue_size)
+        self.executor = self._create_executor()
+        # Favicons vérifiés une seule fois pour toutes les demandes, comme en mode build
+        self.favicon_status = await asyncio.to_thread(self.converter.verify_favicon_resources)
+        await asyncio.gather(*(
+            loop.run_in_executor(self.executor, _warm_worker, 0.05) for _ in range(self.workers)
+        ))
+        self.tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        self.logger.info(f"Conversion pool ready: {self.workers} {self.mode} worker(s), queue of {self.queue_size}")
+
+    async def _worker(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            job, future = await self.queue.get()
+            try:
+                if future.cancelled():
+                    continue  # le client est parti pendant l'attente
+                self.active += 1
+                try:
+                    result = await loop.run_in_executor(self.executor, _run_job, job)
+                except Exception as e:
+                    if not future.done():
+                        future.set_exception(e)
+                else:
+                    if not future.done():
+                        future.set_result(result)
+                finally:
+                    self.active -= 1
+            finally:
+                self.queue.task_done()
+
+    async def submit(self, job: ConversionJob) -> Tuple[Optional[str], float]:
+        """Place la demande dans la file et attend son résultat.
+
+        Lève ``asyncio.QueueFull`` si la file est pleine.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self.queue.put_nowait((job, future))
+        try:
+            return await future
+        finally:
+            future.cancel()  # sans effet si terminé ; sinon le worker ignorera la demande
+
+    def resolve_path(self, value, root: Optional[Path] = None) -> Path:
+        """Chemin absolu d'un fichier de ``root`` (par défaut le dossier racine du service)."""
+        root = root or self.root
+        if not isinstance(value, str) or not value:
+            raise web.HTTPBadRequest(text="Chemin invalide")
+        path = (root / value).resolve()
+        if path != root and root not in path.parents:
+            raise web.HTTPForbidden(text=f"Chemin hors de {root} : {value}")
+        return path
+
+    def resolve_output_path(self, value) -> Path:
+        """Chemin absolu d'une page ``.html`` du dossier de sortie du service."""
+        path = self.resolve_path(value, self.output_root)
+        if path.suffix.lower() != '.html':
+            raise web.HTTPBadRequest(text=f"'output_file' doit être une page .html : {value}")
+        return path
+
+    async def parse_job(self, request) -> ConversionJob:
+        if request.content_type == 'application/json':
+            try:
+                payload = await request.json()
+            except ValueError as e:
+                raise web.HTTPBadRequest(text=f"JSON invalide : {str(e)}")
+            if not isinstance(payload, dict):
+                raise web.HTTPBadRequest(text="Le corps JSON doit être un objet")
+        else:
+            payload = {'content': await request.text()}
+            if 'output_file' in request.query:
+                payload['output_file'] = request.query['output_file']
+
+        content, input_file = payload.get('content'), payload.get('input_file')
+        if (content is None) == (input_file is None):
+            raise web.HTTPBadRequest(text="Indiquer soit 'content', soit 'input_file'")
+        if content is not None and not isinstance(content, str):
+            raise web.HTTPBadRequest(text="'content' doit être une chaîne")
+
+        job = ConversionJob(content=content, favicon_status=self.favicon_status)
+        if input_file is not None:
+            input_path = self.resolve_path(input_file)
+            if not input_path.is_file():
+                raise web.HTTPNotFound(text=f"Fichier d'entrée introuvable : {input_file}")
+            job.input_file = str(input_path)
+        if payload.get('output_file') is not None:
+            job.output_file = str(self.resolve_output_path(payload['output_file']))
+        return job
+
+    async def prepare_assets(self, output_dir: Path) -> None:
+        """Copie les assets une seule fois par dossier de sortie."""
+        task = self.prepared_assets.get(output_dir)
+        if task is None:
+            task = asyncio.create_task(self.converter.prepare_assets_async(output_dir))
+            self.prepared_assets[output_dir] = task
+        try:
+            await asyncio.shield(task)
+        except Exception:
+            self.prepared_assets.pop(output_dir, None)  # nouvel essai à la prochaine demande
+            raise
+
+    async def handle_convert(self, request):
+        job = await self.parse_job(request)
+        try:
+            if job.output_file is not None:
+                await self.prepare_assets(Path(job.output_file).parent)
+            html, elapsed = await self.submit(job)
+        except asyncio.QueueFull:
+            self.logger.warning("Conversion queue full, rejecting request")
+            raise web.HTTPServiceUnavailable(
+                text="File de conversion pleine, réessayer plus tard",
+                headers={'Retry-After': str(self.retry_after)}
+            )
+        except FileNotFoundError as e:
+            raise web.HTTPNotFound(text=str(e))
+        except Exception as e:
+            self.logger.error(f"Conversion failed: {str(e)}")
+            raise web.HTTPInternalServerError(text=f"Échec de la conversion : {str(e)}")
+
+        source = job.input_file or '<content>'
+        self.logger.info(f"Converted {source} in {elapsed:.3f} seconds")
+        if html is not None:
+            return web.Response(text=html, content_type='text/html')
+        return web.json_response({'output_file': job.output_file, 'duration': round(elapsed, 6)})
+
+    async def handle_health(self, request):
+        return web.json_response({
+            'status': 'ok',
+            'mode': self.mode,
+            'workers': self.workers,
+            'active': self.active,
+            'queued': self.queue.qsize() if self.queue is not None else 0,
+            'queue_size': self.queue_size,
+        })
+
+    async def on_shutdown(self, app):
+        self.running = False
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        self.tasks = []
+
+        # Demandes encore en attente : les clients reçoivent une erreur
+        while self.queue is not None and not self.queue.empty():
+            _, future = self.queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("Service arrêté"))
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+    async def start(self):
+        runner = web.AppRunner(self.app)
+        await runner.setup()
+        site = web.TCPSite(runner, self.host, self.port)
+        await site.start()
+
+        self.logger.info(f"Conversion service started at http://{self.host}:{self.port}")
+        self.logger.info(f"Input paths are resolved against {self.root}, output paths against {self.output_root}")
+
+        try:
+            while self.running:
+                await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            self.logger.info("Shutting down conversion service...")
+        finally:
+            await runner.cleanup()
@@ -0,0 +1,260 @@
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from .build_manifest import BuildManifest, file_fingerprint
+from .html_converter import HTMLConverter
+from .utils.logging_utils import get_logger, log_async_execution_time
+
+class BuildError(Exception):
+    """Erreur empêchant le build de démarrer."""
+    pass
+
+@dataclass
+class WorkerStats:
+    pages: int = 0
+    busy_time: float = 0.0
+
+    @property
+    def pages_per_second(self) -> float:
+        return self.pages / self.busy_time if self.busy_time else 0.0
+
+@dataclass
+class BuildResult:
+    converted: int = 0
+    skipped: int = 0
+    removed: int = 0
+    failed: List[Tuple[str, str]] = field(default_factory=list)
+    duration: float = 0.0
+    workers: Dict[int, WorkerStats] = field(default_factory=dict)
+
+def worker_context() -> multiprocessing.context.BaseContext:
+    """Contexte des pools de processus : forkserver, ou spawn là où il n'existe pas (Windows)."""
+    method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+    return multiprocessing.get_context(method)
+
+# HTMLConverter propre à chaque processus worker, créé par _init_worker
+_worker_converter: Optional[HTMLConverter] = None
+
+def _init_worker(config_path: str) -> None:
+    """Crée et préchauffe le HTMLConverter d'un processus worker."""
+    global _worker_converter
+    _worker_converter = HTMLConverter(config_path=config_path)
+    _worker_converter.jinja_env.get_template('base.html')
+    _worker_converter.jinja_env.get_template('components/navigation.html')
+
+def _convert_in_worker(input_file: str,
+                       output_file: str,
+                       favicon_status: Dict[str, List[str]],
+                       assets_root: str) -> Tuple[int, float]:
+    """Convertit une page dans un worker et retourne (pid, durée)."""
+    start_time = time.perf_counter()
+    Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+    _worker_converter.convert(
+        input_file,
+        output_file,
+        favicon_status=favicon_status,
+        assets_root=Path(assets_root)
+    )
+    return os.getpid(), time.perf_counter() - start_time
+
+class SiteBuilder:
+    """Convertit toute une arborescence de fichiers d'entrée avec un seul HTMLConverter."""
+
+    def __init__(self,
+                 converter: HTMLConverter,
+                 input_dir: str,
+                 output_dir: str,
+                 concurrency: Optional[int] = None,
+                 workers: Optional[int] = None,
+                 force: bool = False):
+        self.converter = converter
+        self.input_dir = Path(input_dir).resolve()
+        self.output_dir = Path(output_dir).resolve()
+        self.logger = get_logger('site_builder')
+
+        build_config = converter.config.get('build', {})
+        self.concurrency = max(1, concurrency or build_config.get('concurrency', 8))
+        self.extensions = {ext.lower() for ext in build_config.get('extensions', ['.html', '.txt'])}
+
+        # 1 = conversion dans la boucle asyncio, 0 = un processus par CPU
+        if workers is None:
+            workers = build_config.get('workers', 1)
+        self.workers = workers or os.cpu_count() or 1
+
+        # Build incrémental : seules les pages dont une dépendance a changé sont régénérées
+        self.force = force
+        self.manifest_path = self.output_dir / build_config.get('manifest', '.build-manifest.json')
+
+        if not self.input_dir.is_dir():
+            raise NotADirectoryError(f"Dossier d'entrée introuvable : {self.input_dir}")
+
+    def collect_pages(self) -> List[Tuple[Path, Path]]:
+        """Retourne les couples (entrée, sortie) à convertir, en miroir de l'arborescence d'entrée.
+
+        Lève ``BuildError`` si deux entrées (``p.html`` et ``p.txt``) produiraient la même sortie.
+        """
+        pages = []
+        sources: Dict[Path, Path] = {}
+        for input_path in sorted(self.input_dir.rglob('*')):
+            if not input_path.is_file() or input_path.suffix.lower() not in self.extensions:
+                continue
+            # Ignore les fichiers déjà générés si la sortie est dans l'entrée
+            if self.output_dir in input_path.parents:
+                continue
+            relative_path = input_path.relative_to(self.input_dir)
+            output_path = (self.output_dir / relative_path).with_suffix('.html')
+            if output_path in sources:
+                raise BuildError(
+                    f"{sources[output_path].relative_to(self.input_dir)} et {relative_path} "
+                    f"produiraient la même sortie : {output_path}"
+                )
+            sources[output_path] = input_path
+            pages.append((input_path, output_path))
+        return pages
+
+    def _page_key(self, input_path: Path) -> str:
+        return input_path.relative_to(self.input_dir).as_posix()
+
+    def _hash_inputs(self, pages: List[Tuple[Path, Path]]) -> Dict[Path, str]:
+        return {input_path: file_fingerprint(input_path) for input_path, _ in pages}
+
+    def _remove_stale_outputs(self, manifest: BuildManifest, pages: List[Tuple[Path, Path]]) -> int:
+        """Supprime les sorties dont le fichier d'entrée a disparu."""
+        current_keys = {self._page_key(input_path) for input_path, _ in pages}
+        removed = 0
+        for key in [key for key in manifest.pages if key not in current_keys]:
+            entry = manifest.forget(key)
+            output_path = Path(entry['output'])
+            if self.output_dir in output_path.parents and output_path.exists():
+                output_path.unlink()
+                removed += 1
+                self.logger.info(f"Removed stale output: {output_path}")
+        return removed
+
+    @log_async_execution_time()
+    async def build(self) -> BuildResult:
+        """Convertit toutes les pages avec une concurrence bornée."""
+        start_time = time.perf_counter()
+        pages = self.collect_pages()
+        self.logger.info(
+            f"Building {len(pages)} pages from {self.input_dir} to {self.output_dir} "
+            f"(concurrency={self.concurrency}, workers={self.workers})"
+        )
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        # Vérification des favicons et copie des assets une seule fois par build
+        favicon_status = await asyncio.to_thread(self.converter.verify_favicon_resources)
+        await self.converter.prepare_assets_async(self.output_dir)
+
+        result = BuildResult()
+        manifest = BuildManifest.load(self.manifest_path)
+        if self.force:
+            manifest.invalidate()
+        previous_build = manifest.config_hash is not None
+        if manifest.update_dependencies(
+            self.converter.config_fingerprint(),
+            await asyncio.to_thread(self.converter.templates_fingerprint)
+        ) and previous_build:
+            self.logger.info("Configuration or templates changed, rebuilding every page")
+
+        input_hashes = await asyncio.to_thread(self._hash_inputs, pages)
+        result.removed = self._remove_stale_outputs(manifest, pages)
+        pending = [
+            (input_path, output_path) for input_path, output_path in pages
+            if not manifest.is_up_to_date(self._page_key(input_path), input_hashes[input_path], output_path)
+        ]
+        result.skipped = len(pages) - len(pending)
+
+        if self.workers > 1 and pending:
+            outcomes = await self._convert_parallel(pending, favicon_status, result)
+        else:
+            outcomes = await self._convert_concurrent(pending, favicon_status)
+
+        for (input_path, output_path), outcome in zip(pending, outcomes):
+            key = self._page_key(input_path)
+            if isinstance(outcome, Exception):
+                result.failed.append((str(input_path), str(outcome)))
+                manifest.forget(key)
+            else:
+                result.converted += 1
+                manifest.record(key, input_hashes[input_path], output_path)
+        manifest.save()
+        result.duration = time.perf_counter() - start_time
+
+        self.logger.info(
+            f"Build finished: {result.converted} converted, {result.skipped} up to date, "
+            f"{result.removed} removed, {len(result.failed)} failed "
+            f"in {result.duration:.2f} seconds"
+        )
+        for pid, stats in sorted(result.workers.items()):
+            self.logger.info(
+                f"Worker {pid}: {stats.pages} pages in {stats.busy_time:.2f} seconds "
+                f"({stats.pages_per_second:.1f} pages/s)"
+            )
+        for input_path, error in result.failed:
+            self.logger.error(f"Failed to convert {input_path}: {error}")
+        return result
+
+    async def _convert_concurrent(self,
+                                  pages: List[Tuple[Path, Path]],
+                                  favicon_status: Dict[str, List[str]]) -> List:
+        """Convertit les pages dans la boucle asyncio avec le converter partagé."""
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def convert_page(input_path: Path, output_path: Path) -> None:
+            async with semaphore:
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                await self.converter.convert_async(
+                    str(input_path),
+                    str(output_path),
+                    favicon_status=favicon_status,
+                    assets_root=self.output_dir
+                )
+
+        return await asyncio.gather(
+            *(convert_page(input_path, output_path) for input_path, output_path in pages),
+            return_exceptions=True
+        )
+
+    async def _convert_parallel(self,
+                                pages: List[Tuple[Path, Path]],
+                                favicon_status: Dict[str, List[str]],
+                                result: BuildResult) -> List:
+        """Répartit les pages sur un pool de processus, chacun avec son propre converter."""
+        loop = asyncio.get_running_loop()
+        # Pas de fork : la boucle a déjà lancé des threads (asyncio.to_thread) dont
+        # les verrous, ceux du logging par exemple, seraient copiés verrouillés
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=worker_context(),
+            initializer=_init_worker,
+            initargs=(self.converter.config_path,)
+        ) as executor:
+            outcomes = await asyncio.gather(
+                *(
+                    loop.run_in_executor(
+                        executor,
+                        _convert_in_worker,
+                        str(input_path),
+                        str(output_path),
+                        favicon_status,
+                        str(self.output_dir)
+                    )
+                    for input_path, output_path in pages
+                ),
+                return_exceptions=True
+            )
+
+        for outcome in outcomes:
+            if not isinstance(outcome, Exception):
+                pid, elapsed = outcome
+                stats = result.workers.setdefault(pid, WorkerStats())
+                stats.pages += 1
+                stats.busy_time += elapsed
+        return outcomes
@@ -0,0 +1,85 @@
+from html.parser import HTMLParser
+from typing import List
+import html
+import re
+
+# Balise simple, sans guillemets ni chevron dans ses attributs
+_SIMPLE_TAG = re.compile(r'</?[A-Za-z][^<>"\']*>')
+# Éléments dont le contenu n'est pas du texte visible
+_HIDDEN_CONTENT = re.compile(r'<(?:script|style)\b', re.IGNORECASE)
+
+class _TextCollector(HTMLParser):
+    """Collecte les chaînes de texte comme BeautifulSoup : une chaîne par suite de données."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.strings: List[str] = []
+        self._buffer: List[str] = []
+        self._hidden_depth = 0
+
+    def _flush(self) -> None:
+        if self._buffer:
+            if not self._hidden_depth:
+                self.strings.append(''.join(self._buffer))
+            self._buffer = []
+
+    def handle_starttag(self, tag, attrs):
+        self._flush()
+        if tag in ('script', 'style'):
+            self._hidden_depth += 1
+
+    def handle_startendtag(self, tag, attrs):
+        self._flush()
+
+    def handle_endtag(self, tag):
+        self._flush()
+        if tag in ('script', 'style') and self._hidden_depth:
+            self._hidden_depth -= 1
+
+    def handle_data(self, data):
+        self._buffer.append(data)
+
+    def handle_comment(self, data):
+        self._flush()
+
+    def handle_decl(self, decl):
+        self._flush()
+
+    def handle_pi(self, data):
+        self._flush()
+
+    def unknown_decl(self, data):
+        # Les sections CDATA font partie du texte
+        self._flush()
+        if data.startswith('CDATA['):
+            self.strings.append(data[len('CDATA['):])
+
+    def close(self):
+        super().close()
+        self._flush()
+
+def _join(strings) -> str:
+    return ' '.join(text for text in (string.strip() for string in strings) if text)
+
+def extract_text(markup: str) -> str:
+    """Retourne le texte d'un fragment HTML, balises retirées et entités décodées.
+
+    Équivalent à ``BeautifulSoup(markup, 'html.parser').get_text(" ", strip=True)``.
+    Les fragments composés de balises simples sont traités par une découpe
+    régulière ; les autres (commentaires, ``<script>``, ``<`` littéral...)
+    passent par ``html.parser``. Seules les entités sans point-virgule
+    collées à du texte (``&eacutetexte``) sont décodées selon HTML5 plutôt
+    qu'à la manière de BeautifulSoup.
+    """
+    if '<' not in markup:
+        return html.unescape(markup).strip()
+
+    if not _HIDDEN_CONTENT.search(markup):
+        pieces = _SIMPLE_TAG.split(markup)
+        if not any('<' in piece for piece in pieces):
+            return _join(html.unescape(piece) for piece in pieces)
+
+    collector = _TextCollector()
+    collector.feed(markup)
+    collector.close()
+    return _join(collector.strings)
@@ -0,0 +1,263 @@
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+import re
+
+# Types de blocs reconnus
+HEADING = 'heading'
+PARAGRAPH = 'paragraph'
+LIST = 'list'
+CODE = 'code'
+TABLE = 'table'
+
+BLOCK_KINDS = {
+    'h1': HEADING, 'h2': HEADING, 'h3': HEADING,
+    'h4': HEADING, 'h5': HEADING, 'h6': HEADING,
+    'p': PARAGRAPH,
+    'ul': LIST,
+    'ol': LIST,
+    'code': CODE,
+    'table': TABLE,
+}
+
+# Début de bloc : même alternative que le motif historique, compilée une fois
+_BLOCK_OPENER = re.compile(r'<(h[1-6]|p|ul|ol|code|table)')
+_BYTES_BLOCK_OPENER = re.compile(rb'<(h[1-6]|p|ul|ol|code|table)')
+_TAG_NAME = re.compile(r'\w+')
+# Longueur du plus long début de bloc ("<table") : une fin de tampon plus
+# courte peut encore devenir un début de bloc avec le morceau suivant
+_MAX_OPENER_LENGTH = len('<table')
+
+def contains_block_opener(text: str) -> bool:
+    """Vrai si ``text`` contient un début de bloc (resté ouvert s'il figure dans un TextNode)."""
+    return '<' in text and _BLOCK_OPENER.search(text) is not None
+
+@dataclass
+class TextNode:
+    """Texte recopié tel quel entre deux blocs."""
+    raw: str
+    start: int
+    end: int
+
+@dataclass
+class BlockNode:
+    """Bloc ``<tag ...>...</tag>`` reconnu par le tokenizer.
+
+    ``index`` est le rang du bloc dans le document (blocs non autorisés
+    compris), ``allowed`` indique si ``tag`` figure dans ``html.allowed_tags``.
+    """
+    kind: str
+    tag: str
+    raw: str
+    start: int
+    end: int
+    index: int
+    allowed: bool
+
+Node = Union[TextNode, BlockNode]
+
+class BlockTokenizer:
+    """Découpe le contenu en blocs en une seule passe linéaire.
+
+    Reproduit exactement le découpage du motif ``patterns.title`` historique
+    (``<(h[1-6]|p|ul|ol|code|table)[^>]*>.*?</\\2>``) sans ses réanalyses :
+    les positions du prochain ``>`` et des balises fermantes absentes sont
+    mémorisées, ce qui garantit un temps O(n) même sur des balises non fermées.
+    """
+
+    def __init__(self, allowed_tags: Iterable[str]):
+        self.allowed_tags = frozenset(allowed_tags)
+
+    def tokenize(self, content: str) -> List[Node]:
+        return list(self.iter_nodes(content))
+
+    def iter_nodes(self, content: str, start: int = 0, index: int = 0) -> Iterator[Node]:
+        """Découpe ``content`` à partir de ``start``, qui doit être une frontière de nœud.
+
+        ``index`` est le rang du premier bloc rencontré : reprendre après un
+        bloc produit les mêmes nœuds que le découpage complet.
+        """
+        return self._scan(content, start=start, index=index)
+
+    def iter_buffer_nodes(self, buffer, encoding: str = 'utf-8') -> Iterator[Node]:
+        """Découpe un tampon d'octets (``bytes``, ``mmap``...) sans le décoder en entier.
+
+        Les frontières de blocs sont cherchées directement dans les octets ;
+        seuls les blocs sont décodés. Le texte hors bloc est émis sous forme de
+        ``memoryview`` sur le tampon (aucune copie) et les positions sont en
+        octets. ``encoding`` doit être compatible ASCII (``<`` et ``>`` ne
+        peuvent pas apparaître dans un caractère multi-octets).
+        """
+        return self._scan(buffer, encoding)
+
+    def _scan(self, content, encoding: Optional[str] = None, start: int = 0, index: int = 0) -> Iterator[Node]:
+        if encoding is None:
+            search_opener = _BLOCK_OPENER.search
+            gt_char = '>'
+            text_view = content
+        else:
+            search_opener = _BYTES_BLOCK_OPENER.search
+            gt_char = b'>'
+            text_view = memoryview(content)
+        length = len(content)
+        find = content.find
+        text_start = start
+        position = start
+        next_gt = -1
+        # balise -> position à partir de laquelle la balise fermante n'existe plus
+        missing_close: Dict[str, int] = {}
+
+        while True:
+            opener = search_opener(content, position)
+            if opener is None:
+                break
+            position = opener.start()
+            tag = opener.group(1)
+
+            # [^>]* puis '>' : premier '>' après le nom de la balise
+            after_tag = position + 1 + len(tag)
+            if next_gt < after_tag:
+                next_gt = find(gt_char, after_tag)
+                if next_gt == -1:
+                    break  # plus aucun '>' : aucun bloc possible
+
+            closing = b'</' + tag + b'>' if encoding else f'</{tag}>'
+            close_start = -1
+            if missing_close.get(tag, length + 1) > next_gt + 1:
+                close_start = find(closing, next_gt + 1)
+                if close_start == -1:
+                    missing_close[tag] = next_gt + 1
+            if close_start == -1:
+                position += 1
+                continue
+
+            end = close_start + len(closing)
+            if text_start < position:
+                yield TextNode(text_view[text_start:position], text_start, position)
+
+            if encoding is None:
+                tag_name = _TAG_NAME.match(content, position + 1).group(0)
+                raw = content[position:end]
+            else:
+                tag = tag.decode('ascii')
+                tag_name = _TAG_NAME.match(content[position + 1:next_gt].decode(encoding)).group(0)
+                raw = content[position:end].decode(encoding)
+            yield BlockNode(
+                kind=BLOCK_KINDS[tag],
+                tag=tag_name,
+                raw=raw,
+                start=position,
+                end=end,
+                index=index,
+                allowed=tag_name in self.allowed_tags
+            )
+            index += 1
+            text_start = position = end
+
+        if text_start < length:
+            yield TextNode(text_view[text_start:length], text_start, length)
+
+    def iter_stream(self,
+                    chunks: Iterable[str],
+                    max_block_size: Optional[int] = None) -> Iterator[Node]:
+        """Découpe un flux de morceaux de texte sans jamais charger tout le contenu.
+
+        Le texte hors bloc est émis dès qu'aucun bloc ne peut plus y commencer ;
+        seul le bloc en cours est conservé en mémoire. Le découpage est identique
+        à ``iter_nodes`` sur le contenu complet, sauf si ``max_block_size`` est
+        fourni : un ouvrant resté sans fermeture au-delà de cette taille est
+        alors traité comme du texte, ce qui borne la mémoire sur les balises
+        non fermées.
+        """
+        chunk_iter = iter(chunks)
+        buffer = ''
+        offset = 0          # position absolue de buffer[0]
+        text_start = 0
+        position = 0
+        index = 0
+        eof = False
+        next_gt = -1        # positions absolues
+        missing_close: Dict[str, int] = {}
+        pending_close = None  # (ouvrant, reprise de la recherche) en absolu
+
+        while True:
+            need_more = False
+            opener = _BLOCK_OPENER.search(buffer, position)
+            if opener is None:
+                if eof:
+                    break
+                # Un début de bloc peut chevaucher la fin du tampon
+                position = max(position, len(buffer) - _MAX_OPENER_LENGTH + 1)
+                need_more = True
+            else:
+                position = opener.start()
+                tag = opener.group(1)
+                after_tag = position + 1 + len(tag)
+
+                if next_gt < offset + after_tag:
+                    gt = buffer.find('>', after_tag)
+                    if gt == -1:
+                        if eof:
+                            break
+                        need_more = True
+                    else:
+                        next_gt = offset + gt
+
+                if not need_more:
+                    gt = next_gt - offset
+                    closing = f'</{tag}>'
+                    close_start = -1
+                    if missing_close.get(tag, offset + len(buffer) + 1) > next_gt + 1:
+                        search_from = gt + 1
+                        if pending_close and pending_close[0] == offset + position:
+                            search_from = max(search_from, pending_close[1] - offset)
+                        close_start = buffer.find(closing, search_from)
+                        if close_start == -1:
+                            if eof:
+                                missing_close[tag] = next_gt + 1
+                            elif max_block_size and len(buffer) - position > max_block_size:
+                                pass  # bloc trop grand : traité comme du texte
+                            else:
+                                pending_close = (
+                                    offset + position,
+                                    offset + max(gt + 1, len(buffer) - len(closing) + 1)
+                                )
+                                need_more = True
+
+                    if not need_more:
+                        if close_start == -1:
+                            position += 1
+                            continue
+
+                        end = close_start + len(closing)
+                        if text_start < position:
+                            yield TextNode(buffer[text_start:position], offset + text_start, offset + position)
+                        tag_name = _TAG_NAME.match(buffer, position + 1).group(0)
+                        yield BlockNode(
+                            kind=BLOCK_KINDS[tag],
+                            tag=tag_name,
+                            raw=buffer[position:end],
+                            start=offset + position,
+                            end=offset + end,
+                            index=index,
+                            allowed=tag_name in self.allowed_tags
+                        )
+                        index += 1
+                        pending_close = None
+                        text_start = position = end
+                        continue
+
+            # Émet le texte sûr puis lit le morceau suivant
+            if text_start < position:
+                yield TextNode(buffer[text_start:position], offset + text_start, offset + position)
+                text_start = position
+            chunk = next(chunk_iter, None)
+            if chunk is None:
+                eof = True
+                continue
+            buffer = buffer[text_start:] + chunk
+            offset += text_start
+            position -= text_start
+            text_start = 0
+
+        if text_start < len(buffer):
+            yield TextNode(buffer[text_start:], offset + text_start, offset + len(buffer))
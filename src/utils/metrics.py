@@ -0,0 +1,121 @@
+import inspect
+import threading
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from functools import wraps
+from time import perf_counter_ns
+from typing import Dict, Iterator, List
+
+@dataclass
+class StageStats:
+    """Durées cumulées d'une étape, en nanosecondes."""
+    count: int = 0
+    total_ns: int = 0
+    min_ns: int = 0
+    max_ns: int = 0
+
+    def observe(self, elapsed_ns: int) -> None:
+        if self.count == 0 or elapsed_ns < self.min_ns:
+            self.min_ns = elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+        self.count += 1
+        self.total_ns += elapsed_ns
+
+class ConversionMetrics:
+    """Mesure par étape des conversions (lecture, titres, processeurs, rendu...).
+
+    Les étapes peuvent être imbriquées : ``titles`` inclut le temps passé
+    dans les ``processor.*``, ``convert`` couvre toute la conversion.
+    """
+
+    enabled = True
+
+    def __init__(self):
+        self._stages: Dict[str, StageStats] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.observe(name, perf_counter_ns() - start)
+
+    def observe(self, name: str, elapsed_ns: int) -> None:
+        with self._lock:
+            stats = self._stages.get(name)
+            if stats is None:
+                stats = self._stages[name] = StageStats()
+            stats.observe(elapsed_ns)
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {
+                name: {'count': stats.count, 'total_ns': stats.total_ns,
+                       'min_ns': stats.min_ns, 'max_ns': stats.max_ns}
+                for name, stats in self._stages.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stages.clear()
+
+    def to_prometheus(self, prefix: str = 'markweave') -> str:
+        """Exporte les mesures au format texte de Prometheus."""
+        metric = f'{prefix}_conversion_stage_seconds'
+        lines: List[str] = [
+            f'# HELP {metric} Durée des étapes de conversion.',
+            f'# TYPE {metric} summary'
+        ]
+        maximums: List[str] = []
+        for name, stats in sorted(self.snapshot().items()):
+            label = name.replace('\\', '\\\\').replace('"', '\\"')
+            lines.append(f'{metric}_sum{{stage="{label}"}} {stats["total_ns"] / 1e9:.9f}')
+            lines.append(f'{metric}_count{{stage="{label}"}} {stats["count"]}')
+            maximums.append(f'{metric}_max{{stage="{label}"}} {stats["max_ns"] / 1e9:.9f}')
+        lines.append(f'# HELP {metric}_max Durée maximale observée par étape.')
+        lines.append(f'# TYPE {metric}_max gauge')
+        return '\n'.join(lines + maximums) + '\n'
+
+class NullMetrics:
+    """Remplaçant sans effet quand les métriques sont désactivées."""
+
+    enabled = False
+    _context = nullcontext()
+
+    def stage(self, name: str):
+        return self._context
+
+    def observe(self, name: str, elapsed_ns: int) -> None:
+        pass
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        return {}
+
+    def reset(self) -> None:
+        pass
+
+    def to_prometheus(self, prefix: str = 'markweave') -> str:
+        return ''
+
+def create_metrics(enabled: bool):
+    return ConversionMetrics() if enabled else NullMetrics()
+
+def measure_stage(name: str):
+    """Décorateur de méthode : mesure l'appel dans ``self.metrics`` sous l'étape ``name``."""
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(self, *args, **kwargs):
+                with self.metrics.stage(name):
+                    return await func(self, *args, **kwargs)
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            with self.metrics.stage(name):
+                return func(self, *args, **kwargs)
+        return wrapper
+    return decorator
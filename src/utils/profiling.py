@@ -0,0 +1,257 @@
+"""Profilage d'une conversion ou d'un build (option ``--profile`` de main.py).
+
+- ``cprofile`` : profil déterministe, écrit au format pstats (``.prof``),
+  lisible par ``python -m pstats``, snakeviz ou gprof2dot ;
+- ``sample`` : échantillonnage périodique des piles de tous les threads,
+  écrit en piles repliées (``.folded``) pour flamegraph.pl ou speedscope.
+
+Dans les deux cas, le temps passé dans les bibliothèques (re, jinja2...) est
+rattaché à la méthode du projet qui les appelle, puis regroupé par classe
+(``HTMLConverter``, ``TableProcessor``...).
+"""
+import cProfile
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from types import CodeType, FrameType
+from typing import Dict, Iterator, List, Optional, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_OUTPUTS = {'cprofile': 'profile.prof', 'sample': 'profile.folded'}
+
+# Fonctions où un thread attend sans travailler : ses échantillons sont ignorés
+IDLE_FUNCTIONS = {
+    ('selectors.py', 'select'),
+    ('threading.py', 'wait'),
+    ('thread.py', '_worker'),
+}
+
+FunctionKey = Tuple[str, int, str]  # (fichier, ligne, nom), comme dans pstats
+
+def is_project_file(filename: str) -> bool:
+    path = Path(filename)
+    return path.is_absolute() and PROJECT_ROOT in path.parents and 'site-packages' not in path.parts
+
+def owner_of(filename: str, qualname: str) -> str:
+    """Classe d'une méthode (``TableProcessor.process`` -> ``TableProcessor``), sinon le module ou le template."""
+    path = Path(filename)
+    if path.suffix != '.py':
+        return path.name  # template Jinja compilé
+    outer = qualname.split('.<locals>')[0]
+    return outer.split('.')[0] if '.' in outer else path.stem
+
+class QualnameIndex:
+    """Retrouve le nom qualifié d'une fonction à partir de son entrée pstats."""
+
+    def __init__(self):
+        self._files: Dict[str, Dict[Tuple[int, str], str]] = {}
+
+    def lookup(self, key: FunctionKey) -> str:
+        filename, line, name = key
+        if filename not in self._files:
+            self._files[filename] = self._index(filename)
+        return self._files[filename].get((line, name), name)
+
+    @staticmethod
+    def _index(filename: str) -> Dict[Tuple[int, str], str]:
+        try:
+            source = Path(filename).read_text(encoding='utf-8')
+            code = compile(source, filename, 'exec')
+        except (OSError, SyntaxError, ValueError):
+            return {}
+        index = {}
+        stack = [code]
+        while stack:
+            code = stack.pop()
+            index[(code.co_firstlineno, code.co_name)] = getattr(code, 'co_qualname', code.co_name)
+            stack.extend(const for const in code.co_consts if isinstance(const, CodeType))
+        return index
+
+def is_idle(key: FunctionKey, callers: Dict) -> bool:
+    """Attente d'un thread (file, verrou, select), ou fonction native appelée uniquement par une attente."""
+    if (os.path.basename(key[0]), key[2]) in IDLE_FUNCTIONS:
+        return True
+    return key[0] == '~' and bool(callers) and all(
+        (os.path.basename(caller[0]), caller[2]) in IDLE_FUNCTIONS for caller in callers
+    )
+
+def format_key(key: FunctionKey, qualname: str) -> str:
+    filename, line, _ = key
+    if filename == '~':
+        return qualname  # fonction native, ex. {method 'sub' of 're.Pattern' objects}
+    return f"{qualname} ({Path(filename).name}:{line})"
+
+class CProfileProfiler:
+    """cProfile étendu aux threads démarrés pendant la mesure (asyncio.to_thread).
+
+    cProfile ne suit que le thread qui l'active : chaque nouveau thread
+    active son propre profil au premier appel, les profils sont fusionnés
+    à la fin.
+    """
+
+    def __init__(self):
+        self._profiles: List[cProfile.Profile] = []
+        self._lock = threading.Lock()
+        self.stats: Optional[pstats.Stats] = None
+
+    def _start_thread(self, frame, event, arg) -> None:
+        profile = cProfile.Profile()
+        with self._lock:
+            self._profiles.append(profile)
+        profile.enable()  # remplace ce hook pour le thread courant
+
+    def start(self) -> None:
+        threading.setprofile(self._start_thread)
+        self._start_thread(None, 'call', None)
+
+    def stop(self) -> None:
+        threading.setprofile(None)
+        for profile in self._profiles:
+            profile.disable()
+            profile.create_stats()
+        self.stats = pstats.Stats(*self._profiles)
+
+    def write(self, path: Path) -> None:
+        self.stats.dump_stats(path)
+
+    def hot_spots(self) -> Tuple[List[Tuple[str, float]], Dict[str, float]]:
+        """Temps propre par fonction et par classe du projet, en secondes."""
+        index = QualnameIndex()
+        functions: List[Tuple[str, float]] = []
+        owners: Dict[str, float] = Counter()
+        for key, (_, _, self_time, _, callers) in self.stats.stats.items():
+            if is_idle(key, callers):
+                continue
+            functions.append((format_key(key, index.lookup(key)), self_time))
+            self._attribute(key, self_time, owners, index, set())
+        functions.sort(key=lambda item: -item[1])
+        return functions, dict(owners)
+
+    def _attribute(self, key: FunctionKey, seconds: float, owners: Dict[str, float],
+                   index: QualnameIndex, visited: set) -> None:
+        """Rattache ``seconds`` à la fonction du projet la plus proche dans les appelants."""
+        if is_project_file(key[0]):
+            owners[owner_of(key[0], index.lookup(key))] += seconds
+            return
+        callers = self.stats.stats[key][4] if key in self.stats.stats else {}
+        # Répartition au prorata du temps cumulé passé depuis chaque appelant
+        total = sum(stats[3] for stats in callers.values())
+        if key in visited or not callers or total <= 0:
+            owners['(hors projet)'] += seconds
+            return
+        visited = visited | {key}
+        for caller, stats in callers.items():
+            self._attribute(caller, seconds * stats[3] / total, owners, index, visited)
+
+class SamplingProfiler:
+    """Relève la pile de chaque thread actif toutes les ``interval`` secondes."""
+
+    def __init__(self, interval: float = 0.001):
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.owners: Counter = Counter()
+        self.leaves: Counter = Counter()
+        self.samples = 0
+        self.elapsed = 0.0
+        self._running = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._switch_interval = sys.getswitchinterval()
+
+    @staticmethod
+    def _label(code: CodeType) -> str:
+        qualname = getattr(code, 'co_qualname', code.co_name)
+        return f"{qualname} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+    def _sample(self) -> None:
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident == threading.get_ident():
+                continue
+            if (os.path.basename(frame.f_code.co_filename), frame.f_code.co_name) in IDLE_FUNCTIONS:
+                continue
+            self._record(names.get(ident, str(ident)), frame)
+        self.samples += 1
+
+    def _record(self, thread_name: str, frame: Optional[FrameType]) -> None:
+        codes: List[CodeType] = []
+        while frame is not None:
+            codes.append(frame.f_code)
+            frame = frame.f_back
+        self.leaves[self._label(codes[0])] += 1
+        owner = next(
+            (owner_of(code.co_filename, getattr(code, 'co_qualname', code.co_name))
+             for code in codes if is_project_file(code.co_filename)),
+            '(hors projet)'
+        )
+        self.owners[owner] += 1
+        self.stacks[';'.join([thread_name] + [self._label(code) for code in reversed(codes)])] += 1
+
+    def _loop(self) -> None:
+        while self._running.is_set():
+            self._sample()
+            time.sleep(self.interval)
+
+    def start(self) -> None:
+        # Sans cela, le thread du profileur attend le GIL jusqu'à 5 ms à chaque relevé
+        self._switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self._switch_interval, self.interval))
+        self.elapsed = time.perf_counter()
+        self._running.set()
+        self._thread = threading.Thread(target=self._loop, name='profiler', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._running.clear()
+        self._thread.join()
+        self.elapsed = time.perf_counter() - self.elapsed
+        sys.setswitchinterval(self._switch_interval)
+
+    def write(self, path: Path) -> None:
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in sorted(self.stacks.items()):
+                f.write(f"{stack} {count}\n")
+
+    def hot_spots(self) -> Tuple[List[Tuple[str, float]], Dict[str, float]]:
+        """Temps propre estimé par fonction et par classe du projet, en secondes."""
+        # Les relevés sont plus espacés que ``interval`` quand le GIL est occupé
+        period = self.elapsed / self.samples if self.samples else self.interval
+        functions = [(label, count * period) for label, count in self.leaves.most_common()]
+        owners = {owner: count * period for owner, count in self.owners.items()}
+        return functions, owners
+
+def create_profiler(mode: str):
+    if mode == 'cprofile':
+        return CProfileProfiler()
+    if mode == 'sample':
+        return SamplingProfiler()
+    raise ValueError(f"Unknown profiler: {mode}")
+
+def format_report(functions: List[Tuple[str, float]], owners: Dict[str, float], limit: int = 15) -> str:
+    total = sum(owners.values()) or 1.0
+    lines = [f"Top {limit} des fonctions (temps propre) :"]
+    for label, seconds in functions[:limit]:
+        lines.append(f"  {seconds * 1000:10.1f} ms  {seconds / total:6.1%}  {label}")
+    lines.append("Temps par classe (bibliothèques rattachées à l'appelant du projet) :")
+    for owner, seconds in sorted(owners.items(), key=lambda item: -item[1]):
+        lines.append(f"  {seconds * 1000:10.1f} ms  {seconds / total:6.1%}  {owner}")
+    return '\n'.join(lines)
+
+@contextmanager
+def profile_session(mode: str, output: Optional[str] = None, limit: int = 15) -> Iterator[object]:
+    """Profile le bloc, écrit le résultat dans ``output`` et affiche les points chauds."""
+    profiler = create_profiler(mode)
+    output_path = Path(output or DEFAULT_OUTPUTS[mode])
+    profiler.start()
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        profiler.write(output_path)
+        print(format_report(*profiler.hot_spots(), limit=limit))
+        print(f"Profil écrit dans {output_path}")
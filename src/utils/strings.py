@@ -0,0 +1,23 @@
+# Taille des tranches comparées d'un coup avant la comparaison caractère par caractère
+_COMPARE_BLOCK = 4096
+
+def common_prefix_length(a: str, b: str) -> int:
+    limit = min(len(a), len(b))
+    position = 0
+    # Comparaison par blocs (rapide), puis caractère par caractère
+    while position + _COMPARE_BLOCK <= limit and \
+            a[position:position + _COMPARE_BLOCK] == b[position:position + _COMPARE_BLOCK]:
+        position += _COMPARE_BLOCK
+    while position < limit and a[position] == b[position]:
+        position += 1
+    return position
+
+def common_suffix_length(a: str, b: str, limit: int) -> int:
+    """Longueur de la fin commune, bornée par ``limit`` (pour ne pas chevaucher le préfixe commun)."""
+    length = 0
+    while length + _COMPARE_BLOCK <= limit and \
+            a[len(a) - length - _COMPARE_BLOCK:len(a) - length] == b[len(b) - length - _COMPARE_BLOCK:len(b) - length]:
+        length += _COMPARE_BLOCK
+    while length < limit and a[len(a) - length - 1] == b[len(b) - length - 1]:
+        length += 1
+    return length
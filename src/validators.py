@@ -1,5 +1,9 @@
 from .interfaces import IFaviconValidator
 from pathlib import Path
+from typing import Dict, Optional
+import json
+import os
+import threading
 
 class ICOValidator(IFaviconValidator):
     def validate(self, file_path: Path) -> bool:
@@ -19,10 +23,21 @@ class PNGValidator(IFaviconValidator):
             return False
 
 class SVGValidator(IFaviconValidator):
+    """Vérifie l'ouverture ``<svg`` en début de fichier et la fermeture ``</svg>`` à la fin.
+
+    Seules deux fenêtres bornées sont lues, quelle que soit la taille du fichier.
+    """
+    HEAD_SIZE = 64 * 1024
+    TAIL_SIZE = 4 * 1024
+
     def validate(self, file_path: Path) -> bool:
         try:
-            content = file_path.read_text()
-            return '<svg' in content.lower() and '</svg>' in content.lower()
+            with open(file_path, 'rb') as f:
+                head = f.read(self.HEAD_SIZE)
+                f.seek(0, os.SEEK_END)
+                f.seek(max(0, f.tell() - self.TAIL_SIZE))
+                tail = f.read()
+            return b'<svg' in head.lower() and b'</svg>' in tail.lower()
         except Exception:
             return False
 
@@ -36,3 +51,52 @@ class ValidatorFactory:
     @classmethod
     def get_validator(cls, file_extension: str) -> IFaviconValidator:
         return cls._validators.get(file_extension.lower())
+
+class ValidationCache:
+    """Résultats de validation indexés par (chemin, taille, mtime), persistés entre les exécutions.
+
+    Un fichier dont la taille et la date de modification n'ont pas changé
+    n'est plus ouvert : seul un ``stat`` est nécessaire.
+    """
+
+    def __init__(self, cache_path: Optional[Path] = None):
+        self.cache_path = cache_path
+        self._entries: Optional[Dict[str, list]] = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, list]:
+        if self._entries is None:
+            self._entries = {}
+            if self.cache_path and self.cache_path.exists():
+                try:
+                    self._entries = json.loads(self.cache_path.read_text(encoding='utf-8'))
+                except (OSError, ValueError):
+                    self._entries = {}
+        return self._entries
+
+    def lookup(self, file_path: Path, stat: os.stat_result) -> Optional[bool]:
+        with self._lock:
+            entry = self._load().get(str(file_path.resolve()))
+        if entry and entry[0] == stat.st_size and entry[1] == stat.st_mtime_ns:
+            return entry[2]
+        return None
+
+    def store(self, file_path: Path, stat: os.stat_result, valid: bool) -> None:
+        with self._lock:
+            self._load()[str(file_path.resolve())] = [stat.st_size, stat.st_mtime_ns, valid]
+            self._dirty = True
+
+    def save(self) -> None:
+        """Écrit le cache sur disque s'il a changé."""
+        with self._lock:
+            if not self._dirty or not self.cache_path:
+                return
+            try:
+                self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.cache_path.with_name(self.cache_path.name + '.tmp')
+                tmp_path.write_text(json.dumps(self._entries), encoding='utf-8')
+                os.replace(tmp_path, self.cache_path)
+                self._dirty = False
+            except OSError:
+                pass  # le cache n'est qu'une optimisation
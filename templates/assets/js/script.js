@@ -296,3 +296,42 @@ document.addEventListener("DOMContentLoaded", () => {
         updateActiveSection();
     }, 100);
 });
+
+// Pagination des grands tableaux découpés en <tbody data-page> (tables.page_size)
+function paginateTables(roots) {
+    roots.forEach(root => {
+        if (root.nodeType !== Node.ELEMENT_NODE) return;
+        root.querySelectorAll('table.content-table').forEach(table => {
+            const pages = table.querySelectorAll(':scope > tbody[data-page]');
+            if (pages.length < 2 || table.dataset.paginated) return;
+            table.dataset.paginated = 'true';
+
+            const pager = document.createElement('div');
+            pager.className = 'table-pagination';
+            const previous = document.createElement('button');
+            previous.textContent = 'Précédent';
+            const status = document.createElement('span');
+            const next = document.createElement('button');
+            next.textContent = 'Suivant';
+            pager.append(previous, status, next);
+            table.after(pager);
+
+            let current = 0;
+            function showPage(index) {
+                current = Math.max(0, Math.min(index, pages.length - 1));
+                pages.forEach((page, i) => { page.hidden = i !== current; });
+                status.textContent = `Page ${current + 1} / ${pages.length}`;
+                previous.disabled = current === 0;
+                next.disabled = current === pages.length - 1;
+            }
+            previous.addEventListener('click', () => showPage(current - 1));
+            next.addEventListener('click', () => showPage(current + 1));
+            showPage(0);
+        });
+    });
+}
+window.paginateTables = paginateTables;
+
+document.addEventListener("DOMContentLoaded", () => {
+    paginateTables([document.body]);
+});
@@ -0,0 +1,41 @@
+from src.asset_sync import AssetSynchronizer, SyncResult
+
+
+def test_entry_changing_kind_replaced(tmp_path):
+    source, dest = tmp_path / "src", tmp_path / "dest"
+    (source / "icons").mkdir(parents=True)
+    (source / "icons" / "a.svg").write_text("<svg/>", encoding="utf-8")
+    (source / "theme").write_text("v1", encoding="utf-8")
+    sync = AssetSynchronizer()
+    sync.sync(source, dest)
+
+    # Dossier remplacé par un fichier du même nom, et l'inverse
+    (source / "icons" / "a.svg").unlink()
+    (source / "icons").rmdir()
+    (source / "icons").write_text("fichier", encoding="utf-8")
+    (source / "theme").unlink()
+    (source / "theme").mkdir()
+    (source / "theme" / "dark.css").write_text("body {}", encoding="utf-8")
+    sync.sync(source, dest)
+
+    assert (dest / "icons").read_text(encoding="utf-8") == "fichier"
+    assert (dest / "theme" / "dark.css").read_text(encoding="utf-8") == "body {}"
+
+
+def test_asset_added_modified_deleted(tmp_path):
+    source, dest = tmp_path / "src", tmp_path / "dest"
+    (source / "css").mkdir(parents=True)
+    (source / "css" / "style.css").write_text("a {}", encoding="utf-8")
+    sync = AssetSynchronizer()
+    assert sync.sync(source, dest) == SyncResult(copied=1)
+
+    (source / "css" / "extra.css").write_text("b {}", encoding="utf-8")
+    assert sync.sync(source, dest) == SyncResult(copied=1, unchanged=1)
+
+    (source / "css" / "extra.css").write_text("b { color: red }", encoding="utf-8")
+    assert sync.sync(source, dest) == SyncResult(copied=1, unchanged=1)
+    assert (dest / "css" / "extra.css").read_text(encoding="utf-8") == "b { color: red }"
+
+    (source / "css" / "extra.css").unlink()
+    assert sync.sync(source, dest) == SyncResult(unchanged=1, removed=1)
+    assert not (dest / "css" / "extra.css").exists()
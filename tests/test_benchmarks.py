@@ -0,0 +1,13 @@
+from benchmarks.generator import format_size, generate_document, parse_size
+from src.html_converter import HTMLConverter
+
+
+def test_generated_document_uses_project_dialect():
+    document = generate_document(parse_size("20KB"))
+    converter = HTMLConverter(config_path="configs/config.yml")
+    processed, titles = converter.process_titles(document)
+
+    assert len(document.encode("utf-8")) >= 20 * 1024
+    assert document == generate_document(parse_size("20KB"))
+    assert titles and "<li>" in processed and '<td class="row-header">' in processed
+    assert format_size(parse_size("10MB")) == "10MB"
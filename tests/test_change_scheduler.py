@@ -0,0 +1,46 @@
+import asyncio
+from pathlib import Path
+from src.change_scheduler import ChangeScheduler
+
+
+def test_burst_is_coalesced_latest_wins():
+    batches = []
+
+    async def handler(changes):
+        batches.append(dict(changes))
+
+    async def scenario():
+        scheduler = ChangeScheduler(handler, min_delay=0.02)
+        scheduler.start()
+        for kind in ("input", "input", "config"):
+            scheduler.notify(kind, Path("a"))
+        scheduler.notify("template", Path("b"))
+        await asyncio.sleep(0.1)
+        await scheduler.close()
+
+    asyncio.run(scenario())
+    assert batches == [{Path("a"): "config", Path("b"): "template"}]
+
+
+def test_stale_conversion_is_cancelled_and_changes_carried_over():
+    started, finished = [], []
+
+    async def handler(changes):
+        started.append(dict(changes))
+        await asyncio.sleep(0.2)
+        finished.append(dict(changes))
+
+    async def scenario():
+        scheduler = ChangeScheduler(handler, min_delay=0.01)
+        scheduler.start()
+        scheduler.notify("config", Path("a"))
+        await asyncio.sleep(0.05)
+        scheduler.notify("input", Path("b"))
+        await asyncio.sleep(0.4)
+        await scheduler.close()
+        return scheduler.conversion_time
+
+    conversion_time = asyncio.run(scenario())
+    assert started == [{Path("a"): "config"}, {Path("a"): "config", Path("b"): "input"}]
+    assert finished == started[1:]
+    assert conversion_time is not None and conversion_time >= 0.2
@@ -0,0 +1,37 @@
+import pytest
+from src.html_converter import HTMLConverter
+
+DOCUMENT = "".join(f"<h2>Partie {i}</h2>\n<p>Texte {i} <code>a < b</code></p>\n" for i in range(50))
+
+
+@pytest.fixture
+def converter():
+    return HTMLConverter(config_path="configs/config.yml")
+
+
+def test_only_edited_blocks_are_rendered(converter, monkeypatch):
+    converter.process_titles(DOCUMENT, "doc.html")
+    rendered = []
+    render_block = converter._render_block
+    monkeypatch.setattr(converter, "_render_block",
+                        lambda block, titles, ids: rendered.append(block.raw) or render_block(block, titles, ids))
+
+    edited = DOCUMENT.replace("<p>Texte 20 ", "<p>Texte modifié 20 ")
+    result = converter.process_titles(edited, "doc.html")
+    assert rendered == ["<p>Texte modifié 20 <code>a < b</code></p>"]
+    assert result == converter.process_titles(edited)
+
+
+@pytest.mark.parametrize("before, after", [
+    (DOCUMENT, DOCUMENT.replace("<h2>Partie 30</h2>", "<h2>Partie 3</h2>")),   # doublon : IDs suivants décalés
+    (DOCUMENT, "<p>Début</p>\n" + DOCUMENT),                                   # rangs de blocs décalés
+    (DOCUMENT, DOCUMENT.replace("</p>\n<h2>Partie 10", "\n<h2>Partie 10")),    # le paragraphe absorbe la suite
+    ("<ul>ouvert\n" + DOCUMENT,                                                 # un ouvrant resté en texte
+     "<ul>ouvert\n" + DOCUMENT[:200] + "</ul>" + DOCUMENT[200:]),               # devient un bloc
+])
+def test_incremental_matches_full_processing(converter, before, after):
+    for strategy in ("slug", "index"):
+        converter.config["ids"]["strategy"] = strategy
+        converter._apply_config()
+        converter.process_titles(before, "doc.html")
+        assert converter.process_titles(after, "doc.html") == converter.process_titles(after)
@@ -0,0 +1,162 @@
+import asyncio
+import gzip
+import pytest
+from pathlib import Path
+from aiohttp.test_utils import TestClient, TestServer
+from src.html_converter import HTMLConverter
+from src.live_editor import LiveEditor, negotiate_encoding
+from src.live_patch import PageDiffer, iter_boundaries, split_fragments
+
+
+@pytest.fixture
+def converter():
+    return HTMLConverter(config_path="configs/config.yml")
+
+
+def test_negotiate_encoding():
+    assert negotiate_encoding("gzip, deflate, br", ("br", "gzip")) == "br"
+    assert negotiate_encoding("gzip;q=0.5, br;q=0", ("br", "gzip")) == "gzip"
+    assert negotiate_encoding("", ("br", "gzip")) == "identity"
+    assert negotiate_encoding("*", ("gzip",)) == "gzip"
+
+
+def test_serve_output_from_memory(converter, tmp_path):
+    editor = LiveEditor(converter, "input/input.html", str(tmp_path / "out.html"))
+
+    async def scenario():
+        await converter.convert_async(str(editor.input_file), str(editor.output_file))
+        await editor.refresh_page()
+        async with TestClient(TestServer(editor.app)) as client:
+            plain = await client.get("/", headers={"Accept-Encoding": "identity"})
+            body = await plain.read()
+            etag = plain.headers["ETag"]
+
+            compressed = await client.get("/", headers={"Accept-Encoding": "gzip"}, auto_decompress=False)
+            gzipped = await compressed.read()
+
+            cached = await client.get("/", headers={"If-None-Match": etag})
+            return body, gzipped, compressed.headers.get("Content-Encoding"), cached.status
+
+    body, gzipped, encoding, status = asyncio.run(scenario())
+
+    assert b"new WebSocket" in body and b"theme-toggle" in body
+    assert encoding == "gzip" and gzip.decompress(gzipped) == body
+    assert status == 304
+
+
+def apply_operations(fragments, operations):
+    fragments = list(fragments)
+    for op in operations:
+        fragments[op["index"]:op["index"] + op["remove"]] = split_fragments(op["html"])
+    return fragments
+
+
+def test_page_differ_patches_changed_blocks(converter, tmp_path):
+    content = Path("input/input.html").read_text(encoding="utf-8")
+    renamed = content.replace("<h2>Introduction</h2>", "<h2>Présentation</h2>", 1)
+    edits = [content, renamed, renamed.replace("MarkWeave est un", "MarkWeave reste un", 1)]
+    differ = PageDiffer()
+
+    messages = []
+    for index, text in enumerate(edits):
+        source, output = tmp_path / f"in{index}.html", tmp_path / f"out{index}.html"
+        source.write_text(text, encoding="utf-8")
+        converter.convert(str(source), str(output))
+        previous = differ.fragments
+        message = differ.update(output.read_text(encoding="utf-8"))
+        if message["type"] == "patch":
+            assert message["base"] == len(previous) and message["count"] == len(differ.fragments)
+            assert apply_operations(previous, message["ops"]) == differ.fragments
+            assert differ.fragments == split_fragments(differ.content)
+        messages.append(message)
+
+    assert messages[0] == {"type": "reload"}
+    assert len(messages[1]["ops"]) == 1 and "Présentation" in messages[1]["navigation"]
+    assert len(messages[2]["ops"]) == 1 and messages[2]["navigation"] is None
+    assert differ.update(output.read_text(encoding="utf-8")) is None
+
+
+@pytest.mark.parametrize("edits", [
+    ['<p>a</p> x <!--<b>y</b>--><p>z</p>', '<p>a</p> x <!--<b>y</b><p>z</p>', '<p>a</p> x <!--<b>y</b><p>z</p>-->'],
+    ['<p>a</p>texte<script>f()</script><p>b</p>', '<p>a</p>texte<p>b</p>', '<p>a</p>texte<script>f()<p>b</p>'],
+    ['</b><p>a</p><p>b</p>', '</b><i title="x><p>a</p><p>b</p>', '</b><i title="x><p>a</p><p>b</p>">'],
+])
+def test_page_differ_bounds_match_full_split(edits):
+    page = '<ul class="navigation-list"></ul><main class="content">{}</main>'
+    differ = PageDiffer()
+    differ.update(page.format(edits[0]))
+    for content in edits[1:]:
+        message = differ.update(page.format(content))
+        assert differ.bounds == list(iter_boundaries(content))
+        assert message["count"] == len(split_fragments(content))
+
+
+def test_split_fragments_top_level_nodes():
+    markup = '\n<p>a <b>b</b></p><hr><!-- note --><script>if (a<b) {}</script>texte<br/>fin'
+    assert split_fragments(markup) == [
+        '\n', '<p>a <b>b</b></p>', '<hr>', '<!-- note -->', '<script>if (a<b) {}</script>', 'texte', '<br/>', 'fin'
+    ]
+
+
+def test_refresh_page_uses_rendered_html_and_compresses_lazily(converter, tmp_path):
+    editor = LiveEditor(converter, "input/input.html", str(tmp_path / "out.html"))
+
+    async def scenario():
+        html = await converter.convert_async(str(editor.input_file), str(editor.output_file))
+        editor.output_file.unlink()  # la page rendue en mémoire suffit
+        await editor.refresh_page(html)
+        assert editor.page.compressed("gzip") is None
+        async with TestClient(TestServer(editor.app)) as client:
+            response = await client.get("/", headers={"Accept-Encoding": "gzip"}, auto_decompress=False)
+            return html, await response.read()
+
+    html, gzipped = asyncio.run(scenario())
+    assert editor.page.compressed("gzip") == gzipped
+    assert gzip.decompress(gzipped).startswith(html[:100].encode("utf-8"))
+
+
+@pytest.mark.parametrize("path, kind", [
+    ("input/input.html", "input"),
+    ("configs/config.yml", "config"),
+    ("templates/base.html", "template"),
+    ("templates/components/navigation.html", "template"),
+    ("templates/assets/css/style.css", "asset"),
+    ("templates/assets/css/.style.css.swp", None),
+    ("templates/base.html~", None),
+    ("templates/README.txt", None),
+    ("main.py", None),
+])
+def test_classify_change(converter, tmp_path, path, kind):
+    editor = LiveEditor(converter, "input/input.html", str(tmp_path / "out.html"))
+    assert editor.classify_change(Path(path).resolve()) == kind
+
+
+@pytest.mark.parametrize("path, kind, calls, notified", [
+    ("templates/assets/css/style.css", "asset", ["prepare_assets"], ["css"]),
+    ("templates/assets/js/script.js", "asset", ["prepare_assets"], ["reload"]),
+    ("configs/config.yml", "config", ["reload_config", "convert"], ["reload"]),
+    ("templates/components/navigation.html", "template",
+     ["invalidate_template:components/navigation.html", "convert"], ["reload"]),
+    ("input/input.html", "input", ["convert"], ["reload"]),
+])
+def test_apply_changes_reloads_only_what_changed(converter, tmp_path, monkeypatch, path, kind, calls, notified):
+    editor = LiveEditor(converter, "input/input.html", str(tmp_path / "out.html"))
+    recorded, messages = [], []
+
+    def spy(name, method, label=None):
+        monkeypatch.setattr(converter, name, lambda *args: recorded.append(label(*args) if label else name) or method(*args))
+
+    spy("prepare_assets_async", converter.prepare_assets_async, lambda output_dir: "prepare_assets")
+    spy("reload_config", converter.reload_config)
+    spy("invalidate_template", converter.invalidate_template, lambda name: f"invalidate_template:{name}")
+    spy("convert_async", converter.convert_async, lambda *args: "convert")
+
+    async def notify_clients(type="reload", **payload):
+        messages.append(type)
+
+    monkeypatch.setattr(editor, "notify_clients", notify_clients)
+    asyncio.run(editor.apply_changes({Path(path).resolve(): kind}))
+
+    assert recorded == calls
+    assert messages == notified
+    assert (tmp_path / "out.html").is_file() == ("convert" in calls)
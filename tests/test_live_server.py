@@ -0,0 +1,100 @@
+import asyncio
+import json
+import threading
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+from src.html_converter import HTMLConverter
+from src.live_server import LiveServer
+
+
+@pytest.fixture
+def converter():
+    return HTMLConverter(config_path="configs/config.yml")
+
+
+def test_pages_rendered_on_demand_and_updates_scoped(converter, tmp_path):
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "a.html").write_text("<h1>Page A</h1><p>texte</p>", encoding="utf-8")
+    (tmp_path / "sub" / "b.txt").write_text("<h1>Page B</h1>", encoding="utf-8")
+    server = LiveServer(converter, str(tmp_path))
+
+    async def scenario():
+        async with TestClient(TestServer(server.app)) as client:
+            page_a = await client.get("/a.html")
+            page_b = await client.get("/sub/b.html")
+            missing = await client.get("/absent.html")
+            index = await client.get("/", allow_redirects=False)
+
+            ws_a = await client.ws_connect("/ws?page=/a.html")
+            ws_b = await client.ws_connect("/ws?page=/sub/b.html")
+            await asyncio.sleep(0.05)
+            (tmp_path / "a.html").write_text("<h1>Page A</h1><p>modifié</p>", encoding="utf-8")
+            await server.apply_changes({tmp_path / "a.html": "input"})
+
+            message = json.loads((await ws_a.receive(timeout=2)).data)
+            with pytest.raises(asyncio.TimeoutError):
+                await ws_b.receive(timeout=0.2)
+            await ws_a.close()
+            await ws_b.close()
+            return (
+                page_a.status, await page_b.text(), missing.status,
+                index.status, await index.text(), message
+            )
+
+    status_a, body_b, missing, index_status, index_body, message = asyncio.run(scenario())
+
+    assert status_a == 200 and missing == 404
+    assert "Page B" in body_b and 'href="../assets/css/style.css"' in body_b
+    assert index_status == 200 and 'href="/sub/b.html"' in index_body
+    assert message["type"] == "patch" and "modifié" in message["ops"][0]["html"]
+    assert set(server.pages.keys()) == {"a.html", "sub/b.html"}
+
+
+def test_page_with_non_ascii_name_gets_updates(converter, tmp_path):
+    source = tmp_path / "mon résumé.html"
+    source.write_text("<h1>Résumé</h1><p>texte</p>", encoding="utf-8")
+    server = LiveServer(converter, str(tmp_path))
+
+    async def scenario():
+        async with TestClient(TestServer(server.app)) as client:
+            page = await client.get("/mon résumé.html")
+            # Comme le navigateur : location.pathname est déjà encodé
+            ws = await client.ws_connect("/ws", params={"page": "/mon%20r%C3%A9sum%C3%A9.html"})
+            await asyncio.sleep(0.05)
+            source.write_text("<h1>Résumé</h1><p>modifié</p>", encoding="utf-8")
+            await server.apply_changes({source: "input"})
+            message = json.loads((await ws.receive(timeout=2)).data)
+            await ws.close()
+            return page.status, message
+
+    status, message = asyncio.run(scenario())
+    assert status == 200
+    assert message["type"] == "patch" and "modifié" in message["ops"][0]["html"]
+
+
+def test_cancelled_batch_waits_for_config_reload(converter, tmp_path, monkeypatch):
+    server = LiveServer(converter, str(tmp_path))
+    started, release = threading.Event(), threading.Event()
+    reload_config = converter.reload_config
+
+    def slow_reload():
+        started.set()
+        release.wait(5)
+        reload_config()
+
+    monkeypatch.setattr(converter, "reload_config", slow_reload)
+
+    async def scenario():
+        task = asyncio.create_task(server.apply_changes({server.config_file: "config"}))
+        while not started.is_set():
+            await asyncio.sleep(0.01)
+        task.cancel()
+        done, _ = await asyncio.wait([task], timeout=0.2)
+        locked = server.render_lock.locked()
+        release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return bool(done), locked, server.render_lock.locked()
+
+    # Le lot annulé ne rend la main, et le verrou de rendu, qu'une fois la configuration rechargée
+    assert asyncio.run(scenario()) == (False, True, False)
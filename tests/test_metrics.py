@@ -0,0 +1,48 @@
+import asyncio
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+from src.html_converter import HTMLConverter
+from src.live_server import LiveServer
+from src.utils.metrics import NullMetrics
+
+
+@pytest.fixture
+def converter():
+    return HTMLConverter(config_path="configs/config.yml")
+
+
+def test_stages_measured_when_enabled(converter, tmp_path):
+    converter.config['metrics'] = {'enabled': True}
+    converter._apply_config()
+    (tmp_path / "page.html").write_text("<h1>Titre</h1><p><code>a < b</code></p>", encoding="utf-8")
+    (tmp_path / "out").mkdir()
+    converter.convert(str(tmp_path / "page.html"), str(tmp_path / "out" / "page.html"))
+
+    snapshot = converter.metrics.snapshot()
+    for stage in ("read", "titles", "navigation", "render", "write", "convert"):
+        assert snapshot[stage]["count"] == 1
+    assert snapshot["processor.CodeProcessor"]["count"] >= 1  # une mesure par bloc
+    assert snapshot["convert"]["total_ns"] >= snapshot["render"]["total_ns"]
+
+    server = LiveServer(converter, str(tmp_path))
+
+    async def scrape():
+        async with TestClient(TestServer(server.app)) as client:
+            response = await client.get("/metrics")
+            return response.status, response.headers["Content-Type"], await response.text()
+
+    status, content_type, text = asyncio.run(scrape())
+    assert status == 200
+    assert content_type.startswith("text/plain; version=0.0.4")
+    assert 'markweave_conversion_stage_seconds_count{stage="convert"} 1' in text
+
+
+def test_metrics_disabled_by_default(converter, tmp_path):
+    assert isinstance(converter.metrics, NullMetrics)
+    server = LiveServer(converter, str(tmp_path))
+
+    async def scrape():
+        async with TestClient(TestServer(server.app)) as client:
+            return (await client.get("/metrics")).status
+
+    assert asyncio.run(scrape()) == 404
@@ -0,0 +1,57 @@
+import pytest
+from src.html_converter import ConfigurationError, HTMLConverter
+from src.patterns import PatternRegistry
+from src.processors import TableProcessor
+
+
+@pytest.fixture
+def converter():
+    return HTMLConverter(config_path="configs/config.yml")
+
+
+def test_configured_patterns_compiled_once(converter):
+    processor = next(p for p in converter.processors if isinstance(p, TableProcessor))
+    assert processor.row_pattern is converter.patterns["table_row"]
+    assert converter.patterns["table_row"].search("[[a|b]]").group(1) == "a|b"
+
+
+@pytest.mark.parametrize("patterns, message", [
+    ({"table_row": r"\[\[(.*?\]\]"}, "invalide"),
+    ({"code": "<code>.*?</code>"}, "groupe"),
+    ({"lists": "(x*)"}, "chaîne vide"),
+    ({"tables": "<table>"}, "inconnu"),
+])
+def test_invalid_patterns_rejected(converter, patterns, message):
+    converter.config["patterns"] = patterns
+    with pytest.raises(ConfigurationError, match=message):
+        converter._apply_config()
+
+
+def test_custom_table_syntax(converter):
+    converter.config["patterns"] = {"table_row": r"\((.*?)\)", "table_cell": r"\s*;\s*"}
+    converter._apply_config()
+
+    html, _ = converter.process_titles("<table>\n(a ; 1)\n[[b|2]]\n</table>")
+    assert '<tr><td class="row-header">a</td><td>1</td></tr>' in html
+    assert "b" not in html.replace("tbody", "").replace("table", "")
+
+
+def test_literal_shortcuts_match_regex():
+    fast = PatternRegistry()
+    slow = PatternRegistry({"table_row": r"\[\[(.*?)\]\](?:)", "table_cell": "[|]"})
+    assert fast.delimiters("table_row") == ("[[", "]]") and slow.delimiters("table_row") is None
+    content = "<table>\n<thead>[[A|B]]</thead>\nx [[a|1]] y\n[[[b]|2]]]\n[[c\n[[d|3]][[e|4]] [[f\n</table>"
+    assert TableProcessor(patterns=fast).process(content) == TableProcessor(patterns=slow).process(content)
+
+
+def test_custom_title_pattern_needs_regex_engine(converter, caplog):
+    converter.config["patterns"] = {"title": r"(<(h[1-6])>.*?</\2>)"}
+    with caplog.at_level("WARNING"):
+        converter._apply_config()
+    assert "patterns.title ignoré" in caplog.text
+
+    caplog.clear()
+    converter.config["parser"]["engine"] = "regex"
+    with caplog.at_level("WARNING"):
+        converter._apply_config()
+    assert "patterns.title" not in caplog.text
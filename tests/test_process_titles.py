@@ -12,4 +12,27 @@ def test_process_titles_basic(converter):
 
     assert [t.level for t in titles] == [1, 2, 3]
     assert [t.text for t in titles] == ["Title 1", "Title 2", "Title 3"]
+    assert [t.id for t in titles] == ["title-1", "title-2", "title-3"]
+    assert '<h1 id="title-1">Title 1</h1>' in processed
+
+
+def test_heading_ids_stable_across_edits(converter):
+    _, before = converter.process_titles("<h1>Résumé</h1><h2>Détails</h2><h2>Détails</h2><h2>2024</h2>")
+    _, after = converter.process_titles("<p>Nouveau</p><h2>Ajouté</h2><h1>Résumé</h1><h2>Détails</h2><h2>Détails</h2><h2>2024</h2>")
+
+    assert [t.id for t in before] == ["resume", "details", "details-2", "section-2024"]
+    assert [t.id for t in after][1:] == [t.id for t in before]
+
+
+def test_heading_ids_index_strategy(converter):
+    converter.config['ids']['strategy'] = 'index'
+    converter._apply_config()
+    _, titles = converter.process_titles("<h1>Title 1</h1><h2>Title 2</h2><h3>Title 3</h3>")
+
     assert [t.id for t in titles] == ["section1", "section2", "section3"]
+
+
+def test_heading_ids_skip_template_ids(converter):
+    content = "<h2>Panneau arborescence</h2><h2>Panneau arborescence</h2><h3>Toggle panneau</h3>"
+    _, titles = converter.process_titles(content)
+    assert [t.id for t in titles] == ["panneau-arborescence-1", "panneau-arborescence-2", "toggle-panneau-1"]
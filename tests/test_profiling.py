@@ -0,0 +1,39 @@
+import asyncio
+import pstats
+import pytest
+from src.html_converter import HTMLConverter
+from src.utils.profiling import profile_session
+
+
+@pytest.fixture
+def converter():
+    return HTMLConverter(config_path="configs/config.yml")
+
+
+def test_cprofile_covers_worker_threads(converter, tmp_path, capsys):
+    (tmp_path / "page.html").write_text("<h1>Titre</h1>\n<table>[[a|b]]</table>", encoding="utf-8")
+    output = tmp_path / "profile.prof"
+
+    with profile_session("cprofile", str(output)) as profiler:
+        asyncio.run(asyncio.to_thread(converter.convert, str(tmp_path / "page.html"), str(tmp_path / "out.html")))
+
+    functions = {name for _, _, name in pstats.Stats(str(output)).stats}
+    assert "process_titles" in functions
+    _, owners = profiler.hot_spots()
+    assert owners["HTMLConverter"] > 0
+    assert "TableProcessor" in owners
+    assert "Temps par classe" in capsys.readouterr().out
+
+
+def test_sampling_writes_collapsed_stacks(converter, tmp_path):
+    (tmp_path / "page.html").write_text("<h1>Titre</h1><p>texte</p>" * 2000, encoding="utf-8")
+    output = tmp_path / "profile.folded"
+
+    with profile_session("sample", str(output)) as profiler:
+        for _ in range(5):
+            converter.convert(str(tmp_path / "page.html"), str(tmp_path / "out.html"))
+
+    lines = output.read_text(encoding="utf-8").splitlines()
+    assert profiler.samples > 0 and lines
+    stack, count = lines[0].rsplit(" ", 1)
+    assert stack.startswith("MainThread;") and int(count) > 0
@@ -0,0 +1,119 @@
+import asyncio
+import threading
+from concurrent.futures import ProcessPoolExecutor
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+from src import service as service_module
+from src.html_converter import HTMLConverter
+from src.service import ConversionService
+
+
+@pytest.fixture
+def converter(tmp_path):
+    converter = HTMLConverter(config_path="configs/config.yml")
+    converter.config['service'] = {'root': str(tmp_path), 'output_root': str(tmp_path), 'workers': 1, 'queue_size': 1}
+    return converter
+
+
+def run_with_client(service, scenario):
+    async def run():
+        async with TestClient(TestServer(service.app)) as client:
+            return await scenario(client)
+    return asyncio.run(run())
+
+
+def test_convert_content_and_write_output(converter, tmp_path):
+    (tmp_path / "page.html").write_text("<h1>Titre</h1><p>Texte</p>", encoding="utf-8")
+    service = ConversionService(converter)
+
+    async def scenario(client):
+        response = await client.post("/convert", data="<h1>Direct</h1>")
+        html = await response.text()
+        assert response.status == 200
+        assert response.content_type == "text/html"
+        assert '<h1 id="direct">Direct</h1>' in html
+
+        response = await client.post("/convert", json={"input_file": "page.html", "output_file": "out/page.html"})
+        assert response.status == 200
+        assert (await response.json())["output_file"] == str(tmp_path / "out" / "page.html")
+
+    run_with_client(service, scenario)
+    assert '<h1 id="titre">Titre</h1>' in (tmp_path / "out" / "page.html").read_text(encoding="utf-8")
+    assert (tmp_path / "out" / "assets").is_dir()
+
+
+def test_process_mode_converts_in_worker_processes(converter, tmp_path):
+    (tmp_path / "page.html").write_text("<h1>Titre</h1>", encoding="utf-8")
+    service = ConversionService(converter, mode="process")
+
+    async def scenario(client):
+        direct = await client.post("/convert", data="<h1>Direct</h1>")
+        written = await client.post("/convert", json={"input_file": "page.html", "output_file": "out/page.html"})
+        assert isinstance(service.executor, ProcessPoolExecutor)
+        return direct.status, await direct.text(), written.status
+
+    status, html, written = run_with_client(service, scenario)
+    assert (status, written) == (200, 200)
+    assert '<h1 id="direct">Direct</h1>' in html
+    assert '<h1 id="titre">Titre</h1>' in (tmp_path / "out" / "page.html").read_text(encoding="utf-8")
+
+
+def test_paths_confined_to_root(converter):
+    service = ConversionService(converter)
+
+    async def scenario(client):
+        outside = await client.post("/convert", json={"input_file": "../secret.txt"})
+        missing = await client.post("/convert", json={"input_file": "absent.txt"})
+        invalid = await client.post("/convert", json={"content": "a", "input_file": "b"})
+        return outside.status, missing.status, invalid.status
+
+    assert run_with_client(service, scenario) == (403, 404, 400)
+
+
+def test_output_confined_to_output_root():
+    converter = HTMLConverter(config_path="configs/config.yml")
+    converter.config['service']['workers'] = 1
+    service = ConversionService(converter)
+    assert service.output_root == (service.root / "output").resolve()
+    protected = {path: path.read_bytes() for path in (service.root / "main.py", service.root / "configs" / "config.yml")}
+
+    async def scenario(client):
+        statuses = []
+        for output_file in ("../main.py", "../configs/config.yml", str(service.root / "main.py"), "page.py"):
+            response = await client.post("/convert", json={"content": "<p>x</p>", "output_file": output_file})
+            statuses.append(response.status)
+        return statuses
+
+    assert run_with_client(service, scenario) == [403, 403, 403, 400]
+    assert {path: path.read_bytes() for path in protected} == protected
+
+
+def test_full_queue_answers_503(converter, monkeypatch):
+    release = threading.Event()
+    run_job = service_module._run_job
+
+    def blocking_job(job):
+        release.wait(5)
+        return run_job(job)
+
+    monkeypatch.setattr(service_module, "_run_job", blocking_job)
+    service = ConversionService(converter)
+
+    async def scenario(client):
+        running = asyncio.create_task(client.post("/convert", data="<p>1</p>"))
+        while service.active == 0:
+            await asyncio.sleep(0.01)
+        queued = asyncio.create_task(client.post("/convert", data="<p>2</p>"))
+        while service.queue.qsize() == 0:
+            await asyncio.sleep(0.01)
+
+        rejected = await client.post("/convert", data="<p>3</p>")
+        health = await (await client.get("/health")).json()
+        release.set()
+        statuses = [(await running).status, (await queued).status]
+        return rejected.status, rejected.headers.get("Retry-After"), health, statuses
+
+    status, retry_after, health, statuses = run_with_client(service, scenario)
+    assert (status, retry_after) == (503, "1")
+    assert health["active"] == 1 and health["queued"] == 1
+    assert statuses == [200, 200]
@@ -0,0 +1,119 @@
+import asyncio
+import json
+import os
+import shutil
+import pytest
+from src.html_converter import HTMLConverter
+from src.site_builder import BuildError, SiteBuilder
+
+
+@pytest.fixture
+def converter():
+    return HTMLConverter(config_path="configs/config.yml")
+
+
+def test_inputs_with_same_output_rejected(converter, tmp_path):
+    (tmp_path / "in").mkdir()
+    (tmp_path / "in" / "p.html").write_text("<h1>A</h1>", encoding="utf-8")
+    (tmp_path / "in" / "p.txt").write_text("<h1>B</h1>", encoding="utf-8")
+    builder = SiteBuilder(converter, str(tmp_path / "in"), str(tmp_path / "out"))
+
+    with pytest.raises(BuildError, match="p.html et p.txt"):
+        builder.collect_pages()
+
+
+def make_site(tmp_path, pages=3):
+    input_dir = tmp_path / "in"
+    (input_dir / "docs").mkdir(parents=True)
+    for index in range(pages):
+        folder = input_dir / "docs" if index % 2 else input_dir
+        (folder / f"page{index}.html").write_text(f"<h1>Page {index}</h1><p>Texte</p>", encoding="utf-8")
+    return input_dir, tmp_path / "out"
+
+
+def build(converter, input_dir, output_dir, **options):
+    return asyncio.run(SiteBuilder(converter, str(input_dir), str(output_dir), **options).build())
+
+
+def test_full_build_then_noop_rerun(converter, tmp_path):
+    input_dir, output_dir = make_site(tmp_path)
+
+    result = build(converter, input_dir, output_dir)
+    assert (result.converted, result.skipped, result.failed) == (3, 0, [])
+    assert (output_dir / "page0.html").is_file() and (output_dir / "docs" / "page1.html").is_file()
+    assert (output_dir / "assets").is_dir()
+
+    result = build(converter, input_dir, output_dir)
+    assert (result.converted, result.skipped) == (0, 3)
+
+
+def test_parallel_build_with_worker_processes(converter, tmp_path):
+    input_dir, output_dir = make_site(tmp_path, pages=4)
+
+    result = build(converter, input_dir, output_dir, workers=2)
+
+    assert (result.converted, result.failed) == (4, [])
+    for output_path in ("page0.html", "docs/page1.html", "page2.html", "docs/page3.html"):
+        assert "<h1" in (output_dir / output_path).read_text(encoding="utf-8")
+    assert result.workers and sum(stats.pages for stats in result.workers.values()) == 4
+    assert os.getpid() not in result.workers
+
+
+def test_edit_rebuilds_only_that_page(converter, tmp_path):
+    input_dir, output_dir = make_site(tmp_path)
+    build(converter, input_dir, output_dir)
+
+    (input_dir / "page2.html").write_text("<h1>Modifiée</h1>", encoding="utf-8")
+    result = build(converter, input_dir, output_dir)
+
+    assert (result.converted, result.skipped) == (1, 2)
+    assert "Modifiée" in (output_dir / "page2.html").read_text(encoding="utf-8")
+
+
+def test_deleted_input_removes_output_and_manifest_entry(converter, tmp_path):
+    input_dir, output_dir = make_site(tmp_path)
+    build(converter, input_dir, output_dir)
+
+    (input_dir / "docs" / "page1.html").unlink()
+    result = build(converter, input_dir, output_dir)
+
+    assert (result.converted, result.skipped, result.removed) == (0, 2, 1)
+    assert not (output_dir / "docs" / "page1.html").exists()
+    manifest = json.loads((output_dir / ".build-manifest.json").read_text(encoding="utf-8"))
+    assert sorted(manifest["pages"]) == ["page0.html", "page2.html"]
+
+
+def test_config_or_template_change_rebuilds_everything(converter, tmp_path):
+    input_dir, output_dir = make_site(tmp_path)
+    templates = tmp_path / "templates"
+    shutil.copytree(converter.template_path, templates)
+    converter.template_path = templates  # empreinte des templates calculée sur la copie
+    build(converter, input_dir, output_dir)
+
+    converter.config["styling"]["navigation"]["indent_size"] += 1
+    assert build(converter, input_dir, output_dir).converted == 3
+    assert build(converter, input_dir, output_dir).converted == 0
+
+    with open(templates / "base.html", "a", encoding="utf-8") as f:
+        f.write("\n")
+    assert build(converter, input_dir, output_dir).converted == 3
+
+
+@pytest.mark.parametrize("invalidation", ["template", "force"])
+def test_deleted_input_removed_when_everything_rebuilds(converter, tmp_path, invalidation):
+    input_dir, output_dir = make_site(tmp_path)
+    templates = tmp_path / "templates"
+    shutil.copytree(converter.template_path, templates)
+    converter.template_path = templates
+    build(converter, input_dir, output_dir)
+
+    (input_dir / "docs" / "page1.html").unlink()
+    if invalidation == "template":
+        with open(templates / "base.html", "a", encoding="utf-8") as f:
+            f.write("\n")
+    result = build(converter, input_dir, output_dir, force=invalidation == "force")
+
+    assert (result.converted, result.removed) == (2, 1)
+    assert not (output_dir / "docs" / "page1.html").exists()
+    manifest = json.loads((output_dir / ".build-manifest.json").read_text(encoding="utf-8"))
+    assert sorted(manifest["pages"]) == ["page0.html", "page2.html"]
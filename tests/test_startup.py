@@ -0,0 +1,53 @@
+import subprocess
+import sys
+from pathlib import Path
+import main
+from src.service import MODES
+from src.utils.profiling import DEFAULT_OUTPUTS
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Modules réservés aux modes --live, --serve, --build et --profile
+LAZY_MODULES = (
+    "aiohttp", "watchdog", "webbrowser", "pstats", "cProfile",
+    "src.live_editor", "src.live_server", "src.service", "src.site_builder", "src.utils.profiling",
+)
+
+
+def import_times(*args):
+    """Modules importés par ``python -X importtime *args`` -> durée cumulée (µs)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line[len("import time:"):].split("|")
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative)
+    return times
+
+
+def loaded(times, prefix):
+    return [name for name in times if name == prefix or name.startswith(prefix + ".")]
+
+
+def test_cli_import_skips_mode_modules():
+    # La durée de l'import est suivie par benchmarks/run.py (étape startup.import_main)
+    times = import_times("-c", "import main")
+    for module in LAZY_MODULES + ("jinja2", "aiofiles"):
+        assert not loaded(times, module), module
+
+
+def test_one_shot_conversion_skips_mode_modules(tmp_path):
+    output = tmp_path / "out.html"
+    times = import_times("main.py", "input/input.html", str(output))
+    assert output.is_file()
+    for module in LAZY_MODULES:
+        assert not loaded(times, module), module
+
+
+def test_cli_choices_match_modules():
+    assert main.PROFILERS == tuple(sorted(DEFAULT_OUTPUTS))
+    assert main.SERVICE_MODES == MODES
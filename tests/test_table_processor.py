@@ -0,0 +1,45 @@
+from src.processors import TableProcessor
+
+TABLE = "<table>\n<thead>[[Nom|Valeur]]</thead>\n<tbody>\n[[a|1]]\n[[ b | 2 ]]\n[[c|3]]\n</tbody>\n</table>"
+
+
+def test_rows_rendered():
+    html = TableProcessor().process(TABLE)
+
+    assert html == (
+        '<div class="table-responsive">\n<table class="content-table">\n'
+        '<thead><tr><th scope="col">Nom</th><th scope="col">Valeur</th></tr></thead><tbody>\n'
+        '<tr><td class="row-header">a</td><td>1</td></tr>\n'
+        '<tr><td class="row-header">b</td><td>2</td></tr>\n'
+        '<tr><td class="row-header">c</td><td>3</td></tr>\n'
+        '</tbody>\n</table>\n</div>'
+    )
+    # En dessous du seuil, la pagination ne change rien
+    assert TableProcessor(page_size=3).process(TABLE) == html
+
+
+def test_large_table_split_into_pages():
+    html = TableProcessor(page_size=2).process(TABLE)
+
+    assert html.count('<tbody data-page="1">') == 1
+    assert html.count('<tbody data-page="2">') == 1
+    assert html.count('<tr>') == 4
+    assert html.index('<td class="row-header">c</td>') > html.index('<tbody data-page="2">')
+
+
+def test_every_table_tag_stripped():
+    # Tableaux imbriqués ou répétés, ``</table>`` isolé dans une ligne : toutes
+    # les lignes du bloc sont lues, chaque balise est retirée
+    content = "<table>\n[[a|1]]</table>\n<table>[[b|2]]\n[[c|</table>3]]\n</table>\n[[d|4]]"
+    html = TableProcessor().process(content)
+
+    assert html.count('<tr>') == 4
+    assert '<td class="row-header">c</td><td>3</td>' in html
+    assert '<td class="row-header">d</td><td>4</td>' in html
+
+
+def test_every_row_of_a_line_rendered():
+    html = TableProcessor().process("<table>\n[[a|1]] [[b|2]][[c|3]]\n</table>")
+
+    assert html.count('<tr>') == 3
+    assert html.index('>a</td>') < html.index('>b</td>') < html.index('>c</td>')
@@ -0,0 +1,65 @@
+import os
+import shutil
+from jinja2 import Environment
+from src.html_converter import HTMLConverter
+
+
+def make_converter(cache_dir):
+    converter = HTMLConverter(config_path="configs/config.yml")
+    converter.config["templates"]["bytecode_cache"] = {"enabled": True, "directory": str(cache_dir)}
+    return converter
+
+
+def render(converter, tmp_path):
+    return converter.render_content("<h1>Titre</h1><p>Texte</p>", str(tmp_path / "out.html"))
+
+
+def test_bytecode_cache_populated_then_reused(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "jinja"
+    html = render(make_converter(cache_dir), tmp_path)
+    entries = {path.name: path.stat().st_mtime_ns for path in cache_dir.iterdir()}
+    assert entries
+
+    # Nouveau processus simulé : nouvel environnement, aucun template recompilé
+    compiled = []
+    compile_template = Environment.compile
+    monkeypatch.setattr(Environment, "compile",
+                        lambda self, *args, **kwargs: compiled.append(args) or compile_template(self, *args, **kwargs))
+    assert render(make_converter(cache_dir), tmp_path) == html
+    assert compiled == []
+    assert {path.name: path.stat().st_mtime_ns for path in cache_dir.iterdir()} == entries
+
+
+def bump_mtime(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def test_navigation_cache_hit_and_invalidation(tmp_path, monkeypatch):
+    converter = HTMLConverter(config_path="configs/config.yml")
+    templates = tmp_path / "templates"
+    shutil.copytree(converter.template_path, templates)
+    converter.template_path = templates
+    nav_button = templates / "components" / "nav_button.html"
+    converter.config["templates"]["paths"]["nav_button"] = str(nav_button)
+    _, titles = converter.process_titles("<h1>A</h1><h2>B</h2>")
+
+    renders, reads = [], []
+    get_template, read_file = converter.jinja_env.get_template, converter.read_file
+    monkeypatch.setattr(converter.jinja_env, "get_template", lambda name: renders.append(name) or get_template(name))
+    monkeypatch.setattr(converter, "read_file", lambda path: reads.append(path) or read_file(path))
+
+    navigation = converter.generate_navigation_panel(titles)
+    assert converter.generate_navigation_panel(titles) == navigation
+    assert (len(renders), len(reads)) == (1, 1)
+
+    # Template de navigation modifié : nouveau rendu, bouton non relu
+    bump_mtime(templates / "components" / "navigation.html")
+    converter.generate_navigation_panel(titles)
+    assert (len(renders), len(reads)) == (2, 1)
+
+    # Bouton modifié : nouveau rendu et relecture du bouton
+    bump_mtime(nav_button)
+    converter.generate_navigation_panel(titles)
+    converter.generate_navigation_panel(titles)
+    assert (len(renders), len(reads)) == (3, 2)
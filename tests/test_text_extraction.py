@@ -0,0 +1,54 @@
+import random
+import re
+import pytest
+from pathlib import Path
+from src.text_extraction import extract_text
+
+bs4 = pytest.importorskip("bs4")
+
+CORPUS = [
+    "<h1>Title 1</h1>",
+    "<h2>  Espaces   internes\n conservés  </h2>",
+    "<h1>Hello <b>World</b></h1>",
+    "<h1>a<b>b</b>c</h1>",
+    "<h2 class=\"x\">Attributs <a href=\"#y\" title='z'>lien</a></h2>",
+    "<h2><a title=\"x>y\">chevron dans un attribut</a></h2>",
+    "<h3>A &amp; B &lt;C&gt; &nbsp;D&nbsp; &copy E &#x41;&#66;</h3>",
+    "<h3>a <3 b</h3>",
+    "<h3>a < b > c</h3>",
+    "<h4>a<!-- commentaire -->b</h4>",
+    "<h4>a<script>var x = '<b>';</script>b</h4>",
+    "<h4>a<style>b { color: red }</style>c</h4>",
+    "<h5>a<![CDATA[donnée]]>b</h5>",
+    "<h5>a<?pi?>b<!DOCTYPE html>c</h5>",
+    "<h5>x</h2>y</h5>",
+    "<h6>a</ b>c</h6>",
+    "<h6>a<br/>b<br>c<img src=\"i.png\">d</h6>",
+    "<h6><code>x = 1</code> et <em>plus</em></h6>",
+    "<h1></h1>",
+    "<h1>   </h1>",
+]
+
+PIECES = ['<b>', '</b>', '<i class="c">', '</i>', 'texte', ' ', '\n', '&amp;', '&lt;', '&nbsp;',
+          '&eacute;', '&#233;', '<', '>', '<!-- c -->', '<br/>', '<a href="x>y">', '</a>', 'é', '"', "'"]
+
+
+def _reference(markup):
+    return bs4.BeautifulSoup(markup, 'html.parser').get_text(" ", strip=True)
+
+
+def _document_headings():
+    content = Path("input/input.html").read_text(encoding="utf-8")
+    return re.findall(r'<h[1-6][^>]*>.*?</h[1-6]>', content, re.DOTALL)
+
+
+@pytest.mark.parametrize("markup", CORPUS + _document_headings())
+def test_extract_text_matches_beautifulsoup(markup):
+    assert extract_text(markup) == _reference(markup)
+
+
+def test_extract_text_matches_beautifulsoup_on_random_fragments():
+    rng = random.Random(42)
+    for _ in range(2000):
+        markup = "<h2>" + "".join(rng.choice(PIECES) for _ in range(rng.randint(0, 12))) + "</h2>"
+        assert extract_text(markup) == _reference(markup), markup
@@ -0,0 +1,77 @@
+import pytest
+from pathlib import Path
+from src.html_converter import HTMLConverter
+from src.readers import MmapInputReader
+from src.tokenizer import BlockNode, BlockTokenizer, TextNode
+
+CASES = [
+    "<h1>Title 1</h1><h2>Title 2</h2><h3>Title 3</h3>",
+    "<p>Texte avec <code>a < b</code></p>\n<ul>{un, deux}</ul>",
+    "<pre><code>x = 1</code></pre><p>suite</p>",
+    "<p>non fermé <h2 class=\"x\">Titre</h2>",
+    "<table>\n<thead>[[A|B]]</thead>\n<tbody>\n[[a|b]]\n</tbody>\n</table>",
+    "<h1foo>x</h1foo><hr><h7>x</h7><codex>y</code>",
+    "<p",
+    "",
+]
+
+@pytest.fixture
+def converter():
+    return HTMLConverter(config_path="configs/config.yml")
+
+
+@pytest.mark.parametrize("content", CASES + [Path("input/input.html").read_text(encoding="utf-8")])
+def test_tokenizer_matches_regex_engine(converter, content):
+    converter.parser_engine = 'tokenizer'
+    expected = converter._process_titles_regex(content)
+    assert converter.process_titles(content) == expected
+
+
+def test_tokenizer_nodes_cover_input():
+    content = "avant <p>un</p> milieu <h2>deux</h2> après"
+    nodes = BlockTokenizer(['p', 'h2']).tokenize(content)
+
+    assert "".join(node.raw for node in nodes) == content
+    assert [type(node) for node in nodes] == [TextNode, BlockNode, TextNode, BlockNode, TextNode]
+    assert [(node.kind, node.index) for node in nodes if isinstance(node, BlockNode)] == [
+        ('paragraph', 0), ('heading', 1)
+    ]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64])
+def test_streamed_content_matches_process_titles(converter, chunk_size):
+    content = Path("input/input.html").read_text(encoding="utf-8")
+    chunks = [content[i:i + chunk_size] for i in range(0, len(content), chunk_size)]
+
+    titles = []
+    streamed = "".join(converter.iter_processed_content(chunks, titles))
+
+    assert (streamed, titles) == converter.process_titles(content)
+
+
+def test_mmap_reader_matches_process_titles(converter):
+    path = Path("input/input.html")
+    reader = MmapInputReader(converter.tokenizer)
+
+    titles = []
+    fragments = converter._render_nodes(reader.iter_nodes(path), titles)
+    streamed = "".join(f if isinstance(f, str) else bytes(f).decode("utf-8") for f in fragments)
+
+    assert (streamed, titles) == converter.process_titles(path.read_text(encoding="utf-8"))
+
+
+def test_unclosed_block_does_not_buffer_whole_stream(converter):
+    chunk = "texte sans fermeture " * 3000  # ~63 Ko
+    total = 200                             # ~12 Mo, au-delà de streaming.max_block_size
+    consumed = 0
+
+    def chunks():
+        nonlocal consumed
+        yield "<h6>Titre jamais fermé"
+        for _ in range(total):
+            consumed += 1
+            yield chunk
+
+    first = next(iter(converter.iter_processed_content(chunks(), [])))
+    assert first.startswith("<h6>")
+    assert consumed < total / 2
@@ -0,0 +1,41 @@
+import os
+import shutil
+from src.html_converter import HTMLConverter
+from src.validators import ValidatorFactory
+
+
+def make_converter(tmp_path):
+    converter = HTMLConverter(config_path="configs/config.yml")
+    converter.config["templates"]["paths"]["assets"]["images"] = str(tmp_path / "images")
+    converter.config["favicons"]["validation_cache"] = str(tmp_path / "validation.json")
+    converter._apply_config()
+    return converter
+
+
+def test_validation_cache_skips_unchanged_files(tmp_path, monkeypatch):
+    converter = HTMLConverter(config_path="configs/config.yml")
+    shutil.copytree(converter.config["templates"]["paths"]["assets"]["images"], tmp_path / "images")
+
+    validated = []
+    for validator in ValidatorFactory._validators.values():
+        monkeypatch.setattr(validator, "validate",
+                            lambda path, validate=validator.validate: validated.append(path.name) or validate(path))
+    is_valid_webmanifest = HTMLConverter._is_valid_webmanifest
+    monkeypatch.setattr(HTMLConverter, "_is_valid_webmanifest",
+                        lambda self, path: validated.append(path.name) or is_valid_webmanifest(self, path))
+    assert make_converter(tmp_path).verify_favicon_resources() == {"missing": [], "invalid": []}
+    assert sorted(validated) == [
+        "apple-touch-icon.png", "favicon-96x96.png", "favicon.ico", "favicon.svg", "site.webmanifest"
+    ]
+
+    # Nouvelle exécution : (taille, mtime_ns) inchangés, aucun fichier relu
+    validated.clear()
+    assert make_converter(tmp_path).verify_favicon_resources() == {"missing": [], "invalid": []}
+    assert validated == []
+
+    # Fichier touché : seul celui-ci est revalidé
+    svg = tmp_path / "images" / "favicon.svg"
+    stat = svg.stat()
+    os.utime(svg, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert make_converter(tmp_path).verify_favicon_resources() == {"missing": [], "invalid": []}
+    assert validated == ["favicon.svg"]